@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+Typio benchmark runner.
+
+Usage:
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --sizes 1024 1048576 104857600 --output results.json
+    python benchmarks/run.py --compare base.json results.json
+"""
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import threading
+import tracemalloc
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from typio import type_print, type_print_many, TypeMode, VirtualClock, TYPIO_VERSION  # noqa: E402
+
+SAMPLE = "Typio makes your terminal type like a human. It pauses, thinks, and continues!\n"
+DEFAULT_SIZES = [1024, 102400, 1048576]
+DEFAULT_DELAYS = [0.0005, 0.002, 0.01]
+DEFAULT_UNITS = 20000
+ACCURACY_UNITS = 200
+BATCH_JOBS = 200
+
+
+def custom_mode(ctx: Any, text: str) -> None:
+    """
+    Emit text character by character with a pause after every word.
+
+    :param ctx: typing context
+    :param text: text to emit
+    """
+    for c in text:
+        ctx.emit(c)
+        if c == " ":
+            ctx.sleep()
+
+
+MODES = {mode.name.lower(): mode for mode in TypeMode}
+MODES["custom"] = custom_mode
+
+
+def make_text(size: int) -> str:
+    """
+    Build a benchmark text of a given size.
+
+    :param size: text size in characters
+    """
+    return (SAMPLE * (size // len(SAMPLE) + 1))[:size]
+
+
+def count_units(text: str, mode: Any) -> int:
+    """
+    Count the units emitted for a text.
+
+    :param text: text
+    :param mode: typing mode
+    """
+    clock = VirtualClock()
+    type_print(text, file=io.StringIO(), delay=1e-6, mode=mode, end="", clock=clock, animate=True)
+    return len(clock.timeline)
+
+
+def bench_overhead(units: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure the per-unit CPU overhead of every mode.
+
+    :param units: approximate number of characters per run
+    """
+    result = {}
+    text = make_text(units)
+    for name, mode in MODES.items():
+        emitted = count_units(text, mode)
+        start = time.perf_counter()
+        type_print(text, file=io.StringIO(), delay=0, mode=mode, end="", animate=True)
+        bulk = time.perf_counter() - start
+        start = time.perf_counter()
+        type_print(text, file=io.StringIO(), delay=1e-6, mode=mode, end="", clock=VirtualClock(), animate=True)
+        paced = time.perf_counter() - start
+        result[name] = {
+            "units": emitted,
+            "bulk_ns_per_unit": bulk * 1e9 / max(emitted, 1),
+            "paced_ns_per_unit": paced * 1e9 / max(emitted, 1),
+        }
+    return result
+
+
+def bench_accuracy(delays: List[float]) -> Dict[str, Dict[str, float]]:
+    """
+    Measure the deviation of the actual from the nominal duration.
+
+    :param delays: delays (in seconds) to measure
+    """
+    result = {}
+    for name, mode in MODES.items():
+        for delay in delays:
+            text = make_text(ACCURACY_UNITS)
+            clock = VirtualClock()
+            type_print(text, file=io.StringIO(), delay=delay, mode=mode, end="", clock=clock, animate=True)
+            nominal = clock.time
+            start = time.perf_counter()
+            type_print(text, file=io.StringIO(), delay=delay, mode=mode, end="", animate=True)
+            actual = time.perf_counter() - start
+            result["{0}@{1}".format(name, delay)] = {
+                "nominal_s": nominal,
+                "actual_s": actual,
+                "deviation_pct": (actual - nominal) * 100 / nominal if nominal else 0,
+            }
+    return result
+
+
+def bench_memory(sizes: List[int]) -> Dict[str, Dict[str, float]]:
+    """
+    Measure the peak memory of every mode on inputs of several sizes.
+
+    :param sizes: input sizes in characters
+    """
+    result = {}
+    for size in sizes:
+        text = make_text(size)
+        for name, mode in MODES.items():
+            clock = VirtualClock()
+            tracemalloc.start()
+            type_print(
+                text, file=_NullWriter(), delay=1e-6, mode=mode, end="", clock=clock.__call__, sleeper=clock.sleep,
+                animate=True)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result["{0}@{1}".format(name, size)] = {
+                "input_bytes": size,
+                "peak_bytes": peak,
+                "peak_ratio": peak / size,
+            }
+    return result
+
+
+def bench_sinks(units: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure the per-unit overhead of writing to different sinks.
+
+    :param units: number of characters per run
+    """
+    result = {}
+    text = make_text(units)
+    for name, factory in SINKS.items():
+        sink, close = factory()
+        try:
+            start = time.perf_counter()
+            type_print(text, file=sink, delay=1e-6, end="", clock=VirtualClock(), animate=True)
+            elapsed = time.perf_counter() - start
+        finally:
+            close()
+        result[name] = {"ns_per_unit": elapsed * 1e9 / units}
+    return result
+
+
+def bench_batch(units: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure the offline rendering throughput of type_print_many with one worker and with one worker per CPU.
+
+    :param units: total number of characters over all jobs
+    """
+    result = {}
+    jobs = [(make_text(max(units // BATCH_JOBS, 1)), TypeMode.CHAR, 0.01, 0.005)] * BATCH_JOBS
+    for workers in sorted({1, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        for _ in type_print_many(jobs, workers=workers, chunksize=max(BATCH_JOBS // (4 * workers), 1)):
+            pass
+        elapsed = time.perf_counter() - start
+        result["workers@{0}".format(workers)] = {"jobs_per_s": BATCH_JOBS / elapsed}
+    return result
+
+
+class _NullWriter:
+    """Writer that discards everything."""
+
+    def write(self, text: str) -> None:
+        """
+        Discard text.
+
+        :param text: text
+        """
+        pass
+
+    def flush(self) -> None:
+        """Do nothing."""
+        pass
+
+
+def _stringio_sink() -> tuple:
+    """Create a StringIO sink."""
+    return io.StringIO(), lambda: None
+
+
+def _pipe_sink() -> tuple:
+    """Create a pipe sink drained by a reader thread."""
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, "rb")
+    writer = os.fdopen(write_fd, "w")
+    thread = threading.Thread(target=lambda: [None for _ in iter(lambda: reader.read(65536), b"")])
+    thread.start()
+
+    def close() -> None:
+        writer.close()
+        thread.join()
+        reader.close()
+    return writer, close
+
+
+def _file_sink() -> tuple:
+    """Create a temporary file sink."""
+    handle = tempfile.TemporaryFile("w")
+    return handle, handle.close
+
+
+SINKS = {"stringio": _stringio_sink, "pipe": _pipe_sink, "file": _file_sink}
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run all benchmarks.
+
+    :param args: parsed arguments
+    """
+    return {
+        "meta": {
+            "typio": TYPIO_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "overhead": bench_overhead(args.units),
+        "accuracy": bench_accuracy(args.delays),
+        "memory": bench_memory(args.sizes),
+        "sinks": bench_sinks(args.units),
+        "batch": bench_batch(args.units),
+    }
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    """
+    Compare two benchmark runs metric by metric.
+
+    :param base: baseline results
+    :param new: new results
+    """
+    lines = []
+    for group in ("overhead", "accuracy", "memory", "sinks", "batch"):
+        for case, metrics in sorted(new.get(group, {}).items()):
+            for metric, value in sorted(metrics.items()):
+                old = base.get(group, {}).get(case, {}).get(metric)
+                if old is None:
+                    continue
+                change = (value - old) * 100 / old if old else 0
+                lines.append("{0:<9} {1:<24} {2:<18} {3:>14.4f} {4:>14.4f} {5:>+9.1f}%".format(
+                    group, case, metric, old, value, change))
+    return lines
+
+
+def main() -> None:
+    """CLI main function."""
+    parser = argparse.ArgumentParser(description="Typio benchmarks")
+    parser.add_argument("--output", type=str, help="JSON file to write the results to")
+    parser.add_argument("--units", type=int, default=DEFAULT_UNITS, help="characters per overhead run")
+    parser.add_argument("--delays", type=float, nargs="+", default=DEFAULT_DELAYS, help="delays of accuracy runs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="input sizes of memory runs")
+    parser.add_argument("--compare", type=str, nargs=2, metavar=("BASE", "NEW"), help="compare two result files")
+    args = parser.parse_args()
+    if args.compare:
+        with open(args.compare[0]) as base_file, open(args.compare[1]) as new_file:
+            lines = compare(json.load(base_file), json.load(new_file))
+        print("\n".join(lines))
+        return
+    results = run(args)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,11 @@ setup(
         'Source': 'https://github.com/sepandhaghighi/typio'
     },
     install_requires=get_requires(),
+    entry_points={
+        'console_scripts': [
+            'typio = typio.__main__:main',
+        ]
+    },
     python_requires='>=3.8',
     classifiers=[
         'Development Status :: 3 - Alpha',
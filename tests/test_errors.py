@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
+import io
+import asyncio
 import pytest
 
-from typio import type_print, typestyle
-from typio import TypioError
+from typio import type_print, typestyle, async_type_print, type_print_stream, type_print_file, type_print_cast
+from typio import TypeMode, TypioError, TypioEngine, TypioRenderer, TypioCast, compile_plan
+from typio import TypioControl, set_speed, set_numpy, register_mode, TypioServer, TypioSink, type_print_many
+from typio import TypioLogHandler
 
 
 def test_invalid_text_type():
@@ -37,7 +41,7 @@ def test_invalid_jitter_type():
 
 def test_invalid_mode():
     with pytest.raises(TypioError, match=r"`mode` must be a TypeMode enum value or a callable custom mode."):
-        type_print("test", mode="char")
+        type_print("test", mode="CHAR")
 
 
 def test_invalid_end():
@@ -52,7 +56,7 @@ def test_invalid_file():
 
 def test_typestyle_invalid_mode():
     with pytest.raises(TypioError, match=r"`mode` must be a TypeMode enum value or a callable custom mode."):
-        typestyle(mode="char")
+        typestyle(mode="CHAR")
 
 
 def test_typestyle_invalid_delay():
@@ -77,3 +81,226 @@ def test_typiocontext_sleep_invalid_jitter():
         ctx.sleep(jitter=-0.5)
     with pytest.raises(TypioError, match=r"`jitter` must be a non-negative number."):
         type_print("x", mode=custom)
+
+
+def test_invalid_max_fps():
+    with pytest.raises(TypioError, match=r"`max_fps` must be a positive number or None."):
+        type_print("test", max_fps=0)
+
+
+def test_typestyle_invalid_max_fps():
+    with pytest.raises(TypioError, match=r"`max_fps` must be a positive number or None."):
+        typestyle(max_fps="fast")
+
+
+def test_async_typiocontext_sleep_invalid_delay():
+    async def custom(ctx, text):
+        await ctx.sleep(delay=-1)
+    with pytest.raises(TypioError, match=r"`delay` must be a non-negative number."):
+        asyncio.run(async_type_print("x", mode=custom))
+
+
+def test_invalid_engine():
+    with pytest.raises(TypioError, match=r"`engine` must be a TypioEngine or None."):
+        type_print("test", engine=1)
+
+
+def test_closed_engine():
+    engine = TypioEngine()
+    engine.close()
+    with pytest.raises(TypioError, match=r"engine is closed."):
+        type_print("test", engine=engine)
+
+
+def test_engine_custom_mode_error():
+    def custom(ctx, text):
+        ctx.sleep(delay=-1)
+    with TypioEngine() as engine:
+        handle = type_print("x", mode=custom, engine=engine)
+        with pytest.raises(TypioError, match=r"`delay` must be a non-negative number."):
+            handle.join()
+
+
+def test_compile_plan_invalid_mode():
+    with pytest.raises(TypioError, match=r"`mode` must be a TypeMode enum value."):
+        compile_plan("test", mode=print)
+
+
+def test_stream_invalid_chunks():
+    with pytest.raises(TypioError, match=r"`chunks` must be an iterable of str or bytes."):
+        type_print_stream(123)
+
+
+def test_stream_invalid_chunk():
+    with pytest.raises(TypioError, match=r"`text` must be str or bytes."):
+        type_print_stream(["a", 1], delay=0)
+
+
+def test_stream_invalid_bytes():
+    with pytest.raises(TypioError, match=r"bytes text must be UTF-8 decodable."):
+        type_print_stream([b"\xc3"], delay=0)
+
+
+def test_invalid_speed():
+    with pytest.raises(TypioError, match=r"`speed` must be a non-negative number."):
+        set_speed(-1)
+
+
+def test_invalid_control_speed():
+    with pytest.raises(TypioError, match=r"`speed` must be a non-negative number."):
+        TypioControl(speed="fast")
+
+
+def test_invalid_fast_forward():
+    with pytest.raises(TypioError, match=r"`speed` must be a non-negative number."):
+        TypioControl().fast_forward(-2)
+
+
+def test_invalid_control():
+    with pytest.raises(TypioError, match=r"`control` must be a TypioControl or None."):
+        type_print("test", control=1)
+
+
+def test_invalid_clock():
+    with pytest.raises(TypioError, match=r"`clock` must be callable."):
+        type_print("test", clock=1)
+
+
+def test_invalid_sleeper():
+    with pytest.raises(TypioError, match=r"`sleeper` must be callable."):
+        typestyle(sleeper="sleep")
+
+
+def test_invalid_async_sleeper():
+    with pytest.raises(TypioError, match=r"`sleeper` of asynchronous functions must be a coroutine function."):
+        asyncio.run(async_type_print("test", sleeper=[].append))
+    with pytest.raises(TypioError, match=r"`sleeper` of asynchronous functions must be a coroutine function."):
+        TypioServer(sleeper=[].append)
+
+    async def demo():
+        pass
+    with pytest.raises(TypioError, match=r"`sleeper` of asynchronous functions must be a coroutine function."):
+        typestyle(sleeper=[].append)(demo)
+
+
+def test_invalid_seed():
+    with pytest.raises(TypioError, match=r"`seed` must be None, int, float, str, bytes or bytearray."):
+        type_print("test", seed=[1])
+
+
+def test_invalid_rng():
+    with pytest.raises(TypioError, match=r"`rng` must be a random.Random instance."):
+        type_print("test", rng=1)
+
+
+def test_invalid_stats():
+    with pytest.raises(TypioError, match=r"`stats` must be a TypioStats or None."):
+        type_print("test", stats={})
+
+
+def test_invalid_file_source():
+    with pytest.raises(TypioError, match=r"`source` must be a file path or a readable file object."):
+        type_print_file(123, delay=0)
+
+
+def test_invalid_animate():
+    with pytest.raises(TypioError, match=r"`animate` must be True, False or \"auto\"."):
+        type_print("hello", delay=0, animate="yes")
+    with pytest.raises(TypioError, match=r"`animate` must be True, False or \"auto\"."):
+        type_print("hello", delay=0, animate=1)
+
+
+def test_invalid_renderer():
+    with pytest.raises(TypioError, match=r"`max_fps` must be a positive number or None."):
+        TypioRenderer(max_fps=0)
+    with pytest.raises(TypioError, match=r"`width` must be a positive integer or None."):
+        TypioRenderer(width=-1)
+    with pytest.raises(TypioError, match=r"`height` must be a positive integer."):
+        TypioRenderer().region(height=0)
+
+
+def test_invalid_distribution():
+    with pytest.raises(TypioError, match=r"`distribution` must be a JitterDistribution enum value."):
+        type_print("hello", delay=0, distribution="gaussian")
+
+
+def test_unknown_mode_name():
+    with pytest.raises(TypioError, match=r"`mode` must be a TypeMode enum value or a callable custom mode."):
+        type_print("test", mode="no-such-mode")
+
+
+def test_broken_mode_entry_point(tmp_path, monkeypatch):
+    dist = tmp_path / "typio_broken_plugin-1.0.dist-info"
+    dist.mkdir()
+    (dist / "METADATA").write_text("Metadata-Version: 2.1\nName: typio-broken-plugin\nVersion: 1.0\n")
+    (dist / "entry_points.txt").write_text("[typio.modes]\nbroken-plugin = typio_broken_plugin:mode\n")
+    (tmp_path / "typio_broken_plugin.py").write_text("import typio_missing_dependency\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    with pytest.raises(TypioError, match=r"`mode` must be a TypeMode enum value or a callable custom mode."):
+        type_print("test", mode="broken-plugin")
+
+
+def test_invalid_numpy(monkeypatch):
+    with pytest.raises(TypioError, match=r"`enabled` must be a bool."):
+        set_numpy(1)
+    monkeypatch.setattr("typio.functions._NUMPY", False)
+    with pytest.raises(TypioError, match=r"NumPy must be installed to vectorize jitter sampling."):
+        set_numpy(True)
+
+
+def test_invalid_register_mode():
+    with pytest.raises(TypioError, match=r"`name` must be a non-empty str."):
+        register_mode("", print)
+    with pytest.raises(TypioError, match=r"`mode` must be a TypeMode enum value or a callable custom mode."):
+        register_mode("broken", 1)
+
+
+def test_invalid_buffer_limit():
+    with pytest.raises(TypioError, match=r"`buffer_limit` must be a positive integer."):
+        TypioServer(buffer_limit=0)
+
+
+def test_invalid_sink():
+    with pytest.raises(TypioError, match=r"`policy` must be a BackpressurePolicy enum value."):
+        TypioSink(1, policy="drop")
+    with pytest.raises(TypioError, match=r"`buffer_limit` must be a positive integer."):
+        TypioSink(1, buffer_limit=0)
+    with pytest.raises(TypioError, match=r"`file` must be a file-like object."):
+        TypioSink("out.txt")
+
+
+def test_invalid_cast():
+    with pytest.raises(TypioError, match=r"`source` must be an asciicast v2 recording."):
+        type_print_cast(io.StringIO('{"version": 1}\n'))
+    with pytest.raises(TypioError, match=r"`source` must be an asciicast v2 recording."):
+        type_print_cast(io.StringIO('{"version": 2}\n[0, "o"]\n'), animate=True)
+    with pytest.raises(TypioError, match=r"`source` must be a file path or a readable file object."):
+        type_print_cast(123)
+    with pytest.raises(TypioError, match=r"`width` must be a positive integer or None."):
+        TypioCast(io.StringIO(), width=0)
+    with pytest.raises(TypioError, match=r"`height` must be a positive integer."):
+        TypioCast(io.StringIO(), height="24")
+
+
+def test_invalid_many():
+    with pytest.raises(TypioError, match=r"`workers` must be a positive integer or None."):
+        type_print_many(["x"], workers=0)
+    with pytest.raises(TypioError, match=r"`chunksize` must be a positive integer."):
+        type_print_many(["x"], chunksize=0)
+    with pytest.raises(TypioError, match=r"`jobs` must be an iterable of TypioJob, tuples or str."):
+        type_print_many("x")
+    with pytest.raises(TypioError, match=r"`jobs` must be an iterable of TypioJob, tuples or str."):
+        list(type_print_many([1], workers=1))
+    with pytest.raises(TypioError, match=r"job `destination` must be a file path or None."):
+        list(type_print_many([("x", TypeMode.CHAR, 0, 0, 1)], workers=1))
+    with pytest.raises(TypioError, match=r"custom modes of `jobs` must be picklable, e.g. module-level functions."):
+        list(type_print_many([("x", lambda ctx, text: None)], workers=1))
+
+
+def test_invalid_log_handler():
+    with pytest.raises(TypioError, match=r"`queue_size` must be a positive integer."):
+        TypioLogHandler(queue_size=0)
+    with pytest.raises(TypioError, match=r"`overflow` must be an OverflowPolicy enum value."):
+        TypioLogHandler(overflow="drop")
+    with pytest.raises(TypioError, match=r"`delay` must be a non-negative number."):
+        TypioLogHandler(delay=-1)
@@ -1,9 +1,29 @@
 # -*- coding: utf-8 -*-
 import io
+import os
 import sys
+import time
+import asyncio
+import threading
+import random
+import re
+import select
+import subprocess
+import socket
+import struct
+import json
+import logging
+import multiprocessing
+import warnings
+import pytest
 
-from typio import type_print, typestyle
-from typio import TypeMode
+from typio import type_print, typestyle, async_type_print
+from typio import type_print_stream, async_type_print_stream, type_print_file, type_print_cast, TypioCast
+from typio import type_print_many, TypioJob, TypioLogHandler, OverflowPolicy
+from typio import TypeMode, JitterDistribution, BackpressurePolicy, TypioEngine, TypioRenderer, TypioServer
+from typio import compile_plan, plan_cache_info, plan_cache_clear, register_mode
+from typio import TypioControl, set_speed, get_speed, VirtualClock, TypioStats, TypioSink, set_numpy, get_numpy
+from typio.__main__ import main
 
 
 def test_basic_print():
@@ -40,14 +60,14 @@ def test_line_mode():
 def test_sentence_mode():
     buffer = io.StringIO()
     text = "Hello! How are you?"
-    type_print(text, file=buffer, delay=1, jitter=0, mode=TypeMode.SENTENCE)
+    type_print(text, file=buffer, delay=1, jitter=0, mode=TypeMode.SENTENCE, clock=VirtualClock(), animate=True)
     assert buffer.getvalue() == text + "\n"
 
 
 def test_typewriter_mode():
     buffer = io.StringIO()
     text = "Hello\nWorld\n"
-    type_print(text, file=buffer, delay=1, jitter=0.05, mode=TypeMode.TYPEWRITER)
+    type_print(text, file=buffer, delay=1, jitter=0.05, mode=TypeMode.TYPEWRITER, clock=VirtualClock(), animate=True)
     assert buffer.getvalue() == text + "\n"
 
 
@@ -151,3 +171,1441 @@ def test_typiocontext_with_typestyle(capsys):
     demo()
     captured = capsys.readouterr()
     assert captured.out == "HELLO\nWORLD\n"
+
+
+def test_deadline_pacing():
+    class LateClock(VirtualClock):
+        def sleep(self, seconds):
+            super().sleep(seconds + 0.0005)
+    buffer = io.StringIO()
+    clock = LateClock()
+    stats = TypioStats()
+    type_print("x" * 50, file=buffer, delay=0.002, end="", clock=clock, stats=stats, animate=True)
+    assert buffer.getvalue() == "x" * 50
+    assert clock.time == pytest.approx(0.1005)
+    assert stats.max_lag == pytest.approx(0.0005)
+    buffer = io.StringIO()
+    stats = TypioStats()
+    start = time.monotonic()
+    type_print("x" * 50, file=buffer, delay=0.002, end="", stats=stats, animate=True)
+    assert time.monotonic() - start < 1
+    assert buffer.getvalue() == "x" * 50
+    assert stats.sleep_requested == pytest.approx(0.1)
+    assert stats.sleep_actual <= stats.sleep_requested + stats.lag + 0.005
+
+
+def test_typiocontext_timing_error():
+    buffer = io.StringIO()
+    errors = []
+
+    def custom(ctx, text):
+        for c in text:
+            ctx.emit(c)
+            ctx.sleep()
+        errors.append(ctx.timing_error)
+    type_print("hello", file=buffer, delay=0.001, mode=custom, animate=True)
+    assert buffer.getvalue() == "hello\n"
+    assert 0 <= errors[0] < 0.05
+
+
+class CountingStringIO(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+def test_zero_delay_bulk_write():
+    buffer = CountingStringIO()
+    type_print("hello world", file=buffer, delay=0, mode=TypeMode.SENTENCE)
+    assert buffer.getvalue() == "hello world\n"
+    assert buffer.writes == 1
+
+
+def test_max_fps_coalescing():
+    buffer = CountingStringIO()
+    type_print("x" * 100, file=buffer, delay=0.001, max_fps=20, animate=True)
+    assert buffer.getvalue() == "x" * 100 + "\n"
+    assert buffer.writes < 10
+    assert buffer.flushes < 15
+
+
+def test_max_fps_custom_mode():
+    buffer = CountingStringIO()
+
+    def custom(ctx, text):
+        for c in text:
+            ctx.emit(c)
+            ctx.sleep()
+    type_print("hello", file=buffer, delay=0.001, mode=custom, max_fps=10, animate=True)
+    assert buffer.getvalue() == "hello\n"
+    assert buffer.writes == 2
+
+
+def test_async_type_print_modes():
+    for mode in TypeMode:
+        buffer = io.StringIO()
+        asyncio.run(async_type_print("Hi there.\nBye!", file=buffer, delay=0.001, mode=mode, animate=True))
+        assert buffer.getvalue() == "Hi there.\nBye!\n"
+
+
+def test_async_type_print_concurrent():
+    buffers = [io.StringIO() for _ in range(50)]
+
+    async def main():
+        await asyncio.gather(*[async_type_print("hello", file=b, delay=0.01, animate=True) for b in buffers])
+    start = time.monotonic()
+    asyncio.run(main())
+    assert 0.05 <= time.monotonic() - start < 0.5
+    assert all(b.getvalue() == "hello\n" for b in buffers)
+
+
+def test_async_custom_mode():
+    buffer = io.StringIO()
+
+    async def custom(ctx, text):
+        for c in text:
+            ctx.emit(c.upper())
+            await ctx.sleep(delay=0.001)
+    asyncio.run(async_type_print("hello", file=buffer, delay=0.01, mode=custom, animate=True))
+    assert buffer.getvalue() == "HELLO\n"
+
+
+def test_async_sync_custom_mode():
+    buffer = io.StringIO()
+    clock = VirtualClock()
+
+    def legacy(ctx, text):
+        for c in text:
+            ctx.emit(c)
+            ctx.sleep()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        asyncio.run(async_type_print("abc", file=buffer, delay=1, mode=legacy, end="", clock=clock, animate=True))
+    assert buffer.getvalue() == "abc"
+    assert clock.time == 3
+    assert [fragment for _, fragment in clock.timeline] == ["a", "b", "c"]
+
+
+def test_async_type_print_cancel():
+    buffer = io.StringIO()
+
+    async def main():
+        task = asyncio.ensure_future(async_type_print("x" * 100, file=buffer, delay=0.01, animate=True))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+    assert asyncio.run(main())
+    assert 0 < len(buffer.getvalue()) < 100
+
+
+def test_engine_sessions():
+    buffers = [io.StringIO() for _ in range(100)]
+    with TypioEngine() as engine:
+        start = time.monotonic()
+        handles = [
+            type_print(
+                "hello", file=b, delay=0.01, mode=TypeMode.WORD if i % 2 else TypeMode.CHAR, engine=engine,
+                animate=True)
+            for i, b in enumerate(buffers)]
+        for handle in handles:
+            handle.join(5)
+        assert time.monotonic() - start < 1
+        assert all(handle.done for handle in handles)
+        assert engine.queue_depth == 0
+        assert len(engine.lateness) > 0
+    assert all(b.getvalue() == "hello\n" for b in buffers)
+
+
+def test_engine_custom_mode():
+    buffer = io.StringIO()
+
+    def custom(ctx, text):
+        for c in text:
+            ctx.emit(c.upper())
+            ctx.sleep(delay=0.001)
+    engine = TypioEngine()
+    type_print("hello", file=buffer, delay=0.01, mode=custom, engine=engine, animate=True).join()
+    engine.close()
+    assert buffer.getvalue() == "HELLO\n"
+
+
+def test_engine_await():
+    buffer = io.StringIO()
+    engine = TypioEngine()
+
+    async def main():
+        await type_print("hello", file=buffer, delay=0.001, engine=engine, animate=True)
+    asyncio.run(main())
+    engine.close()
+    assert buffer.getvalue() == "hello\n"
+
+
+def test_engine_cancel():
+    buffer = io.StringIO()
+    engine = TypioEngine()
+    handle = type_print("x" * 100, file=buffer, delay=0.01, engine=engine, animate=True)
+    time.sleep(0.05)
+    handle.cancel()
+    handle.join(1)
+    engine.close()
+    assert 0 < len(buffer.getvalue()) < 100
+
+
+def test_typestyle_thread_isolation(capsys):
+    @typestyle(delay=0.02, animate=True)
+    def slow():
+        print("a" * 20)
+
+    thread = threading.Thread(target=slow)
+    thread.start()
+    time.sleep(0.05)
+    assert thread.is_alive()
+    start = time.monotonic()
+    print("b" * 100)
+    elapsed = time.monotonic() - start
+    thread.join()
+    assert elapsed < 0.05
+    captured = capsys.readouterr()
+    assert captured.out.count("a") == 20
+    assert "b" * 100 in captured.out
+    assert type(sys.stdout).__name__ != "_StdoutProxy"
+
+
+def test_typestyle_async(capsys):
+    @typestyle(delay=0.05, animate=True)
+    async def demo(name):
+        print(name)
+        await asyncio.sleep(0)
+        return name
+
+    async def main():
+        return await asyncio.gather(demo("hello"), demo("world"))
+    start = time.monotonic()
+    assert asyncio.run(main()) == ["hello", "world"]
+    assert 0.25 <= time.monotonic() - start < 0.55
+    captured = capsys.readouterr()
+    assert sorted(captured.out) == sorted("hello\nworld\n")
+
+
+def test_typestyle_generator(capsys):
+    def custom(ctx, text):
+        ctx.emit(text.upper())
+
+    @typestyle(delay=0, mode=custom)
+    def gen():
+        print("inside")
+        received = yield 1
+        print(received)
+        yield 2
+        return 3
+
+    g = gen()
+    assert next(g) == 1
+    print("outside")
+    assert g.send("again") == 2
+    try:
+        next(g)
+    except StopIteration as e:
+        assert e.value == 3
+    captured = capsys.readouterr()
+    assert captured.out == "INSIDE\noutside\nAGAIN\n"
+
+
+def test_compile_plan():
+    plan = compile_plan("Hi there. Bye!", mode=TypeMode.WORD, delay=0.1)
+    assert list(plan) == [("Hi", 1), (" ", 1), ("there.", 1), (" ", 1), ("Bye!", 1)]
+    assert len(plan) == 5
+    assert list(plan.offsets) == [0, 2, 3, 9, 10, 14]
+    assert plan.duration == 0.5
+    plan = compile_plan(b"a.\n", mode=TypeMode.SENTENCE, delay=0.1)
+    assert plan.delays == [0.1, 0.5, 0.1]
+    plan = compile_plan("a, b", mode=TypeMode.ADAPTIVE, delay=1)
+    assert list(plan.factors) == [1, 1.5, 0.3, 1]
+
+
+def test_plan_cache():
+    plan_cache_clear()
+    for _ in range(3):
+        type_print("cached", file=io.StringIO(), delay=0.0001, mode=TypeMode.LINE, animate=True)
+    info = plan_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+    plan_cache_clear()
+    assert plan_cache_info().currsize == 0
+
+
+def test_plan_cache_memory():
+    plan_cache_clear()
+    plan = compile_plan("a, b", mode=TypeMode.ADAPTIVE)
+    assert plan.offsets.itemsize == 4
+    assert plan.factors.ids.itemsize == 1
+    for i in range(64):
+        compile_plan(chr(0x4e00 + i) * 60000)
+    info = plan_cache_info()
+    assert info.misses == 65
+    assert 1 < info.currsize < 64
+    plan_cache_clear()
+
+
+def test_lazy_tokenizers():
+    text = "One_ line.\r\nTwo\x0b3\u2028½ é!?\n" * 3
+    plan = compile_plan(text, mode=TypeMode.LINE)
+    assert [part for part, _ in plan] == text.splitlines(True)
+    plan = compile_plan(text, mode=TypeMode.ADAPTIVE)
+    assert list(plan.factors) == [0.3 if c.isspace() else 1.5 if not c.isalnum() else 1 for c in text]
+    plan = compile_plan(text, mode=TypeMode.SENTENCE)
+    assert list(plan.factors) == [5 if c in ".!?" else 1 for c in text]
+    plan_cache_clear()
+    text = "word " * 20000
+    buffer = io.StringIO()
+    type_print(text, file=buffer, delay=0.0001, mode=TypeMode.WORD, end="", clock=VirtualClock(), animate=True)
+    assert buffer.getvalue() == text
+    assert plan_cache_info().misses == 0
+
+
+class TTYStringIO(CountingStringIO):
+    def isatty(self):
+        return True
+
+
+def test_animate_policy():
+    slept = []
+    buffer = CountingStringIO()
+    type_print("hello", file=buffer, delay=0.5, sleeper=slept.append)
+    assert buffer.getvalue() == "hello\n"
+    assert buffer.writes == 1
+    assert slept == []
+    buffer = TTYStringIO()
+    type_print("hello", file=buffer, delay=0.5, sleeper=slept.append, end="")
+    assert buffer.writes == 5
+    assert len(slept) == 5
+    buffer = TTYStringIO()
+    type_print("hello", file=buffer, delay=0.5, sleeper=slept.append, animate=False)
+    assert buffer.getvalue() == "hello\n"
+    assert buffer.writes == 1
+    assert len(slept) == 5
+
+
+def test_animate_policy_custom_mode_and_stream():
+    buffer = CountingStringIO()
+
+    def custom(ctx, text):
+        for c in text:
+            ctx.emit(c)
+            ctx.sleep(delay=1)
+    type_print("hello", file=buffer, mode=custom)
+    assert buffer.getvalue() == "hello\n"
+    assert buffer.writes == 1
+    buffer = CountingStringIO()
+    type_print_stream(["hel", "lo"], file=buffer, delay=1, mode=TypeMode.WORD)
+    assert buffer.getvalue() == "hello\n"
+    assert buffer.writes <= 3
+
+
+def test_animate_policy_typestyle(capsys):
+    slept = []
+
+    @typestyle(delay=0.5, sleeper=slept.append)
+    def auto():
+        print("hello")
+
+    @typestyle(delay=0.001, sleeper=slept.append, animate=True)
+    def forced():
+        print("hi")
+    auto()
+    assert slept == []
+    forced()
+    assert len(slept) == 3
+    assert capsys.readouterr().out == "hello\nhi\n"
+
+
+class RecordingStringIO(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+
+    def write(self, s):
+        self.parts.append(s)
+        return super().write(s)
+
+
+def test_stream_word_mode():
+    buffer = RecordingStringIO()
+    type_print_stream(iter(["hel", "lo wo", "rld"]), file=buffer, delay=0.001, mode=TypeMode.WORD, animate=True)
+    assert buffer.getvalue() == "hello world\n"
+    assert buffer.parts == ["hello", " ", "world", "\n"]
+
+
+def test_stream_line_mode():
+    buffer = RecordingStringIO()
+    type_print_stream(
+        ["first li", "ne\r", "\nsecond", " line"], file=buffer, delay=0.001, mode=TypeMode.LINE, end="", animate=True)
+    assert buffer.parts == ["first line\r\n", "second line"]
+
+
+def test_stream_bytes_split_codepoint():
+    buffer = io.StringIO()
+    data = "héllo".encode()
+    type_print_stream([data[:2], data[2:]], file=buffer, delay=0)
+    assert buffer.getvalue() == "héllo\n"
+
+
+def test_stream_first_chunk_emitted_early():
+    buffer = io.StringIO()
+    seen = []
+
+    def chunks():
+        yield "ab"
+        seen.append(buffer.getvalue())
+        yield "cd"
+    type_print_stream(chunks(), file=buffer, delay=0.001)
+    assert seen == ["ab"]
+    assert buffer.getvalue() == "abcd\n"
+
+
+def test_stream_slow_producer():
+    buffer = io.StringIO()
+
+    def chunks():
+        for c in "abc":
+            time.sleep(0.05)
+            yield c
+    start = time.monotonic()
+    type_print_stream(chunks(), file=buffer, delay=0.01, animate=True)
+    assert 0.15 <= time.monotonic() - start < 0.25
+    assert buffer.getvalue() == "abc\n"
+
+
+def test_async_stream():
+    buffer = RecordingStringIO()
+
+    async def chunks():
+        for c in ["hel", "lo wo", "rld"]:
+            await asyncio.sleep(0)
+            yield c
+    asyncio.run(async_type_print_stream(chunks(), file=buffer, delay=0.001, mode=TypeMode.WORD, animate=True))
+    assert buffer.parts == ["hello", " ", "world", "\n"]
+
+
+def test_global_speed():
+    buffer = CountingStringIO()
+    try:
+        set_speed(0)
+        assert get_speed() == 0
+        start = time.monotonic()
+        type_print("hello world", file=buffer, delay=1, animate=True)
+        assert time.monotonic() - start < 0.5
+        assert buffer.writes == 1
+        set_speed(10)
+        start = time.monotonic()
+        type_print("hello", file=buffer, delay=0.1, animate=True)
+        assert time.monotonic() - start < 0.2
+    finally:
+        set_speed(1)
+    assert buffer.getvalue() == "hello world\nhello\n"
+
+
+def test_speed_environment():
+    from typio.functions import _read_speed
+    assert _read_speed("0") == 0
+    assert _read_speed("2.5") == 2.5
+    assert _read_speed("fast") == 1
+    assert _read_speed("-1") == 1
+    assert _read_speed(None) == 1
+
+
+def test_control_skip():
+    buffer = CountingStringIO()
+    control = TypioControl()
+    threading.Timer(0.1, control.skip).start()
+    start = time.monotonic()
+    type_print("x" * 100, file=buffer, delay=0.05, control=control, animate=True)
+    assert time.monotonic() - start < 0.5
+    assert buffer.getvalue() == "x" * 100 + "\n"
+    assert control.skipped
+    assert buffer.writes < 10
+
+
+def test_control_skip_async_and_engine():
+    buffer = io.StringIO()
+    control = TypioControl()
+    threading.Timer(0.1, control.skip).start()
+    start = time.monotonic()
+    asyncio.run(async_type_print("abc", file=buffer, delay=2, control=control, animate=True))
+    assert time.monotonic() - start < 0.5
+    assert buffer.getvalue() == "abc\n"
+    buffer = io.StringIO()
+    control = TypioControl()
+    threading.Timer(0.1, control.skip).start()
+    start = time.monotonic()
+    with TypioEngine() as engine:
+        type_print("abc", file=buffer, delay=2, control=control, engine=engine, animate=True).join()
+        assert time.monotonic() - start < 0.5
+    assert buffer.getvalue() == "abc\n"
+
+
+def test_control_fast_forward():
+    buffer = io.StringIO()
+    control = TypioControl()
+    control.fast_forward(10)
+    assert control.speed == 10
+    start = time.monotonic()
+    type_print("x" * 10, file=buffer, delay=0.1, control=control, animate=True)
+    assert time.monotonic() - start < 0.5
+    control.fast_forward(0)
+    assert control.skipped
+
+
+def test_control_custom_mode():
+    buffer = CountingStringIO()
+    control = TypioControl(speed=0)
+
+    def custom(ctx, text):
+        for c in text:
+            ctx.emit(c)
+            ctx.sleep(delay=1)
+    type_print("hello", file=buffer, mode=custom, control=control, animate=True)
+    assert buffer.getvalue() == "hello\n"
+    assert buffer.writes == 1
+
+
+def test_virtual_clock_timeline():
+    clock = VirtualClock()
+    buffer = io.StringIO()
+    type_print("Hi.", file=buffer, delay=1, mode=TypeMode.SENTENCE, clock=clock, animate=True)
+    assert buffer.getvalue() == "Hi.\n"
+    assert clock.timeline == [(0, "H"), (1, "i"), (2, "."), (7, "\n")]
+    assert clock.time == 8
+
+
+def test_virtual_clock_zero_wait():
+    clock = VirtualClock()
+    start = time.monotonic()
+    for _ in range(100):
+        type_print("Hello\nWorld", file=io.StringIO(), delay=1, mode=TypeMode.TYPEWRITER, clock=clock, animate=True)
+    assert time.monotonic() - start < 1
+    assert clock.time == 100 * (12 + 10)
+
+
+def test_virtual_clock_custom_mode_and_frames():
+    clock = VirtualClock()
+
+    def custom(ctx, text):
+        for c in text:
+            ctx.emit(c)
+            ctx.sleep(delay=0.01)
+    type_print("abcd", file=io.StringIO(), mode=custom, clock=clock, max_fps=50, end="", animate=True)
+    assert clock.timeline == [(0, "a"), (0.02, "bc"), (0.04, "d")]
+    clock = VirtualClock()
+    type_print("abcdefg", file=io.StringIO(), delay=0.01, clock=clock, max_fps=20, end="", animate=True)
+    assert clock.timeline == [(0, "a"), (0.05, "bcdef"), (0.07, "g")]
+    clock = VirtualClock()
+    asyncio.run(async_type_print("abc", file=io.StringIO(), delay=0.01, clock=clock, max_fps=20, end="", animate=True))
+    assert clock.timeline == [(0, "a"), (0.03, "bc")]
+
+
+def test_virtual_clock_async():
+    clock = VirtualClock()
+    asyncio.run(async_type_print("ab", file=io.StringIO(), delay=2, clock=clock, end="", animate=True))
+    assert clock.timeline == [(0, "a"), (2, "b")]
+
+
+def test_seeded_jitter():
+    timelines = []
+    for _ in range(2):
+        clock = VirtualClock()
+        type_print("hello", file=io.StringIO(), delay=0.1, jitter=0.05, clock=clock, seed=42, animate=True)
+        timelines.append(clock.timeline)
+    assert timelines[0] == timelines[1]
+    clock = VirtualClock()
+    type_print("hello", file=io.StringIO(), delay=0.1, jitter=0.05, clock=clock, rng=random.Random(42), animate=True)
+    assert clock.timeline == timelines[0]
+
+
+def test_custom_sleeper():
+    slept = []
+    type_print("abc", file=io.StringIO(), delay=0.5, sleeper=slept.append, end="", animate=True)
+    assert len(slept) == 3
+    assert all(0 < s <= 1.5 for s in slept)
+    slept = []
+
+    async def sleeper(seconds):
+        slept.append(seconds)
+    start = time.monotonic()
+    asyncio.run(async_type_print("abc", file=io.StringIO(), delay=0.5, sleeper=sleeper, end="", animate=True))
+    assert time.monotonic() - start < 0.5
+    assert len(slept) == 3
+
+
+def test_stats_builtin_mode():
+    stats = TypioStats()
+    clock = VirtualClock()
+    type_print("Hi.", file=io.StringIO(), delay=1, mode=TypeMode.SENTENCE, clock=clock, stats=stats, animate=True)
+    assert stats.units == 4
+    assert stats.writes == 4
+    assert stats.flushes == 5
+    assert stats.sleeps == 4
+    assert stats.sleep_requested == 8
+    assert stats.sleep_actual == 8
+    snapshot = stats.snapshot()
+    assert snapshot["lateness_histogram"]["<=1e-05"] == 4
+    stats.reset()
+    assert stats.units == 0
+
+
+def test_stats_custom_mode_and_frames():
+    stats = TypioStats()
+
+    def custom(ctx, text):
+        for c in text:
+            ctx.emit(c)
+            ctx.sleep(delay=0.01)
+    type_print(
+        "abcd", file=io.StringIO(), mode=custom, clock=VirtualClock(), max_fps=50, end="", stats=stats, animate=True)
+    assert stats.units == 4
+    assert stats.writes == 3
+    assert round(stats.sleep_requested, 6) == 0.04
+
+
+def test_stats_hooks():
+    class Hooks(TypioStats):
+        def __init__(self):
+            super().__init__()
+            self.fragments = []
+
+        def on_emit(self, fragment):
+            super().on_emit(fragment)
+            self.fragments.append(fragment)
+    hooks = Hooks()
+    type_print("a b", file=io.StringIO(), delay=0.001, mode=TypeMode.WORD, stats=hooks, animate=True)
+    assert hooks.fragments == ["a", " ", "b", "\n"]
+    assert hooks.units == 4
+
+
+class RecordingBytesIO(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+
+    def write(self, b):
+        self.parts.append(b)
+        return super().write(b)
+
+
+def test_byte_sink_slices():
+    buffer = RecordingBytesIO()
+    type_print("héllo wörld", file=buffer, delay=0.0001, mode=TypeMode.WORD, clock=VirtualClock(), animate=True)
+    assert buffer.getvalue() == "héllo wörld\n".encode()
+    assert all(isinstance(part, memoryview) for part in buffer.parts)
+    assert [bytes(part) for part in buffer.parts] == [b"h\xc3\xa9llo", b" ", b"w\xc3\xb6rld", b"\n"]
+
+
+def test_byte_sink_bulk_and_frames():
+    buffer = RecordingBytesIO()
+    type_print("hello", file=buffer, delay=0, animate=True)
+    assert buffer.parts[0].obj == b"hello\n"
+    buffer = RecordingBytesIO()
+    type_print("abcd", file=buffer, delay=0.01, clock=VirtualClock(), max_fps=50, end="", animate=True)
+    assert [bytes(part) for part in buffer.parts] == [b"a", b"bc", b"d"]
+
+
+def test_byte_sink_custom_mode():
+    buffer = io.BytesIO()
+
+    def custom(ctx, text):
+        ctx.emit(text.upper())
+    type_print("héllo", file=buffer, delay=0, mode=custom)
+    assert buffer.getvalue() == "HÉLLO\n".encode()
+
+
+def test_byte_sink_file_descriptor():
+    read_fd, write_fd = os.pipe()
+    try:
+        type_print("héllo", file=write_fd, delay=0.0001, clock=VirtualClock(), animate=True)
+        assert os.read(read_fd, 100) == "héllo\n".encode()
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_byte_sink_async():
+    buffer = io.BytesIO()
+    asyncio.run(async_type_print("héllo", file=buffer, delay=0.0001, clock=VirtualClock(), animate=True))
+    assert buffer.getvalue() == "héllo\n".encode()
+
+
+def test_type_print_file_path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("héllo world\nbye")
+    buffer = io.StringIO()
+    clock = VirtualClock()
+    type_print_file(str(path), file=buffer, delay=0.01, mode=TypeMode.WORD, clock=clock, animate=True)
+    assert buffer.getvalue() == "héllo world\nbye\n"
+    assert [fragment for _, fragment in clock.timeline][:4] == ["héllo", " ", "world", "\n"]
+
+
+def test_type_print_file_chunk_boundary(tmp_path):
+    path = tmp_path / "input.txt"
+    text = "a" * 65534 + " é" + "word" + " tail"
+    path.write_text(text)
+    buffer = io.StringIO()
+    clock = VirtualClock()
+    type_print_file(path, file=buffer, delay=0.001, mode=TypeMode.WORD, clock=clock, animate=True)
+    assert buffer.getvalue() == text + "\n"
+    assert "éword" in [fragment for _, fragment in clock.timeline]
+
+
+def test_type_print_file_object(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("line1\nline2\n")
+    buffer = io.StringIO()
+    with open(path) as handle:
+        type_print_file(handle, file=buffer, delay=0, mode=TypeMode.LINE, end="")
+    assert buffer.getvalue() == "line1\nline2\n"
+    buffer = io.StringIO()
+    type_print_file(io.BytesIO("héllo".encode()), file=buffer, delay=0)
+    assert buffer.getvalue() == "héllo\n"
+
+
+def test_type_print_file_empty(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    buffer = io.StringIO()
+    type_print_file(path, file=buffer, delay=0)
+    assert buffer.getvalue() == "\n"
+
+
+def test_cli_text(capsys):
+    assert main(["hello", "world"]) == 0
+    assert capsys.readouterr().out == "hello world\n"
+    assert main(["--force", "--delay", "0", "--mode", "WORD", "--end", "", "hi"]) == 0
+    assert capsys.readouterr().out == "hi"
+    assert main(["--force", "-d", "0.0001", "-j", "0.0001", "--distribution", "bigram", "--seed", "1", "hi"]) == 0
+    assert capsys.readouterr().out == "hi\n"
+
+
+def test_cli_file(tmp_path, capsys):
+    path = tmp_path / "input.txt"
+    path.write_text("héllo")
+    assert main(["-f", str(path), "-f", str(path)]) == 0
+    assert capsys.readouterr().out == "héllohéllo\n"
+    assert main(["--force", "-d", "0", "-f", str(path), "-f", str(path)]) == 0
+    assert capsys.readouterr().out == "héllohéllo\n"
+
+
+def test_cli_stdin():
+    for options in ([], ["--force", "--speed", "0"]):
+        result = subprocess.run(
+            [sys.executable, "-m", "typio"] + options, input="héllo\nworld".encode(), stdout=subprocess.PIPE)
+        assert result.returncode == 0
+        assert result.stdout == "héllo\nworld\n".encode()
+
+
+def test_cli_error(capsys):
+    for options in (["--force"], []):
+        assert main(options + ["--delay", "-1", "hi"]) == 1
+        assert "`delay` must be a non-negative number." in capsys.readouterr().err
+    assert main(["--mode", "missing", "hi"]) == 1
+    assert capsys.readouterr().out == ""
+
+
+ANSI_PATTERN = re.compile(r"\x1b\[(\d*)([ABGK])|(\n)|(\r)|([^\x1b\r\n])")
+
+
+def emulate(data):
+    screen, row, col = [[]], 0, 0
+    for number, command, newline, carriage, char in ANSI_PATTERN.findall(data):
+        if command == "A":
+            row -= int(number or 1)
+        elif command == "B":
+            row += int(number or 1)
+        elif command == "G":
+            col = int(number or 1) - 1
+        elif command == "K":
+            del screen[row][col:]
+        elif newline:
+            row, col = row + 1, 0
+        elif carriage:
+            col = 0
+        while len(screen) <= row:
+            screen.append([])
+        if char:
+            screen[row].extend(" " * (col - len(screen[row])))
+            screen[row][col:col + 1] = [char]
+            col += 1
+    return ["".join(line) for line in screen]
+
+
+def test_renderer_pty():
+    pty = pytest.importorskip("pty")
+    master, slave = pty.openpty()
+    out = os.fdopen(slave, "w")
+    renderer = TypioRenderer(file=out, max_fps=100, width=80)
+    status = renderer.region()
+    log = renderer.region(height=2)
+    with renderer:
+        threads = [
+            threading.Thread(target=type_print, args=("ready",), kwargs={"file": status, "delay": 0.001}),
+            threading.Thread(
+                target=type_print, args=("line1\nline2\nline3",), kwargs={"file": log, "delay": 0.001, "end": ""})]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    data = b""
+    while select.select([master], [], [], 0.1)[0]:
+        data += os.read(master, 65536)
+    out.close()
+    os.close(master)
+    assert emulate(data.decode())[:3] == ["ready", "line2", "line3"]
+
+
+def test_renderer_write_volume():
+    buffer = TTYStringIO()
+    renderer = TypioRenderer(file=buffer, max_fps=20, width=80)
+    regions = [renderer.region() for _ in range(10)]
+    with renderer:
+        threads = [
+            threading.Thread(target=type_print, args=("x" * 20,), kwargs={"file": region, "delay": 0.005, "end": ""})
+            for region in regions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert buffer.writes == renderer.frames + 1
+    assert renderer.frames < 10
+    assert emulate(buffer.getvalue())[:10] == ["x" * 20] * 10
+
+
+def test_renderer_diff():
+    buffer = io.StringIO()
+    renderer = TypioRenderer(file=buffer, width=5)
+    region = renderer.region(height=2)
+    region.write("abc")
+    renderer.refresh()
+    assert buffer.getvalue() == "\n\x1b[1A\x1b[1Gabc"
+    region.write("d\rab")
+    renderer.refresh()
+    assert buffer.getvalue().endswith("\x1b[3G\x1b[K")
+    region.write("\nlong line")
+    renderer.refresh()
+    assert region.lines == ["ab", "long line"]
+    renderer.close()
+    assert emulate(buffer.getvalue()) == ["ab", "long ", ""]
+
+
+def test_region_newlines():
+    renderer = TypioRenderer(file=io.StringIO())
+    region = renderer.region(height=3)
+    region.write("a\n")
+    assert region.lines == ["a", "", ""]
+    region.write("\nb\n")
+    assert region.lines == ["a", "", "b"]
+    region.write("c")
+    assert region.lines == ["", "b", "c"]
+    region.clear()
+    assert region.lines == ["", "", ""]
+
+
+def shout(ctx, text):
+    for word in text.split(" "):
+        yield word.upper(), 2
+
+
+def test_declarative_mode():
+    clock = VirtualClock()
+    buffer = io.StringIO()
+    type_print("hi there", file=buffer, delay=1, mode=shout, end="", clock=clock, animate=True)
+    assert buffer.getvalue() == "HITHERE"
+    assert clock.timeline == [(0, "HI"), (2, "THERE")]
+    assert clock.time == 4
+    buffer = CountingStringIO()
+    type_print("a b c d", file=buffer, delay=0.01, mode=shout, end="", clock=VirtualClock(), max_fps=40, animate=True)
+    assert buffer.getvalue() == "ABCD"
+    assert buffer.writes == 3
+    buffer = CountingStringIO()
+    type_print("a b c d", file=buffer, delay=1, mode=shout, end="", control=TypioControl(speed=0), animate=True)
+    assert buffer.getvalue() == "ABCD"
+    assert buffer.writes == 1
+
+
+def test_declarative_mode_engine_and_stream():
+    buffer = io.StringIO()
+    with TypioEngine() as engine:
+        type_print("hi there", file=buffer, delay=0.001, mode=shout, end="", engine=engine, animate=True).join(1)
+    assert buffer.getvalue() == "HITHERE"
+    buffer = io.StringIO()
+    type_print_stream(["a b", "c"], file=buffer, delay=0.001, mode=shout, end="", animate=True)
+    assert buffer.getvalue() == "ABC"
+
+
+def test_declarative_mode_async():
+    async def slow_shout(ctx, text):
+        for word in text.split(" "):
+            await asyncio.sleep(0)
+            yield word.upper(), 1
+    for mode in (shout, slow_shout):
+        clock = VirtualClock()
+        buffer = io.StringIO()
+        asyncio.run(async_type_print("a b", file=buffer, delay=1, mode=mode, end="", clock=clock, animate=True))
+        assert buffer.getvalue() == "AB"
+        assert [fragment for _, fragment in clock.timeline] == ["A", "B"]
+
+
+def test_declarative_mode_plan():
+    plan_cache_clear()
+    plan = compile_plan("hi there", mode=shout, delay=0.5)
+    assert list(plan) == [("HI", 2), ("THERE", 2)]
+    assert plan.duration == 2
+
+    def cached(ctx, text):
+        return compile_plan(text, mode=shout, delay=ctx.delay)
+    buffer = io.StringIO()
+    for _ in range(3):
+        type_print("hi there", file=buffer, delay=0.001, mode=cached, end="", clock=VirtualClock(), animate=True)
+    assert buffer.getvalue() == "HITHERE" * 3
+    assert plan_cache_info().hits == 2
+
+    def chunked(ctx, text):
+        size = 1 if ctx.delay < 1 else len(text)
+        return [(text[i:i + size], 1) for i in range(0, len(text), size)]
+    assert len(compile_plan("abc", mode=chunked, delay=1)) == 1
+    assert len(compile_plan("abc", mode=chunked, delay=0.1)) == 3
+
+
+def test_jitter_distributions():
+    for distribution in JitterDistribution:
+        timelines = []
+        for _ in range(2):
+            clock = VirtualClock()
+            type_print(
+                "hello world " * 50, file=io.StringIO(), delay=0.1, jitter=0.05, distribution=distribution,
+                clock=clock, seed=7, animate=True)
+            timelines.append(clock.timeline)
+        assert timelines[0] == timelines[1]
+        gaps = [b[0] - a[0] for a, b in zip(timelines[0], timelines[0][1:])]
+        assert all(gap >= 0 for gap in gaps)
+        assert 0.08 < sum(gaps) / len(gaps) < 0.12
+        assert len(set(gaps)) > 100
+
+
+def test_jitter_sampler():
+    from typio.functions import _JitterSampler
+    sampler = _JitterSampler(JitterDistribution.UNIFORM, random.Random(1))
+    samples = [sampler.apply(1, 0.5, "a") for _ in range(1000)]
+    assert all(0.5 <= s <= 1.5 for s in samples)
+    sampler = _JitterSampler(JitterDistribution.GAUSSIAN, random.Random(1))
+    samples = [sampler.apply(0.1, 1, "a") for _ in range(1000)]
+    assert min(samples) == 0
+    sampler = _JitterSampler(JitterDistribution.LOGNORMAL, random.Random(1))
+    samples = [sampler.apply(1, 0.5, "a") for _ in range(5000)]
+    assert min(samples) > 0
+    assert 0.95 < sum(samples) / len(samples) < 1.05
+    assert sorted(samples)[2500] < 1
+
+
+def test_jitter_sampler_numpy():
+    pytest.importorskip("numpy")
+    from typio.functions import _JitterSampler
+    assert not get_numpy()
+    try:
+        set_numpy(True)
+        assert get_numpy()
+        sampler = _JitterSampler(JitterDistribution.UNIFORM, random.Random(1))
+        samples = [sampler.apply(1, 0.5, "a") for _ in range(1000)]
+        assert all(0.5 <= s <= 1.5 for s in samples)
+        sampler = _JitterSampler(JitterDistribution.UNIFORM, random.Random(1))
+        assert [sampler.apply(1, 0.5, "a") for _ in range(1000)] == samples
+        sampler = _JitterSampler(JitterDistribution.LOGNORMAL, random.Random(1))
+        samples = [sampler.apply(1, 0.5, "a") for _ in range(5000)]
+        assert min(samples) > 0
+        assert 0.95 < sum(samples) / len(samples) < 1.05
+        timelines = []
+        for _ in range(2):
+            clock = VirtualClock()
+            type_print(
+                "hello world " * 50, file=io.StringIO(), delay=0.1, jitter=0.05,
+                distribution=JitterDistribution.GAUSSIAN, clock=clock, seed=7, animate=True)
+            timelines.append(clock.timeline)
+        assert timelines[0] == timelines[1]
+    finally:
+        set_numpy(False)
+
+
+def test_bigram_factor():
+    from typio.functions import _bigram_factor
+    assert _bigram_factor("", "a") == 1
+    assert _bigram_factor("a", " ") == 1
+    assert _bigram_factor(" ", "a") == 1.25
+    assert _bigram_factor("l", "l") == 0.75
+    assert _bigram_factor("a", "k") == 0.85
+    assert _bigram_factor("a", "s") == 1.1
+    assert _bigram_factor("a", "S") == 1.2 * 1.1
+    assert _bigram_factor("a", "!") == 1.4
+
+
+def test_register_mode(capsys):
+    @register_mode("test-shout")
+    def loud(ctx, text):
+        yield text.upper(), 1
+    assert loud.__name__ == "loud"
+    buffer = io.StringIO()
+    type_print("hey", file=buffer, delay=0, mode="test-shout")
+    assert buffer.getvalue() == "HEY\n"
+    register_mode("test-shout", shout)
+    assert list(compile_plan("a b", mode="test-shout")) == [("A", 2), ("B", 2)]
+
+    @typestyle(delay=0, mode="test-shout")
+    def greet():
+        print("hi")
+    greet()
+    assert capsys.readouterr().out == "HI\n"
+
+
+def test_builtin_mode_names():
+    buffer = io.StringIO()
+    type_print("hi there", file=buffer, delay=0, mode="word", end="")
+    assert buffer.getvalue() == "hi there"
+    assert list(compile_plan("a b", mode="word")) == list(compile_plan("a b", mode=TypeMode.WORD))
+
+
+def test_register_mode_jobs(monkeypatch):
+    register_mode("test-job-shout", shout)
+    monkeypatch.setattr(multiprocessing, "get_context", lambda *args: multiprocessing.context.SpawnContext())
+    results = list(type_print_many([("hi there", "test-job-shout", 1)], workers=1))
+    assert results[0].text == "HITHERE"
+    assert results[0].duration == 4
+
+
+def test_mode_entry_point(tmp_path, monkeypatch):
+    dist = tmp_path / "typio_test_plugin-1.0.dist-info"
+    dist.mkdir()
+    (dist / "METADATA").write_text("Metadata-Version: 2.1\nName: typio-test-plugin\nVersion: 1.0\n")
+    (dist / "entry_points.txt").write_text("[typio.modes]\nreverse = typio_test_plugin:reverse\n")
+    (tmp_path / "typio_test_plugin.py").write_text("def reverse(ctx, text):\n    return [(text[::-1], 1)]\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert "typio_test_plugin" not in sys.modules
+    buffer = io.StringIO()
+    type_print("abc", file=buffer, delay=0, mode="reverse", end="")
+    assert buffer.getvalue() == "cba"
+    assert "typio_test_plugin" in sys.modules
+
+
+def test_server_tcp():
+    async def scenario():
+        async with TypioServer(delay=0.001, mode=TypeMode.WORD) as server:
+            host, port = await server.listen_tcp()
+            connections = [await asyncio.open_connection(host, port) for _ in range(3)]
+            await server.wait_for_clients(3)
+            assert server.clients == 3
+            await server.broadcast("hello typing world", end="\n")
+        results = [await asyncio.wait_for(reader.read(), 5) for reader, _ in connections]
+        for _, writer in connections:
+            writer.close()
+        return results
+    assert asyncio.run(scenario()) == [b"hello typing world\n"] * 3
+
+
+def test_server_close_with_clients():
+    async def scenario():
+        server = TypioServer(delay=0.001)
+        tcp = await server.listen_tcp()
+        http = await server.listen_http()
+        tcp_reader, tcp_writer = await asyncio.open_connection(*tcp)
+        http_reader, http_writer = await asyncio.open_connection(*http)
+        http_writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await server.wait_for_clients(2)
+        await asyncio.wait_for(server.close(), 5)
+        results = [await asyncio.wait_for(tcp_reader.read(), 5), await asyncio.wait_for(http_reader.read(), 5)]
+        tcp_writer.close()
+        http_writer.close()
+        return results, server.clients
+    (tcp, http), clients = asyncio.run(scenario())
+    assert tcp == b""
+    assert http.startswith(b"HTTP/1.1 200 OK")
+    assert clients == 0
+
+
+def test_server_slow_client():
+    text = ("x" * 999 + "\n") * 4000
+
+    async def scenario():
+        server = TypioServer(delay=0.001, mode=TypeMode.LINE, clock=VirtualClock(), buffer_limit=100000)
+        host, port = await server.listen_tcp()
+        slow = socket.socket()
+        slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        slow.connect((host, port))
+        reader, writer = await asyncio.open_connection(host, port)
+        await server.wait_for_clients(2)
+        received = asyncio.ensure_future(reader.read())
+        await server.broadcast(text)
+        await server.close()
+        data = await asyncio.wait_for(received, 10)
+        writer.close()
+        slow.close()
+        return data, server.dropped
+    data, dropped = asyncio.run(scenario())
+    assert data == text.encode()
+    assert dropped == 1
+
+
+def test_server_sse():
+    async def scenario():
+        async with TypioServer(delay=0.001) as server:
+            host, port = await server.listen_http()
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"GET /stream HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await server.wait_for_clients(1)
+            await server.broadcast_stream(["ab", "\nc\r", "\nd\re"], end="\n")
+        data = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return data.decode()
+    head, _, body = asyncio.run(scenario()).partition("\r\n\r\n")
+    assert head.startswith("HTTP/1.1 200 OK")
+    assert "Content-Type: text/event-stream" in head
+    events = [event for event in body.split("\n\n") if event]
+    assert "\r" not in body
+    assert "".join("\n".join(line[6:] for line in event.split("\n")) for event in events) == "ab\nc\nd\ne\n"
+
+
+def test_server_websocket():
+    async def scenario():
+        async with TypioServer(delay=0.001, mode=TypeMode.WORD) as server:
+            host, port = await server.listen_http()
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(
+                b"GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                b"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nSec-WebSocket-Version: 13\r\n\r\n")
+            await server.wait_for_clients(1)
+            await server.broadcast("héllo web")
+        data = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return data
+    data = asyncio.run(scenario())
+    head, _, frames = data.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 101")
+    assert b"Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=" in head
+    messages = []
+    while frames:
+        opcode, length = frames[0] & 0x0F, frames[1]
+        offset = 2
+        if length == 126:
+            length, offset = struct.unpack("!H", frames[2:4])[0], 4
+        messages.append((opcode, frames[offset:offset + length]))
+        frames = frames[offset + length:]
+    assert messages[-1] == (0x8, b"")
+    assert all(opcode == 0x1 for opcode, _ in messages[:-1])
+    assert b"".join(payload for _, payload in messages[:-1]).decode() == "héllo web"
+
+
+def test_cli_serve():
+    process = subprocess.Popen(
+        [sys.executable, "-m", "typio", "serve", "-d", "0.001", "--clients", "2", "hello", "world"],
+        stderr=subprocess.PIPE)
+    try:
+        line = process.stderr.readline().decode()
+        assert line.startswith("typio: listening on tcp://")
+        host, port = line.strip().rsplit("/", 1)[1].rsplit(":", 1)
+        clients = [socket.create_connection((host, int(port)), timeout=10) for _ in range(2)]
+        for client in clients:
+            data = b""
+            for chunk in iter(lambda: client.recv(4096), b""):
+                data += chunk
+            client.close()
+            assert data == b"hello world\n"
+        assert process.wait(10) == 0
+    finally:
+        process.kill()
+        process.stderr.close()
+
+
+def test_blocked_write_subtracted():
+    clock = VirtualClock()
+
+    class SlowWriter:
+        def write(self, text):
+            clock.sleep(4)
+
+        def flush(self):
+            pass
+
+    stats = TypioStats()
+    type_print("abcdefghij", delay=10, end="", file=SlowWriter(), clock=clock, stats=stats, animate=True)
+    assert clock.time == 100
+    assert stats.max_lag == 0
+
+
+def full_pipe():
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    filled = 0
+    try:
+        while True:
+            filled += os.write(write_fd, b"#" * 4096)
+    except BlockingIOError:
+        pass
+    return read_fd, write_fd, filled
+
+
+def drain_pipe(read_fd, size, wait=0.05):
+    data = bytearray()
+
+    def run():
+        time.sleep(wait)
+        while len(data) < size:
+            data.extend(os.read(read_fd, 65536))
+    thread = threading.Thread(target=run)
+    thread.start()
+    return data, thread
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="non-blocking pipes are not supported on Windows")
+def test_sink_nonblocking():
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    text = "héllo wörld " * 20000
+    data, thread = drain_pipe(read_fd, len(text.encode()))
+    sink = TypioSink(write_fd, buffer_limit=1024)
+    type_print(text, delay=0, end="", file=sink)
+    thread.join()
+    os.close(read_fd)
+    os.close(write_fd)
+    assert data.decode() == text
+    assert sink.backlog == 0
+    assert sink.blocked > 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="non-blocking pipes are not supported on Windows")
+def test_sink_policies():
+    for policy, duration, writes in ((BackpressurePolicy.MERGE, 6, 2), (BackpressurePolicy.DROP, 1, 2)):
+        read_fd, write_fd, filled = full_pipe()
+        data, thread = drain_pipe(read_fd, filled + 6)
+        clock = VirtualClock()
+        stats = TypioStats()
+        sink = TypioSink(write_fd, policy=policy)
+        type_print("abcdef", delay=1, end="", file=sink, clock=clock, stats=stats, animate=True)
+        thread.join()
+        os.close(read_fd)
+        os.close(write_fd)
+        assert data[filled:] == b"abcdef"
+        assert clock.time == duration
+        assert stats.writes == writes
+        assert stats.stalls == 1
+        assert stats.max_backlog >= 1
+        assert stats.snapshot()["backlog"] == stats.backlog
+
+
+def test_cast_record(tmp_path):
+    path = tmp_path / "demo.cast"
+    start = time.perf_counter()
+    with TypioCast(str(path), width=100, height=30, title="demo") as cast:
+        type_print("Hi.", delay=1, mode=TypeMode.SENTENCE, file=cast)
+        type_print("ok", delay=100, end="", file=cast)
+    assert time.perf_counter() - start < 1
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert lines[0] == {"version": 2, "width": 100, "height": 30, "title": "demo"}
+    assert lines[1:] == [[0, "o", "H"], [1, "o", "i"], [2, "o", "."], [7, "o", "\n"], [8, "o", "o"], [108, "o", "k"]]
+    assert cast.timeline == []
+
+
+def test_cast_record_custom_mode():
+    buffer = io.StringIO()
+
+    def custom(ctx, text):
+        for part in text.split():
+            ctx.emit(part)
+            ctx.sleep(delay=0.5)
+
+    cast = TypioCast(buffer, width=80, height=24)
+    type_print("ab cd", mode=custom, end="", file=cast)
+    cast.close()
+    assert buffer.getvalue().splitlines()[1:] == ['[0.0, "o", "ab"]', '[0.5, "o", "cd"]']
+
+
+def test_cast_replay(tmp_path):
+    path = tmp_path / "demo.cast"
+    with TypioCast(path, width=80, height=24) as cast:
+        type_print("Hi.", delay=1, mode=TypeMode.SENTENCE, file=cast)
+    buffer = io.StringIO()
+    clock = VirtualClock()
+    type_print_cast(path, file=buffer, clock=clock, animate=True)
+    assert buffer.getvalue() == "Hi.\n"
+    assert clock.timeline == [(0, "H"), (1, "i"), (2, "."), (7, "\n")]
+    clock = VirtualClock()
+    with open(path, encoding="utf-8") as source:
+        type_print_cast(source, file=io.StringIO(), clock=clock, idle_time_limit=2, animate=True)
+    assert clock.timeline == [(0, "H"), (1, "i"), (2, "."), (4, "\n")]
+    buffer = io.StringIO()
+    type_print_cast(path, file=buffer)
+    assert buffer.getvalue() == "Hi.\n"
+
+
+def test_zero_delays():
+    def legacy(ctx, text):
+        for c in text:
+            ctx.emit(c)
+            ctx.sleep(0)
+
+    def declarative(ctx, text):
+        return [(c, 0 if c == "b" else 1) for c in text]
+    clock = VirtualClock()
+    type_print("ab", file=io.StringIO(), delay=1, mode=legacy, end="", clock=clock, animate=True)
+    assert clock.time == 2
+    clock = VirtualClock()
+    type_print("abc", file=io.StringIO(), delay=1, mode=declarative, end="", clock=clock, animate=True)
+    assert clock.timeline == [(0, "a"), (1, "b"), (1, "c")]
+    clock = VirtualClock()
+    asyncio.run(async_type_print("abc", file=io.StringIO(), delay=1, mode=declarative, end="", clock=clock,
+                                 animate=True))
+    assert clock.timeline == [(0, "a"), (1, "b"), (1, "c")]
+
+
+def test_cast_replay_lazy():
+    reads = []
+
+    class Source:
+        def __init__(self):
+            self._lines = iter(['{"version": 2, "width": 80, "height": 24}\n'] + [
+                '[{0}, "o", "x"]\n'.format(i) for i in range(1000)])
+
+        def read(self):
+            return "".join(self._lines)
+
+        def readline(self):
+            return next(self._lines)
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            line = next(self._lines)
+            reads.append(len(reads) - len(buffer.getvalue()))
+            return line
+
+    buffer = io.StringIO()
+    type_print_cast(Source(), file=buffer, clock=VirtualClock(), animate=True)
+    assert buffer.getvalue() == "x" * 1000
+    assert set(reads) <= {0, 1}
+
+
+def test_type_print_many(tmp_path):
+    jobs = [
+        "hello",
+        TypioJob("hello world", TypeMode.WORD, 1, 0, str(tmp_path / "words.txt")),
+        ("Hi.", TypeMode.SENTENCE, 1, 0, tmp_path / "demo.cast"),
+        (b"bytes", TypeMode.CHAR, 0.5),
+    ]
+    results = list(type_print_many(jobs, workers=2, chunksize=2))
+    assert sorted(result.index for result in results) == [0, 1, 2, 3]
+    results = {result.index: result for result in sorted(results)}
+    assert results[0].text == "hello"
+    assert abs(results[0].duration - 0.2) < 1e-9
+    assert results[1].text is None
+    assert results[1].duration == 3
+    assert (tmp_path / "words.txt").read_text(encoding="utf-8") == "hello world"
+    assert results[2].duration == 7
+    events = [json.loads(line) for line in (tmp_path / "demo.cast").read_text(encoding="utf-8").splitlines()[1:]]
+    assert events == [[0, "o", "H"], [1, "o", "i"], [2, "o", "."]]
+    assert results[3].text == "bytes"
+
+
+def test_type_print_many_seed():
+    jobs = [("same text", TypeMode.CHAR, 0.1, 0.05)] * 4
+
+    def durations(seed):
+        return [result.duration for result in sorted(type_print_many(jobs, workers=2, seed=seed))]
+    first = durations(7)
+    assert first == durations(7)
+    assert first != durations(8)
+    assert len(set(first)) == 4
+
+
+def test_type_print_many_lazy():
+    consumed = []
+
+    def jobs():
+        for index in range(20):
+            consumed.append(index)
+            yield "job {0}".format(index)
+    results = type_print_many(jobs(), workers=1)
+    next(results)
+    assert len(consumed) < 20
+    results.close()
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def make_logger(handler):
+    logger = logging.getLogger("typio.test.{0}".format(id(handler)))
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_log_handler():
+    buffer = io.StringIO()
+    handler = TypioLogHandler(buffer, delay=10, animate=True)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    logger = make_logger(handler)
+    start = time.perf_counter()
+    logger.info("first")
+    assert time.perf_counter() - start < 0.5
+    wait_until(lambda: buffer.getvalue() == "I")
+    logger.warning("second")
+    handler.flush()
+    assert buffer.getvalue() == "INFO first\nWARNING second\n"
+    assert time.perf_counter() - start < 5
+    handler.close()
+    logger.info("closed")
+    assert buffer.getvalue() == "INFO first\nWARNING second\n"
+
+
+def test_log_handler_overflow():
+    for overflow, lines, dropped, coalesced in (
+            (OverflowPolicy.DROP, ["r0", "r1", "r2"], 2, 0),
+            (OverflowPolicy.COALESCE, ["r0", "r1", "r2", "r3", "r4"], 0, 2),
+            (OverflowPolicy.INSTANT, ["r0", "r1", "r2", "r3", "r4"], 0, 0)):
+        buffer = io.StringIO()
+        gate = threading.Event()
+        calls = []
+
+        def sleeper(seconds):
+            calls.append(seconds)
+            gate.wait()
+        handler = TypioLogHandler(
+            buffer, delay=1, sleeper=sleeper, animate=True, queue_size=2, overflow=overflow)
+        logger = make_logger(handler)
+        logger.info("r0")
+        wait_until(lambda: calls)
+        for index in range(1, 5):
+            logger.info("r{0}".format(index))
+        assert (handler.dropped, handler.coalesced) == (dropped, coalesced)
+        gate.set()
+        if overflow is OverflowPolicy.INSTANT:
+            handler.flush()
+            assert buffer.getvalue().count("\n") == 5
+            assert len(calls) == 1
+            logger.info("ab")
+            wait_until(lambda: len(calls) > 1)
+        handler.close()
+        assert buffer.getvalue().splitlines()[:len(lines)] == lines
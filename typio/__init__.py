@@ -1,8 +1,35 @@
 # -*- coding: utf-8 -*-
 """typio modules."""
-from .params import TYPIO_VERSION, TypeMode
+from importlib import import_module
+from typing import Any
+from .params import TYPIO_VERSION, TypeMode, JitterDistribution, BackpressurePolicy, OverflowPolicy
 from .errors import TypioError
 from .functions import type_print, typestyle, TypioContext
+from .functions import async_type_print, AsyncTypioContext
+from .functions import TypioEngine, TypioHandle, TypioRenderer, TypioRegion
+from .functions import type_print_stream, async_type_print_stream, type_print_file, type_print_cast, TypioCast
+from .functions import type_print_many, TypioJob, TypioResult
+from .functions import TypioControl, set_speed, get_speed, VirtualClock, TypioStats, TypioSink
+from .functions import set_numpy, get_numpy
+from .functions import TypioPlan, compile_plan, plan_cache_info, plan_cache_clear, register_mode
 
 __version__ = TYPIO_VERSION
-__all__ = ["TypeMode", "TypioError", "type_print", "typestyle", "TypioContext"]
+_LAZY_MODULES = {"TypioServer": "server", "TypioLogHandler": "handlers"}
+__all__ = [
+    "TypeMode", "JitterDistribution", "BackpressurePolicy", "OverflowPolicy", "TypioError", "type_print", "typestyle",
+    "TypioContext", "async_type_print", "AsyncTypioContext", "TypioEngine", "TypioHandle", "TypioRenderer",
+    "TypioRegion", "TypioServer", "TypioLogHandler", "type_print_stream", "async_type_print_stream",
+    "type_print_file", "type_print_cast", "TypioCast", "type_print_many", "TypioJob", "TypioResult", "TypioControl",
+    "set_speed", "get_speed", "VirtualClock", "TypioStats", "TypioSink", "TypioPlan", "compile_plan",
+    "plan_cache_info", "plan_cache_clear", "register_mode", "set_numpy", "get_numpy"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the server and logging handler on first use, so asyncio and logging are not loaded at import time.
+
+    :param name: attribute name
+    """
+    if name in _LAZY_MODULES:
+        return getattr(import_module("." + _LAZY_MODULES[name], __name__), name)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
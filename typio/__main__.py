@@ -1,5 +1,206 @@
 # -*- coding: utf-8 -*-
 """typio main."""
+import os
+import sys
+import argparse
+from itertools import chain
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from .params import TYPIO_VERSION, TypeMode, JitterDistribution, FILE_CHUNK_SIZE, SERVER_BUFFER_LIMIT
+from .errors import TypioError
+from .functions import type_print, type_print_stream, type_print_file, TypioControl
+from .functions import _MODES, _read_chunks, _resolve_mode, _validate
+
+
+def _read_stdin() -> Iterator[bytes]:
+    """Read stdin in chunks as soon as they arrive."""
+    fd = sys.stdin.fileno()
+    return iter(lambda: os.read(fd, FILE_CHUNK_SIZE), b"")
+
+
+async def _read_stdin_async() -> AsyncIterator[bytes]:
+    """Read stdin in chunks without blocking the event loop."""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+    while True:
+        chunk = await loop.run_in_executor(None, os.read, fd, FILE_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _mode(name: str) -> Any:
+    """
+    Resolve a mode name, ignoring the case of built-in mode names.
+
+    :param name: mode name
+    """
+    if isinstance(_MODES.get(name.lower()), TypeMode):
+        name = name.lower()
+    return _resolve_mode(name)
+
+
+def _options(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Return the typing options of the parsed arguments.
+
+    :param args: parsed arguments
+    """
+    return {
+        "delay": args.delay,
+        "jitter": args.jitter,
+        "distribution": JitterDistribution[args.distribution.upper()],
+        "mode": _mode(args.mode),
+        "max_fps": args.max_fps,
+        "control": TypioControl(args.speed),
+        "seed": args.seed,
+    }
+
+
+def _passthrough(args: argparse.Namespace) -> None:
+    """
+    Copy the input to stdout without typing effects.
+
+    :param args: parsed arguments
+    """
+    import shutil
+    out = sys.stdout.buffer
+    if args.text:
+        out.write((" ".join(args.text) + args.end).encode())
+    elif args.file:
+        for path in args.file:
+            with open(path, "rb") as source:
+                shutil.copyfileobj(source, out, FILE_CHUNK_SIZE)
+        out.write(args.end.encode())
+    else:
+        for chunk in _read_stdin():
+            out.write(chunk)
+            out.flush()
+        out.write(args.end.encode())
+    out.flush()
+
+
+def _animate(args: argparse.Namespace) -> None:
+    """
+    Print the input with typing effects.
+
+    :param args: parsed arguments
+    """
+    options = _options(args)
+    options["animate"] = True
+    if args.text:
+        type_print(" ".join(args.text), end=args.end, **options)
+    elif args.file:
+        for index, path in enumerate(args.file):
+            type_print_file(path, end=args.end if index == len(args.file) - 1 else "", **options)
+    else:
+        type_print_stream(_read_stdin(), end=args.end, **options)
+
+
+async def _broadcast(args: argparse.Namespace) -> None:
+    """
+    Type the input once and fan it out to the clients of a typing server.
+
+    :param args: parsed arguments
+    """
+    from .server import TypioServer
+    async with TypioServer(buffer_limit=args.buffer_limit, **_options(args)) as server:
+        if args.http_port is None or args.tcp_port is not None:
+            host, port = await server.listen_tcp(args.host, args.tcp_port or 0)
+            print("typio: listening on tcp://{0}:{1}".format(host, port), file=sys.stderr, flush=True)
+        if args.http_port is not None:
+            host, port = await server.listen_http(args.host, args.http_port)
+            print("typio: listening on http://{0}:{1}".format(host, port), file=sys.stderr, flush=True)
+        await server.wait_for_clients(args.clients)
+        if args.text:
+            await server.broadcast(" ".join(args.text), end=args.end)
+        elif args.file:
+            await server.broadcast_stream(chain.from_iterable(_read_chunks(path) for path in args.file), end=args.end)
+        else:
+            await server.broadcast_stream(_read_stdin_async(), end=args.end)
+
+
+def _add_typing_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the input and typing options to a parser.
+
+    :param parser: argument parser
+    """
+    parser.add_argument("text", nargs="*", type=str, help="text to print (stdin is used if no text or file is given)")
+    parser.add_argument("-f", "--file", action="append", type=str, help="file to print (can be repeated)")
+    parser.add_argument(
+        "-m", "--mode", type=str, default="char",
+        help="typing mode: {0} or a registered mode name".format(", ".join(mode.value for mode in TypeMode)))
+    parser.add_argument("-d", "--delay", type=float, default=0.04, help="base delay (in seconds) between units")
+    parser.add_argument("-j", "--jitter", type=float, default=0, help="random jitter added/subtracted from delay")
+    parser.add_argument(
+        "--distribution", type=str.lower, default="uniform",
+        choices=[distribution.name.lower() for distribution in JitterDistribution], help="jitter distribution")
+    parser.add_argument("-s", "--speed", type=float, default=1, help="speed multiplier (0 means instant)")
+    parser.add_argument("--max-fps", type=float, help="maximum number of rendered frames per second")
+    parser.add_argument("--seed", type=int, help="seed of the jitter random number generator")
+    parser.add_argument("--end", type=str, default="\n", help="end character(s)")
+
+
+def _serve(argv: List[str]) -> int:
+    """
+    CLI serve command.
+
+    :param argv: command line arguments after `serve`
+    """
+    parser = argparse.ArgumentParser(
+        prog="typio serve",
+        description="Type text, files or stdin once and stream it to TCP, SSE and WebSocket clients.")
+    _add_typing_arguments(parser)
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="host to bind")
+    parser.add_argument("--tcp-port", type=int, help="raw TCP port (0 picks a free port)")
+    parser.add_argument("--http-port", type=int, help="HTTP port for SSE and WebSocket clients (0 picks a free port)")
+    parser.add_argument("--clients", type=int, default=1, help="number of clients to wait for before typing")
+    parser.add_argument(
+        "--buffer-limit", type=int, default=SERVER_BUFFER_LIMIT,
+        help="maximum number of unsent characters of a client before it is dropped")
+    args = parser.parse_args(argv)
+    import asyncio
+    try:
+        asyncio.run(_broadcast(args))
+    except (TypioError, OSError) as e:
+        print("Error: {0}".format(e), file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    CLI main function.
+
+    :param argv: command line arguments
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["serve"]:
+        return _serve(argv[1:])
+    parser = argparse.ArgumentParser(
+        prog="typio",
+        description="Print text, files or stdin with typing effects (use `typio serve` to stream to clients).")
+    _add_typing_arguments(parser)
+    parser.add_argument("--force", action="store_true", help="animate even when stdout is not a terminal")
+    parser.add_argument("-v", "--version", action="version", version=TYPIO_VERSION)
+    args = parser.parse_args(argv)
+    try:
+        _validate("", end=args.end, file=None, **_options(args))
+        if args.force or sys.stdout.isatty():
+            _animate(args)
+        else:
+            _passthrough(args)
+    except (TypioError, OSError) as e:
+        print("Error: {0}".format(e), file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
 
 if __name__ == "__main__":
-    pass
+    sys.exit(main())
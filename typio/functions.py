@@ -1,17 +1,45 @@
 # -*- coding: utf-8 -*-
 """typio functions."""
 
+import os
 import sys
 import time
+import heapq
+import threading
+from array import array
+from collections import deque, namedtuple, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 import random
 import re
+import codecs
+import bisect
+import math
+import select
 from functools import wraps
-from io import TextIOBase
-from typing import Any, Callable, Optional, Union
-from .params import TypeMode
+from itertools import repeat
+from io import StringIO, TextIOBase, RawIOBase, BufferedIOBase
+from typing import Any, AsyncIterable, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from typing import Union
+from .params import TypeMode, JitterDistribution, BackpressurePolicy
+from .params import SPIN_THRESHOLD_NS, ENGINE_LATENESS_HISTORY
+from .params import PLAN_CACHE_SIZE, PLAN_CACHE_BYTES, PLAN_CACHE_TEXT_LIMIT
+from .params import SPEED_ENV, LATENESS_BUCKETS, FILE_CHUNK_SIZE
+from .params import JITTER_BLOCK_SIZE, JITTER_SIGMA_LIMIT, MODE_ENTRY_POINT_GROUP
+from .params import SINK_BUFFER_LIMIT, SINK_POLL_INTERVAL
+from .params import CAST_VERSION
 from .params import INVALID_TEXT_ERROR, INVALID_BYTE_ERROR, INVALID_DELAY_ERROR
 from .params import INVALID_JITTER_ERROR, INVALID_MODE_ERROR, INVALID_FILE_ERROR
-from .params import INVALID_END_ERROR
+from .params import INVALID_END_ERROR, INVALID_MAX_FPS_ERROR, INVALID_ENGINE_ERROR
+from .params import ENGINE_CLOSED_ERROR, INVALID_PLAN_MODE_ERROR, INVALID_STREAM_ERROR
+from .params import INVALID_SPEED_ERROR, INVALID_CONTROL_ERROR, INVALID_CLOCK_ERROR
+from .params import INVALID_SLEEPER_ERROR, INVALID_SEED_ERROR, INVALID_RNG_ERROR, INVALID_STATS_ERROR
+from .params import INVALID_ASYNC_SLEEPER_ERROR
+from .params import INVALID_SOURCE_ERROR, INVALID_ANIMATE_ERROR, INVALID_HEIGHT_ERROR, INVALID_WIDTH_ERROR
+from .params import INVALID_DISTRIBUTION_ERROR, INVALID_MODE_NAME_ERROR, INVALID_BUFFER_LIMIT_ERROR
+from .params import INVALID_POLICY_ERROR, INVALID_CAST_ERROR, INVALID_JOB_ERROR, INVALID_JOB_DESTINATION_ERROR
+from .params import INVALID_JOB_MODE_ERROR, INVALID_WORKERS_ERROR, INVALID_CHUNKSIZE_ERROR
+from .params import INVALID_NUMPY_ERROR, MISSING_NUMPY_ERROR
 from .errors import TypioError
 
 
@@ -22,6 +50,16 @@ def _validate(
     mode: Any,
     end: Any,
     file: Any,
+    max_fps: Any = None,
+    engine: Any = None,
+    control: Any = None,
+    clock: Any = None,
+    sleeper: Any = None,
+    seed: Any = None,
+    rng: Any = None,
+    stats: Any = None,
+    animate: Any = "auto",
+    distribution: Any = JitterDistribution.UNIFORM,
 ) -> str:
     """
     Validate and normalize inputs for typing operations.
@@ -32,6 +70,16 @@ def _validate(
     :param mode: typing mode controlling emission granularity
     :param end: end character(s)
     :param file: output stream supporting a write() method
+    :param max_fps: maximum number of rendered frames per second
+    :param engine: engine driving the typing session
+    :param control: runtime speed control
+    :param clock: function returning the current time (in nanoseconds)
+    :param sleeper: function blocking for a given number of seconds
+    :param seed: seed of the jitter random number generator
+    :param rng: random number generator of the jitter
+    :param stats: statistics collector
+    :param animate: typing effects policy
+    :param distribution: jitter distribution
     """
     if not isinstance(text, (str, bytes)):
         raise TypioError(INVALID_TEXT_ERROR)
@@ -48,6 +96,7 @@ def _validate(
     if not isinstance(jitter, (int, float)) or jitter < 0:
         raise TypioError(INVALID_JITTER_ERROR)
 
+    mode = _resolve_mode(mode)
     if not isinstance(mode, TypeMode) and not callable(mode):
         raise TypioError(INVALID_MODE_ERROR)
 
@@ -55,15 +104,1368 @@ def _validate(
         raise TypioError(INVALID_END_ERROR)
 
     if file is not None and not hasattr(file, "write"):
-        raise TypioError(INVALID_FILE_ERROR)
+        if not isinstance(file, int) or isinstance(file, bool):
+            raise TypioError(INVALID_FILE_ERROR)
+        try:
+            os.fstat(file)
+        except (OSError, OverflowError):
+            raise TypioError(INVALID_FILE_ERROR)
+
+    if max_fps is not None:
+        if not isinstance(max_fps, (int, float)) or max_fps <= 0:
+            raise TypioError(INVALID_MAX_FPS_ERROR)
+
+    if engine is not None and not isinstance(engine, TypioEngine):
+        raise TypioError(INVALID_ENGINE_ERROR)
+
+    if control is not None and not isinstance(control, TypioControl):
+        raise TypioError(INVALID_CONTROL_ERROR)
+
+    if clock is not None and not callable(clock):
+        raise TypioError(INVALID_CLOCK_ERROR)
+
+    if sleeper is not None and not callable(sleeper):
+        raise TypioError(INVALID_SLEEPER_ERROR)
+
+    if seed is not None and not isinstance(seed, (int, float, str, bytes, bytearray)):
+        raise TypioError(INVALID_SEED_ERROR)
+
+    if rng is not None and not isinstance(rng, random.Random):
+        raise TypioError(INVALID_RNG_ERROR)
+
+    if stats is not None and not isinstance(stats, TypioStats):
+        raise TypioError(INVALID_STATS_ERROR)
+    if not isinstance(animate, bool) and animate != "auto":
+        raise TypioError(INVALID_ANIMATE_ERROR)
+    if not isinstance(distribution, JitterDistribution):
+        raise TypioError(INVALID_DISTRIBUTION_ERROR)
     text = f"{text}{end}"
     return text
 
 
-class _TypioPrinter:
-    """File-like object that emits text with typing effects."""
+_MODES = {mode.value: mode for mode in TypeMode}
+_MODES_LOCK = threading.Lock()
+
+
+def register_mode(name: str, mode: Optional[Callable] = None) -> Callable:
+    """
+    Register a custom typing mode under a name; can be used as a decorator.
+
+    :param name: mode name
+    :param mode: custom typing mode
+    """
+    if not isinstance(name, str) or not name:
+        raise TypioError(INVALID_MODE_NAME_ERROR)
+
+    def decorator(mode: Callable) -> Callable:
+        if not callable(mode):
+            raise TypioError(INVALID_MODE_ERROR)
+        with _MODES_LOCK:
+            _MODES[name] = mode
+        return mode
+
+    if mode is None:
+        return decorator
+    return decorator(mode)
+
+
+def _load_mode(name: str) -> Optional[Callable]:
+    """
+    Load a custom typing mode from the entry points of installed packages.
+
+    :param name: mode name
+    """
+    from importlib.metadata import entry_points
+    points = entry_points()
+    if hasattr(points, "select"):
+        points = points.select(group=MODE_ENTRY_POINT_GROUP, name=name)
+    else:
+        points = [point for point in points.get(MODE_ENTRY_POINT_GROUP, []) if point.name == name]
+    for point in points:
+        try:
+            return point.load()
+        except Exception:
+            raise TypioError(INVALID_MODE_ERROR)
+    return None
+
+
+def _resolve_mode(mode: Any) -> Union[TypeMode, Callable]:
+    """
+    Resolve a mode name to a built-in, registered or entry point typing mode.
+
+    :param mode: typing mode or mode name
+    """
+    if not isinstance(mode, str):
+        return mode
+    resolved = _MODES.get(mode)
+    if resolved is None:
+        resolved = _load_mode(mode)
+        if not callable(resolved):
+            raise TypioError(INVALID_MODE_ERROR)
+        with _MODES_LOCK:
+            resolved = _MODES.setdefault(mode, resolved)
+    return resolved
+
+
+_WORD_PATTERN = re.compile(r"\S+|\s+")
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_PATTERN = re.compile("[^{0}]*(?:\r\n|[{0}])|[^{0}]+".format(_LINE_BREAKS))
+_SENTENCE_PATTERN = re.compile(r"([^.!?]{1,4096})|([.!?]+)")
+_TYPEWRITER_PATTERN = re.compile(r"([^\n]{1,4096})|(\n+)")
+_ADAPTIVE_PATTERN = re.compile(r"([^\W_]{1,4096})|(\s{1,4096})|((?:[^\w\s]|_){1,4096})")
+
+
+def _split_runs(text: str, pattern: re.Pattern, factors: Tuple[float, ...]) -> Iterator[Tuple[str, float]]:
+    """
+    Split text character by character, classifying bounded runs of characters at once.
+
+    :param text: text to split
+    :param pattern: pattern whose n-th group matches a run of the n-th character class
+    :param factors: delay factor of each character class
+    """
+    for match in pattern.finditer(text):
+        factor = factors[match.lastindex - 1]
+        for c in match.group():
+            yield c, factor
+
+
+def _split_char(text: str) -> Iterator[Tuple[str, float]]:
+    """
+    Split text character by character.
+
+    :param text: text to split
+    """
+    return zip(text, repeat(1))
+
+
+def _split_word(text: str) -> Iterator[Tuple[str, float]]:
+    """
+    Split text word by word, preserving whitespace.
+
+    :param text: text to split
+    """
+    for match in _WORD_PATTERN.finditer(text):
+        yield match.group(), 1
+
+
+def _split_line(text: str) -> Iterator[Tuple[str, float]]:
+    """
+    Split text line by line, on the same boundaries as str.splitlines.
+
+    :param text: text to split
+    """
+    for match in _LINE_PATTERN.finditer(text):
+        yield match.group(), 1
+
+
+def _split_sentence(text: str) -> Iterator[Tuple[str, float]]:
+    """
+    Split text character by character with longer pauses after sentence-ending punctuation.
+
+    :param text: text to split
+    """
+    return _split_runs(text, _SENTENCE_PATTERN, (1, 5))
+
+
+def _split_typewriter(text: str) -> Iterator[Tuple[str, float]]:
+    """
+    Split text character by character with longer pauses after newlines.
+
+    :param text: text to split
+    """
+    return _split_runs(text, _TYPEWRITER_PATTERN, (1, 6))
+
+
+def _split_adaptive(text: str) -> Iterator[Tuple[str, float]]:
+    """
+    Split text with adaptive delays based on character type.
+
+    :param text: text to split
+    """
+    return _split_runs(text, _ADAPTIVE_PATTERN, (1, 0.3, 1.5))
+
+
+_TOKENIZERS = {
+    TypeMode.CHAR: _split_char,
+    TypeMode.WORD: _split_word,
+    TypeMode.LINE: _split_line,
+    TypeMode.SENTENCE: _split_sentence,
+    TypeMode.TYPEWRITER: _split_typewriter,
+    TypeMode.ADAPTIVE: _split_adaptive,
+}
+
+
+class _ChunkTokenizer:
+    """Incremental decoder and tokenizer that keeps units split across chunk boundaries together."""
+
+    def __init__(self, mode: Union[TypeMode, Callable]) -> None:
+        """
+        Initialize the tokenizer.
+
+        :param mode: typing mode controlling emission granularity
+        """
+        self._mode = mode
+        self._split = _TOKENIZERS.get(mode)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+
+    def decode(self, chunk: Any, final: bool = False) -> str:
+        """
+        Validate a chunk and decode it to text.
+
+        :param chunk: str or bytes chunk
+        :param final: last chunk flag
+        """
+        if isinstance(chunk, str):
+            return chunk
+        if not isinstance(chunk, bytes):
+            raise TypioError(INVALID_TEXT_ERROR)
+        try:
+            return self._decoder.decode(chunk, final)
+        except UnicodeDecodeError:
+            raise TypioError(INVALID_BYTE_ERROR)
+
+    def feed(self, text: str, final: bool = False) -> Iterable[Tuple[str, float]]:
+        """
+        Split text into units, holding back a trailing unit that the next chunk may continue.
+
+        :param text: decoded text
+        :param final: last chunk flag
+        """
+        if self._mode not in (TypeMode.WORD, TypeMode.LINE):
+            return self._split(text)
+        units = list(self._split(self._buffer + text))
+        self._buffer = ""
+        if units and not final and not self._complete(units[-1][0]):
+            self._buffer = units.pop()[0]
+        return units
+
+    def _complete(self, part: str) -> bool:
+        """
+        Check whether a trailing unit is complete.
+
+        :param part: trailing unit
+        """
+        if self._mode == TypeMode.WORD:
+            return False
+        return not part.endswith("\r") and part.splitlines() != [part]
+
+
+class TypioPlan:
+    """Compiled emission schedule of a text: unit boundaries and their delay factors."""
+
+    __slots__ = ("text", "offsets", "factors", "delay")
+
+    def __init__(self, text: str, offsets: array, factors: Sequence[float], delay: float) -> None:
+        """
+        Initialize the plan.
+
+        :param text: planned text
+        :param offsets: unit boundary offsets (one more than the number of units)
+        :param factors: sequence of the delay factor of each unit
+        :param delay: base delay (in seconds) between emitted units
+        """
+        self.text = text
+        self.offsets = offsets
+        self.factors = factors
+        self.delay = delay
+
+    def __len__(self) -> int:
+        """Return the number of units."""
+        return len(self.factors)
+
+    def __iter__(self) -> Iterator[Tuple[str, float]]:
+        """Iterate over (fragment, delay factor) units."""
+        text, offsets = self.text, self.offsets
+        for i, factor in enumerate(self.factors):
+            yield text[offsets[i]:offsets[i + 1]], factor
+
+    @property
+    def delays(self) -> List[float]:
+        """Nominal delay (in seconds) after each unit."""
+        return [self.delay * factor for factor in self.factors]
+
+    @property
+    def duration(self) -> float:
+        """Return the nominal duration of the whole plan in seconds."""
+        return self.delay * sum(self.factors)
+
+
+PlanCacheInfo = namedtuple("PlanCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _PlanFactors:
+    """Compact delay factors: one small class id per unit into a table of the distinct factors."""
+
+    __slots__ = ("ids", "table")
+
+    def __init__(self, ids: array, table: Tuple[float, ...]) -> None:
+        """
+        Initialize the factors.
+
+        :param ids: class id of each unit
+        :param table: distinct delay factors indexed by class id
+        """
+        self.ids = ids
+        self.table = table
+
+    def __len__(self) -> int:
+        """Return the number of units."""
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> float:
+        """
+        Return the delay factor of a unit.
+
+        :param index: unit index
+        """
+        return self.table[self.ids[index]]
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the delay factors of the units."""
+        table = self.table
+        return (table[i] for i in self.ids)
+
+
+class _PlanCache:
+    """LRU cache of compiled plans keyed by text, mode and the delay of custom modes, bounded by count and size."""
+
+    def __init__(self, maxsize: int, maxbytes: int, text_limit: int) -> None:
+        """
+        Initialize the cache.
+
+        :param maxsize: maximum number of cached plans
+        :param maxbytes: maximum total size (in bytes) of cached texts and plan arrays
+        :param text_limit: maximum length of cached texts
+        """
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._text_limit = text_limit
+        self._plans = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, text: str, mode: Union[TypeMode, Callable], delay: float = 0) -> TypioPlan:
+        """
+        Return the plan of a text, compiling it on a cache miss.
+
+        :param text: text to plan
+        :param mode: built-in or declarative custom typing mode
+        :param delay: base delay (in seconds) between emitted units
+        """
+        key = (text, mode) if isinstance(mode, TypeMode) else (text, mode, delay)
+        with self._lock:
+            entry = self._plans.get(key)
+            if entry is not None:
+                self._plans.move_to_end(key)
+                self._hits += 1
+                return TypioPlan(entry[2], entry[0], entry[1], delay)
+            self._misses += 1
+        if isinstance(mode, TypeMode):
+            units = _TOKENIZERS[mode](text)
+        else:
+            units = list(_declarative_units(mode, text, delay))
+            text = "".join(part for part, _ in units)
+        offsets = array("I" if len(text) <= 0xFFFFFFFF else "q", [0])
+        ids = array("I")
+        table = {}
+        position = 0
+        for part, factor in units:
+            position += len(part)
+            offsets.append(position)
+            ids.append(table.setdefault(factor, len(table)))
+        if len(table) <= 0x100:
+            ids = array("B", ids)
+        elif len(table) <= 0x10000:
+            ids = array("H", ids)
+        factors = _PlanFactors(ids, tuple(table))
+        if len(text) <= self._text_limit:
+            self._store(key, (offsets, factors, text))
+        return TypioPlan(text, offsets, factors, delay)
+
+    def _store(self, key: Tuple[Any, ...], entry: Tuple[array, _PlanFactors, str]) -> None:
+        """
+        Cache a plan, evicting the least recently used plans until the cache is within its bounds.
+
+        :param key: text, mode and the delay of custom modes
+        :param entry: offsets, factors and planned text
+        """
+        size = _entry_size(key, entry)
+        if size > self._maxbytes:
+            return
+        with self._lock:
+            if key in self._plans:
+                return
+            self._plans[key] = entry
+            self._bytes += size
+            while len(self._plans) > self._maxsize or self._bytes > self._maxbytes:
+                self._bytes -= _entry_size(*self._plans.popitem(last=False))
+
+    def info(self) -> PlanCacheInfo:
+        """Return cache statistics."""
+        with self._lock:
+            return PlanCacheInfo(self._hits, self._misses, self._maxsize, len(self._plans))
+
+    def clear(self) -> None:
+        """Remove all cached plans and reset the statistics."""
+        with self._lock:
+            self._plans.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+
+def _entry_size(key: Tuple[Any, ...], entry: Tuple[array, _PlanFactors, str]) -> int:
+    """
+    Return the approximate size (in bytes) of a plan cache entry.
+
+    :param key: text, mode and the delay of custom modes
+    :param entry: offsets, factors and planned text
+    """
+    offsets, factors, text = entry
+    size = sys.getsizeof(key[0]) + offsets.itemsize * len(offsets) + factors.ids.itemsize * len(factors.ids)
+    if text is not key[0]:
+        size += sys.getsizeof(text)
+    return size
+
+
+_PLAN_CACHE = _PlanCache(PLAN_CACHE_SIZE, PLAN_CACHE_BYTES, PLAN_CACHE_TEXT_LIMIT)
+
+
+def _declarative_units(mode: Callable, text: str, delay: float) -> Iterable[Tuple[str, float]]:
+    """
+    Return the units of a declarative custom mode.
+
+    :param mode: declarative custom mode
+    :param text: text to split
+    :param delay: base delay (in seconds) between emitted units
+    """
+    import inspect
+    recorder = _TypioRecorder(delay=delay, jitter=0, mode=mode, out=None)
+    units = recorder.write(text)
+    if units is None or recorder.ops or inspect.isawaitable(units) or hasattr(units, "__aiter__"):
+        raise TypioError(INVALID_PLAN_MODE_ERROR)
+    return units
+
+
+def compile_plan(
+        text: Union[str, bytes],
+        mode: Union[TypeMode, Callable] = TypeMode.CHAR,
+        delay: float = 0.04) -> TypioPlan:
+    """
+    Compile text into an emission plan of a built-in or declarative custom typing mode.
+
+    :param text: text to plan
+    :param mode: built-in or declarative custom typing mode controlling emission granularity
+    :param delay: base delay (in seconds) between emitted units
+    """
+    mode = _resolve_mode(mode)
+    if not isinstance(mode, TypeMode) and not callable(mode):
+        raise TypioError(INVALID_PLAN_MODE_ERROR)
+    text = _validate(text, delay, 0, mode, "", None)
+    return _PLAN_CACHE.get(text, mode, delay)
+
+
+def plan_cache_info() -> PlanCacheInfo:
+    """Return hit, miss and size statistics of the plan cache."""
+    return _PLAN_CACHE.info()
+
+
+def plan_cache_clear() -> None:
+    """Clear the plan cache and its statistics."""
+    _PLAN_CACHE.clear()
+
+
+def _validate_sleep(delay: Any, jitter: Any) -> None:
+    """
+    Validate sleep overrides of custom typing modes.
+
+    :param delay: base delay (in seconds) override
+    :param jitter: random jitter override
+    """
+    if delay is not None:
+        if not isinstance(delay, (int, float)) or delay < 0:
+            raise TypioError(INVALID_DELAY_ERROR)
+
+    if jitter is not None:
+        if not isinstance(jitter, (int, float)) or jitter < 0:
+            raise TypioError(INVALID_JITTER_ERROR)
+
+
+def _validate_async_sleeper(sleeper: Any) -> None:
+    """
+    Validate the sleeper of asynchronous typing operations, which must not block the event loop.
+
+    :param sleeper: coroutine function suspending for a given number of seconds
+    """
+    import inspect
+    if sleeper is not None and not any(
+            inspect.iscoroutinefunction(func) for func in (sleeper, getattr(sleeper, "__call__", None))):
+        raise TypioError(INVALID_ASYNC_SLEEPER_ERROR)
+
+
+def _read_speed(value: Optional[str]) -> float:
+    """
+    Parse a speed multiplier from an environment variable value.
+
+    :param value: environment variable value
+    """
+    try:
+        speed = float(value)
+    except (TypeError, ValueError):
+        return 1
+    if speed < 0 or speed != speed:
+        return 1
+    return speed
+
+
+_SPEED = _read_speed(os.environ.get(SPEED_ENV))
+
+
+def set_speed(speed: float) -> None:
+    """
+    Set the process-wide speed multiplier of all typing animations.
+
+    :param speed: speed multiplier (0 means instant)
+    """
+    global _SPEED
+    if not isinstance(speed, (int, float)) or speed < 0:
+        raise TypioError(INVALID_SPEED_ERROR)
+    _SPEED = speed
+
+
+def get_speed() -> float:
+    """Return the process-wide speed multiplier."""
+    return _SPEED
+
+
+class TypioControl:
+    """Runtime handle that fast-forwards or skips the animations it is attached to."""
+
+    def __init__(self, speed: float = 1) -> None:
+        """
+        Initialize the control.
+
+        :param speed: initial speed multiplier (0 means instant)
+        """
+        if not isinstance(speed, (int, float)) or speed < 0:
+            raise TypioError(INVALID_SPEED_ERROR)
+        self._speed = speed
+        self._skipped = threading.Event()
+        self._wakers = set()
+
+    def fast_forward(self, factor: float = 2) -> None:
+        """
+        Multiply the speed of the attached animations.
+
+        :param factor: speed factor
+        """
+        if not isinstance(factor, (int, float)) or factor < 0:
+            raise TypioError(INVALID_SPEED_ERROR)
+        self._speed *= factor
+        if self._speed == 0:
+            self.skip()
+
+    def skip(self) -> None:
+        """Write the rest of the attached animations immediately; safe to call from signal handlers."""
+        self._skipped.set()
+        for wake in list(self._wakers):
+            wake()
+
+    @property
+    def speed(self) -> float:
+        """Speed multiplier property."""
+        return self._speed
+
+    @property
+    def skipped(self) -> bool:
+        """Skipped flag property."""
+        return self._skipped.is_set() or self._speed == 0
+
+    def _wait(self, timeout: float) -> None:
+        """
+        Block for a given time or until the animation is skipped.
+
+        :param timeout: time (in seconds) to block
+        """
+        self._skipped.wait(timeout)
+
+    async def _async_wait(self, timeout: float) -> None:
+        """
+        Suspend the current task for a given time or until the animation is skipped.
+
+        :param timeout: time (in seconds) to suspend
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        skipped = asyncio.Event()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(skipped.set)
+        self._wakers.add(wake)
+        try:
+            if not self._skipped.is_set():
+                await asyncio.wait_for(skipped.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._wakers.discard(wake)
+
+
+def _blocking(target: Union[BinaryIO, int]) -> bool:
+    """
+    Check whether writes to a binary stream or file descriptor block until they complete.
+
+    :param target: binary stream or file descriptor
+    """
+    try:
+        return os.get_blocking(target if isinstance(target, int) else target.fileno())
+    except (AttributeError, ValueError, OSError):
+        return True
+
+
+class _ByteSink:
+    """Output adapter for binary streams and file descriptors that encodes text once and writes slices of it."""
+
+    def __init__(
+            self,
+            target: Union[BinaryIO, int],
+            policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+            buffer_limit: int = SINK_BUFFER_LIMIT) -> None:
+        """
+        Initialize the byte sink.
+
+        :param target: binary stream or file descriptor
+        :param policy: what the printer does when the target cannot keep up
+        :param buffer_limit: maximum number of bytes queued for a non-blocking target
+        """
+        self._target = target
+        self._fd = target if isinstance(target, int) else None
+        self._text = None
+        self._view = None
+        self._policy = policy
+        self._limit = buffer_limit
+        self._buffer = bytearray()
+        self._nonblocking = not _blocking(target)
+        self._blocked = 0
+
+    @property
+    def policy(self) -> BackpressurePolicy:
+        """Backpressure policy of the sink."""
+        return self._policy
+
+    @property
+    def backlog(self) -> int:
+        """Number of bytes queued because the target could not take them yet."""
+        return len(self._buffer)
+
+    @property
+    def blocked(self) -> float:
+        """Total time (in seconds) spent waiting for the target to accept queued bytes."""
+        return self._blocked / 1e9
+
+    def load(self, text: Optional[str]) -> None:
+        """
+        Encode the text about to be written, whose consecutive fragments are then written as buffer slices.
+
+        :param text: text about to be written, None to release it
+        """
+        if text is None:
+            self._text = self._view = None
+            return
+        data = text.encode("utf-8")
+        self._text = None if len(data) == len(text) else text
+        self._view = memoryview(data)
+        self._char = 0
+        self._byte = 0
+
+    def write(self, text: str) -> None:
+        """
+        Write a fragment of the loaded text as a zero-copy slice, or encode a fragment of any other text.
+
+        :param text: text fragment
+        """
+        if self._view is None:
+            self._send(text.encode("utf-8"))
+            return
+        size = len(text)
+        if self._text is not None:
+            size = len(self._text[self._char:self._char + size].encode("utf-8"))
+            self._char += len(text)
+        start = self._byte
+        self._byte += size
+        self._send(self._view[start:self._byte])
+
+    def flush(self) -> None:
+        """Flush the binary stream, waiting for the queued bytes unless the printer handles backpressure itself."""
+        if self._policy is BackpressurePolicy.BLOCK:
+            self.drain()
+        elif not self.poll() and self._fd is None:
+            try:
+                self._target.flush()
+            except BlockingIOError:
+                pass
+
+    def drain(self) -> None:
+        """Wait until the target has accepted all queued bytes and flush it."""
+        self._wait(0)
+        if self._fd is not None:
+            return
+        while True:
+            try:
+                self._target.flush()
+                return
+            except BlockingIOError:
+                self._select()
+
+    def poll(self) -> int:
+        """Write as many queued bytes as the target accepts without blocking and return the number left."""
+        while self._buffer:
+            written = self._write_some(self._buffer)
+            if not written:
+                break
+            del self._buffer[:written]
+        return len(self._buffer)
+
+    def isatty(self) -> bool:
+        """Check whether the target is an interactive terminal."""
+        if self._fd is not None:
+            return os.isatty(self._fd)
+        return self._target.isatty()
+
+    def _send(self, data: Union[bytes, memoryview]) -> None:
+        """
+        Write bytes to the target, retrying partial writes on file descriptors and queueing them on non-blocking ones.
+
+        :param data: bytes to write
+        """
+        if self._nonblocking or self._buffer:
+            self._queue(data)
+            return
+        try:
+            if self._fd is None:
+                self._target.write(data)
+                return
+            while data:
+                written = os.write(self._fd, data)
+                data = data[written:]
+        except BlockingIOError as e:
+            self._nonblocking = True
+            self._queue(data[getattr(e, "characters_written", 0) if self._fd is None else 0:])
+
+    def _queue(self, data: Union[bytes, memoryview]) -> None:
+        """
+        Queue bytes behind the backlog, waiting for the target while the backlog exceeds the buffer limit.
+
+        :param data: bytes to write
+        """
+        self._buffer += data
+        if self.poll() > self._limit:
+            self._wait(self._limit)
+
+    def _write_some(self, data: bytearray) -> int:
+        """
+        Write bytes without blocking and return how many the target accepted.
+
+        :param data: bytes to write
+        """
+        try:
+            if self._fd is not None:
+                return os.write(self._fd, data)
+            written = self._target.write(data)
+        except BlockingIOError as e:
+            return getattr(e, "characters_written", 0)
+        if written is None:
+            return 0 if isinstance(self._target, RawIOBase) else len(data)
+        return written
+
+    def _wait(self, limit: int) -> None:
+        """
+        Block until the backlog is no larger than a limit.
+
+        :param limit: maximum number of queued bytes
+        """
+        if len(self._buffer) <= limit:
+            return
+        start = time.perf_counter_ns()
+        while self.poll() > limit:
+            self._select()
+        self._blocked += time.perf_counter_ns() - start
+
+    def _select(self) -> None:
+        """Wait until the target is writable, or for a poll interval when it cannot be selected."""
+        try:
+            fd = self._fd if self._fd is not None else self._target.fileno()
+            select.select([], [fd], [], SINK_POLL_INTERVAL)
+        except (AttributeError, ValueError, OSError):
+            time.sleep(SINK_POLL_INTERVAL)
+
+
+class TypioSink(_ByteSink):
+    """Binary output with a bounded queue for non-blocking targets and a policy for pacing slow ones."""
+
+    def __init__(
+            self,
+            target: Union[BinaryIO, TextIOBase, int],
+            *,
+            policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+            buffer_limit: int = SINK_BUFFER_LIMIT) -> None:
+        """
+        Initialize the sink.
+
+        :param target: binary stream, text stream backed by a binary buffer, or file descriptor
+        :param policy: what the printer does when the target cannot keep up: block, drop the pacing or merge units
+        :param buffer_limit: maximum number of bytes queued for a non-blocking target
+        """
+        if not isinstance(policy, BackpressurePolicy):
+            raise TypioError(INVALID_POLICY_ERROR)
+        if not isinstance(buffer_limit, int) or isinstance(buffer_limit, bool) or buffer_limit <= 0:
+            raise TypioError(INVALID_BUFFER_LIMIT_ERROR)
+        if isinstance(target, TextIOBase) and hasattr(target, "buffer"):
+            target.flush()
+            target = target.buffer
+        _validate("", 0, 0, TypeMode.CHAR, "", target)
+        super().__init__(target, policy, buffer_limit)
+
+
+def _output(file: Any) -> Any:
+    """
+    Resolve the output stream of a typing operation, wrapping binary streams and file descriptors.
+
+    :param file: output stream, binary stream, file descriptor or None
+    """
+    if file is None:
+        return sys.stdout
+    if isinstance(file, _ByteSink):
+        return file
+    if isinstance(file, int) or isinstance(file, (RawIOBase, BufferedIOBase)) or "b" in getattr(file, "mode", ""):
+        return _ByteSink(file)
+    return file
+
+
+def _interactive(out: Any) -> bool:
+    """
+    Check whether an output stream is an interactive terminal.
+
+    :param out: output stream
+    """
+    try:
+        return bool(out.isatty())
+    except (AttributeError, ValueError, OSError):
+        return False
+
+
+class TypioStats:
+    """Collector of printer counters and a wake-up lateness histogram; override its hooks to observe printers."""
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self.units = 0
+        self.writes = 0
+        self.flushes = 0
+        self.sleeps = 0
+        self.sleep_requested = 0.0
+        self.sleep_actual = 0.0
+        self.write_blocked = 0.0
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.backlog = 0
+        self.max_backlog = 0
+        self.stalls = 0
+        self.histogram = [0] * (len(LATENESS_BUCKETS) + 1)
+
+    def on_emit(self, fragment: str) -> None:
+        """
+        Count an emitted unit.
+
+        :param fragment: emitted text fragment
+        """
+        self.units += 1
+
+    def on_write(self, text: str, blocked: float) -> None:
+        """
+        Count a write to the underlying output stream.
+
+        :param text: written text
+        :param blocked: time (in seconds) the write blocked
+        """
+        self.writes += 1
+        self.write_blocked += blocked
+
+    def on_flush(self, blocked: float) -> None:
+        """
+        Count a flush of the underlying output stream.
+
+        :param blocked: time (in seconds) the flush blocked
+        """
+        self.flushes += 1
+        self.write_blocked += blocked
+
+    def on_schedule(self, delay: float) -> None:
+        """
+        Count a scheduled delay.
+
+        :param delay: requested delay (in seconds) after jitter and speed
+        """
+        self.sleep_requested += delay
+
+    def on_sleep(self, actual: float, lateness: float) -> None:
+        """
+        Count a wait for a deadline.
+
+        :param actual: time (in seconds) actually waited
+        :param lateness: time (in seconds) the wake-up was late
+        """
+        self.sleeps += 1
+        self.sleep_actual += actual
+        self.lag = lateness
+        self.max_lag = max(self.max_lag, lateness)
+        self.histogram[bisect.bisect_left(LATENESS_BUCKETS, lateness)] += 1
+
+    def on_backlog(self, size: int) -> None:
+        """
+        Record the bytes a non-blocking output could not take yet after a write.
+
+        :param size: number of queued bytes
+        """
+        if size and not self.backlog:
+            self.stalls += 1
+        self.backlog = size
+        self.max_backlog = max(self.max_backlog, size)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all counters and the labelled lateness histogram."""
+        labels = ["<={0}".format(bound) for bound in LATENESS_BUCKETS] + [">{0}".format(LATENESS_BUCKETS[-1])]
+        return {
+            "units": self.units,
+            "writes": self.writes,
+            "flushes": self.flushes,
+            "sleeps": self.sleeps,
+            "sleep_requested": self.sleep_requested,
+            "sleep_actual": self.sleep_actual,
+            "write_blocked": self.write_blocked,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "backlog": self.backlog,
+            "max_backlog": self.max_backlog,
+            "stalls": self.stalls,
+            "lateness_histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+class VirtualClock:
+    """Clock that advances virtual time without blocking and records a timeline of written fragments."""
+
+    def __init__(self, start: float = 0) -> None:
+        """
+        Initialize the clock.
+
+        :param start: start time (in seconds)
+        """
+        self._now = int(start * 1e9)
+        self._lock = threading.Lock()
+        self.timeline = []
+
+    def __call__(self) -> int:
+        """Return the current virtual time (in nanoseconds)."""
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Advance the virtual time.
+
+        :param seconds: time (in seconds) to advance
+        """
+        if seconds > 0:
+            with self._lock:
+                self._now += int(seconds * 1e9)
+
+    def record(self, fragment: str) -> None:
+        """
+        Record a written fragment at the current virtual time.
+
+        :param fragment: written text fragment
+        """
+        self.timeline.append((self._now / 1e9, fragment))
+
+    @property
+    def time(self) -> float:
+        """Return the current virtual time in seconds."""
+        return self._now / 1e9
+
+
+class TypioCast(VirtualClock):
+    """Virtual clock and output stream that writes an asciicast v2 recording at CPU speed."""
+
+    def __init__(
+            self,
+            target: Union[str, bytes, os.PathLike, TextIOBase],
+            *,
+            width: Optional[int] = None,
+            height: Optional[int] = None,
+            title: Optional[str] = None,
+            timestamp: Optional[int] = None,
+            idle_time_limit: Optional[float] = None) -> None:
+        """
+        Initialize the recording and write its header.
+
+        :param target: file path or writable text file of the recording
+        :param width: terminal width (defaults to the current terminal size)
+        :param height: terminal height (defaults to the current terminal size)
+        :param title: recording title
+        :param timestamp: recording start as a Unix timestamp
+        :param idle_time_limit: maximum pause (in seconds) players should keep
+        """
+        import json
+        import shutil
+        self._dumps = json.dumps
+        if width is not None and (not isinstance(width, int) or width <= 0):
+            raise TypioError(INVALID_WIDTH_ERROR)
+        if height is not None and (not isinstance(height, int) or height <= 0):
+            raise TypioError(INVALID_HEIGHT_ERROR)
+        super().__init__()
+        if hasattr(target, "write"):
+            self._file = target
+            self._owned = False
+        else:
+            self._file = open(target, "w", encoding="utf-8")
+            self._owned = True
+        size = shutil.get_terminal_size()
+        header = {"version": CAST_VERSION, "width": width or size.columns, "height": height or size.lines}
+        for name, value in (("timestamp", timestamp), ("idle_time_limit", idle_time_limit), ("title", title)):
+            if value is not None:
+                header[name] = value
+        self._file.write(json.dumps(header) + "\n")
+
+    def record(self, fragment: str) -> None:
+        """
+        Write an output event at the current virtual time.
+
+        :param fragment: written text fragment
+        """
+        if fragment:
+            self._file.write(self._dumps([round(self._now / 1e9, 6), "o", fragment], ensure_ascii=False) + "\n")
+
+    def write(self, text: str) -> int:
+        """
+        Record text written to the emulated terminal.
+
+        :param text: text fragment
+        """
+        self.record(text)
+        return len(text)
+
+    def flush(self) -> None:
+        """Flush the recording file."""
+        self._file.flush()
+
+    def isatty(self) -> bool:
+        """Report an interactive terminal, so printers animate into the recording."""
+        return True
+
+    def close(self) -> None:
+        """Flush the recording and close its file if it was opened from a path."""
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "TypioCast":
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the recording at the end of the runtime context."""
+        self.close()
+
+
+_LEFT_HAND = frozenset("qwertasdfgzxcvb")
+_RIGHT_HAND = frozenset("yuiophjklnm")
+_NUMPY = None
+
+
+def _numpy() -> Any:
+    """Import NumPy on first use, returning False if it is not installed."""
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+            _NUMPY = numpy
+        except ImportError:
+            _NUMPY = False
+    return _NUMPY
+
+
+_USE_NUMPY = False
+
+
+def set_numpy(enabled: bool) -> None:
+    """
+    Enable or disable vectorized jitter sampling with NumPy; seeded timelines differ between the two samplers.
+
+    :param enabled: NumPy flag
+    """
+    global _USE_NUMPY
+    if not isinstance(enabled, bool):
+        raise TypioError(INVALID_NUMPY_ERROR)
+    if enabled and not _numpy():
+        raise TypioError(MISSING_NUMPY_ERROR)
+    _USE_NUMPY = enabled
+
+
+def get_numpy() -> bool:
+    """Return whether jitter sampling is vectorized with NumPy."""
+    return _USE_NUMPY
+
+
+def _bigram_factor(previous: str, current: str) -> float:
+    """
+    Return the relative keystroke interval of a character pair on a QWERTY keyboard.
+
+    :param previous: previous character
+    :param current: current character
+    """
+    if not previous or not current or current.isspace():
+        return 1
+    if previous.isspace():
+        return 1.25
+    if previous == current:
+        return 0.75
+    factor = 1.2 if current.isupper() else 1
+    previous, current = previous.lower(), current.lower()
+    if previous in _LEFT_HAND and current in _RIGHT_HAND or previous in _RIGHT_HAND and current in _LEFT_HAND:
+        return factor * 0.85
+    if (previous in _LEFT_HAND or previous in _RIGHT_HAND) and (current in _LEFT_HAND or current in _RIGHT_HAND):
+        return factor * 1.1
+    return factor * 1.4
+
+
+class _JitterSampler:
+    """Jitter generator that draws random variates in blocks and shapes them into a distribution."""
+
+    def __init__(self, distribution: JitterDistribution, rng: random.Random) -> None:
+        """
+        Initialize the sampler.
+
+        :param distribution: jitter distribution
+        :param rng: random number generator
+        """
+        self._rng = rng
+        self._normal = distribution != JitterDistribution.UNIFORM
+        self._generator = None
+        self._block = []
+        self._previous = ""
+        self.apply = {
+            JitterDistribution.UNIFORM: self._uniform,
+            JitterDistribution.GAUSSIAN: self._gaussian,
+            JitterDistribution.LOGNORMAL: self._lognormal,
+            JitterDistribution.BIGRAM: self._bigram,
+        }[distribution]
+
+    def _variates(self) -> List[float]:
+        """Return the current block of standard uniform (-1, 1) or normal variates, drawing a new one if empty."""
+        if not self._block:
+            self._refill()
+        return self._block
+
+    def _refill(self) -> None:
+        """Draw a block of variates, vectorized with NumPy when it is enabled."""
+        if _USE_NUMPY:
+            numpy = _numpy()
+            if self._generator is None:
+                self._generator = numpy.random.default_rng(self._rng.getrandbits(64))
+            if self._normal:
+                self._block = self._generator.standard_normal(JITTER_BLOCK_SIZE).tolist()
+            else:
+                self._block = self._generator.uniform(-1, 1, JITTER_BLOCK_SIZE).tolist()
+        elif self._normal:
+            self._block = self._normal_block()
+        else:
+            sample = self._rng.random
+            self._block = [2 * sample() - 1 for _ in range(JITTER_BLOCK_SIZE)]
+
+    def _normal_block(self) -> List[float]:
+        """Draw a block of standard normal variates with the Box-Muller transform."""
+        sample, log, sqrt, cos, sin, tau = self._rng.random, math.log, math.sqrt, math.cos, math.sin, math.tau
+        block = []
+        for _ in range(JITTER_BLOCK_SIZE // 2):
+            radius = sqrt(-2 * log(1 - sample()))
+            angle = tau * sample()
+            block.append(radius * cos(angle))
+            block.append(radius * sin(angle))
+        return block
+
+    def _uniform(self, delay: float, jitter: float, part: str) -> float:
+        """
+        Add uniform jitter in [-jitter, jitter] to a delay.
+
+        :param delay: delay (in seconds)
+        :param jitter: jitter (in seconds)
+        :param part: emitted text fragment
+        """
+        delay += jitter * (self._block or self._variates()).pop()
+        return delay if delay > 0 else 0
+
+    def _gaussian(self, delay: float, jitter: float, part: str) -> float:
+        """
+        Add normal jitter with a standard deviation of jitter to a delay.
+
+        :param delay: delay (in seconds)
+        :param jitter: jitter (in seconds)
+        :param part: emitted text fragment
+        """
+        delay += jitter * (self._block or self._variates()).pop()
+        return delay if delay > 0 else 0
+
+    def _lognormal(self, delay: float, jitter: float, part: str) -> float:
+        """
+        Scale a delay by right-skewed log-normal noise with a mean of 1 and a relative spread of jitter/delay.
+
+        :param delay: delay (in seconds)
+        :param jitter: jitter (in seconds)
+        :param part: emitted text fragment
+        """
+        sigma = min(jitter / delay, JITTER_SIGMA_LIMIT)
+        return delay * math.exp(sigma * (self._block or self._variates()).pop() - sigma * sigma / 2)
+
+    def _bigram(self, delay: float, jitter: float, part: str) -> float:
+        """
+        Scale a delay by the keystroke interval of the last character pair, then add log-normal noise.
+
+        :param delay: delay (in seconds)
+        :param jitter: jitter (in seconds)
+        :param part: emitted text fragment
+        """
+        factor = _bigram_factor(self._previous, part[:1])
+        if part:
+            self._previous = part[-1]
+        return self._lognormal(delay * factor, jitter * factor, part)
+
+
+class _Scheduler:
+    """Deadline scheduler that paces emissions on an absolute monotonic timeline."""
+
+    def __init__(
+            self,
+            clock: Callable[[], int] = time.monotonic_ns,
+            sleeper: Callable[[float], Any] = time.sleep) -> None:
+        """
+        Initialize the scheduler.
+
+        :param clock: function returning the current time (in nanoseconds)
+        :param sleeper: function blocking for a given number of seconds
+        """
+        self._clock = clock
+        self._sleeper = sleeper
+        self._spin = SPIN_THRESHOLD_NS if clock is time.monotonic_ns else 0
+        self._deadline = None
+        self._start = 0
+        self._slept = 0
+        self._lag = 0
+        self._error = 0
+
+    def reset(self) -> None:
+        """Anchor the timeline at the current time."""
+        self._deadline = self._clock()
+
+    def catch_up(self) -> None:
+        """Move a deadline that already passed to the current time so missed time is not made up in a burst."""
+        now = self._clock()
+        if self._deadline is None or self._deadline < now:
+            self._deadline = now
+
+    def advance(self, delay: float) -> int:
+        """
+        Move the deadline forward and return it.
+
+        :param delay: delay (in seconds) added to the current deadline
+        """
+        if self._deadline is None:
+            self.reset()
+        self._deadline += int(delay * 1e9)
+        return self._deadline
+
+    def wait(self) -> None:
+        """Block until the current deadline, spin-waiting through its last stretch."""
+        self._start = self._clock()
+        remaining = self._deadline - self._start
+        if remaining > self._spin:
+            self._sleeper((remaining - self._spin) / 1e9)
+        now = self._clock()
+        if self._spin:
+            while 0 < self._deadline - now <= self._spin:
+                now = self._clock()
+        self._settle(now)
+
+    async def async_wait(self) -> None:
+        """Suspend the current task until the current deadline, awaiting the sleeper if it returns an awaitable."""
+        import inspect
+        import asyncio
+        self._start = self._clock()
+        remaining = self._deadline - self._start
+        if remaining > 0:
+            result = self._sleeper(remaining / 1e9)
+            if inspect.isawaitable(result):
+                await result
+            else:
+                await asyncio.sleep(0)
+        self._settle(self._clock())
+
+    def _settle(self, now: int) -> None:
+        """
+        Record the lateness of a wake-up.
+
+        :param now: wake-up time (in nanoseconds)
+        """
+        self._slept = now - self._start
+        self._lag = max(0, now - self._deadline)
+        self._error += self._lag
+
+    @property
+    def deadline(self) -> int:
+        """Return the current deadline in nanoseconds."""
+        return self._deadline
+
+    @property
+    def slept(self) -> float:
+        """Duration (in seconds) of the last wait."""
+        return self._slept / 1e9
 
-    def __init__(self, *, delay: float, jitter: float, mode: Union[TypeMode, Callable], out: TextIOBase) -> None:
+    @property
+    def lag(self) -> float:
+        """Lateness (in seconds) of the last wake-up."""
+        return self._lag / 1e9
+
+    @property
+    def error(self) -> float:
+        """Accumulated lateness (in seconds) of all wake-ups."""
+        return self._error / 1e9
+
+
+class _TypioPrinterBase:
+    """Shared state and unit tokenizers of the typing printers."""
+
+    def __init__(
+            self,
+            *,
+            delay: float,
+            jitter: float,
+            mode: Union[TypeMode, Callable],
+            out: TextIOBase,
+            max_fps: Optional[float] = None,
+            control: Optional["TypioControl"] = None,
+            clock: Optional[Callable[[], int]] = None,
+            sleeper: Optional[Callable[[float], Any]] = None,
+            rng: Optional[random.Random] = None,
+            stats: Optional["TypioStats"] = None,
+            animate: Union[bool, str] = True,
+            distribution: JitterDistribution = JitterDistribution.UNIFORM) -> None:
         """
         Initialize the typing printer.
 
@@ -71,11 +1473,237 @@ class _TypioPrinter:
         :param jitter: random jitter added/subtracted from delay
         :param mode: typing mode controlling emission granularity
         :param out: underlying output stream
+        :param max_fps: maximum number of rendered frames per second
+        :param control: runtime speed control
+        :param clock: function returning the current time (in nanoseconds)
+        :param sleeper: function blocking for a given number of seconds
+        :param rng: random number generator of the jitter
+        :param stats: statistics collector
+        :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
+        :param distribution: jitter distribution
         """
         self._delay = delay
         self._jitter = jitter
-        self._mode = mode
+        self._mode = _resolve_mode(mode)
+        self._custom = callable(self._mode)
+        self._split = _TOKENIZERS.get(self._mode)
         self._out = out
+        self._binary = isinstance(out, _ByteSink)
+        self._pressure = self._binary and out.policy is not BackpressurePolicy.BLOCK
+        self._behind = False
+        self._control = control
+        if clock is None and isinstance(out, TypioCast):
+            clock = out
+        if sleeper is None:
+            sleeper = self._default_sleeper(clock, control)
+        self._scheduler = _Scheduler(clock or time.monotonic_ns, sleeper)
+        self._record = clock.record if isinstance(clock, VirtualClock) and clock is not out else None
+        self._rng = rng or random.Random()
+        self._jitter_sample = _JitterSampler(distribution, self._rng).apply
+        self._part = ""
+        self._stats = stats
+        self._frame = int(1e9 / max_fps) if max_fps else 0
+        self._frame_end = 0
+        self._pending = []
+        self._animate = _interactive(out) if animate == "auto" else animate
+
+    @property
+    def timing_error(self) -> float:
+        """Accumulated timing error (in seconds) of the scheduler."""
+        return self._scheduler.error
+
+    def _default_sleeper(self, clock: Any, control: Optional["TypioControl"]) -> Callable[[float], Any]:
+        """
+        Return the sleeper used when none is given: the virtual clock, the control or a blocking sleep.
+
+        :param clock: function returning the current time (in nanoseconds)
+        :param control: runtime speed control
+        """
+        if hasattr(clock, "sleep"):
+            return clock.sleep
+        if control is not None:
+            return control._wait
+        return time.sleep
+
+    def flush(self) -> None:
+        """Flush the underlying output stream and wait until a byte sink has written everything."""
+        self._render()
+        self._flush()
+        if self._binary:
+            self._out.drain()
+            self._behind = False
+
+    @property
+    def _speed(self) -> float:
+        """Effective speed multiplier of the printer."""
+        if not self._animate or self._behind:
+            return 0
+        if self._control is None:
+            return _SPEED
+        if self._control.skipped:
+            return 0
+        return _SPEED * self._control.speed
+
+    def _schedule(self, delay: Optional[float] = None, jitter: Optional[float] = None) -> bool:
+        """
+        Advance the deadline by a delay with optional random jitter and tell whether to wait for it.
+
+        :param delay: base delay (in seconds) between emitted units
+        :param jitter: random jitter added/subtracted from delay
+        """
+        delay_ = delay or self._delay
+        jitter_ = jitter or self._jitter
+        if delay_ <= 0:
+            return False
+        speed = self._speed
+        if speed == 0:
+            return False
+        if jitter_:
+            delay_ = self._jitter_sample(delay_, jitter_, self._part)
+        if speed != 1:
+            delay_ /= speed
+        if self._stats is not None:
+            self._stats.on_schedule(delay_)
+        deadline = self._scheduler.advance(delay_)
+        if self._frame and deadline < self._frame_end:
+            return False
+        return True
+
+    def _emit(self, part: str) -> None:
+        """
+        Emit a text fragment.
+
+        :param part: text fragment to write
+        """
+        self._part = part
+        if self._stats is not None:
+            self._stats.on_emit(part)
+        if self._frame or self._speed == 0:
+            self._pending.append(part)
+            if self._frame and self._speed and self._scheduler.deadline >= self._frame_end:
+                self._render()
+                self._frame_end = self._scheduler.deadline + self._frame
+        elif self._pressure:
+            self._pending.append(part)
+            if not self._out.poll():
+                self._render()
+            elif self._out.policy is BackpressurePolicy.DROP:
+                self._behind = True
+        else:
+            self._write(part)
+            self._flush()
+
+    def _write(self, text: str) -> None:
+        """
+        Write text to the underlying output stream, recording it on a virtual clock timeline.
+
+        :param text: text to write
+        """
+        if self._stats is None:
+            self._out.write(text)
+        else:
+            start = time.perf_counter_ns()
+            self._out.write(text)
+            self._stats.on_write(text, (time.perf_counter_ns() - start) / 1e9)
+            if self._binary:
+                self._stats.on_backlog(self._out.backlog)
+        if self._record is not None:
+            self._record(text)
+
+    def _flush(self) -> None:
+        """Flush the underlying output stream."""
+        if self._stats is None:
+            self._out.flush()
+        else:
+            start = time.perf_counter_ns()
+            self._out.flush()
+            self._stats.on_flush((time.perf_counter_ns() - start) / 1e9)
+
+    def _render(self) -> None:
+        """Write all fragments pending in the current frame with a single write and flush."""
+        if self._pending:
+            self._write("".join(self._pending))
+            self._flush()
+            self._pending.clear()
+
+    def _partial_frame(self) -> bool:
+        """Tell whether the current frame holds units that must wait for the deadline before being rendered."""
+        return bool(self._frame and self._pending and self._speed)
+
+    def _steps(self, text: str) -> Iterator[int]:
+        """
+        Emit text unit by unit, yielding each deadline that must be waited for instead of waiting.
+
+        :param text: text to be written
+        """
+        self._scheduler.reset()
+        if self._custom:
+            recorder = _TypioRecorder(delay=self._delay, jitter=self._jitter, mode=self._mode, out=self._out)
+            units = recorder.write(text)
+            for op in recorder.ops:
+                if isinstance(op, str):
+                    self._emit(op)
+                elif self._schedule(*op):
+                    yield self._scheduler.deadline
+            if units is not None:
+                for part, factor in self._fast_forward(units):
+                    self._emit(part)
+                    if factor and self._schedule(self._delay * factor):
+                        yield self._scheduler.deadline
+            if self._partial_frame():
+                yield self._scheduler.deadline
+        else:
+            self._load(text)
+            try:
+                if self._delay == 0 or self._speed == 0:
+                    self._write(text)
+                else:
+                    for part, factor in self._units(text):
+                        self._emit(part)
+                        if factor and self._schedule(self._delay * factor):
+                            yield self._scheduler.deadline
+                if self._partial_frame():
+                    yield self._scheduler.deadline
+                self._render()
+            finally:
+                self._load(None)
+        self.flush()
+
+    def _load(self, text: Optional[str]) -> None:
+        """
+        Let a byte sink encode the text about to be written once, or release it.
+
+        :param text: text about to be written, None to release it
+        """
+        if self._binary:
+            self._out.load(text)
+
+    def _units(self, text: str) -> Iterator[Tuple[str, float]]:
+        """
+        Split text into (fragment, delay factor) units of the configured built-in mode.
+
+        :param text: text to split
+        """
+        if len(text) > PLAN_CACHE_TEXT_LIMIT:
+            return self._fast_forward(self._split(text))
+        return self._fast_forward(_PLAN_CACHE.get(text, self._mode))
+
+    def _fast_forward(self, units: Iterable[Tuple[str, float]]) -> Iterator[Tuple[str, float]]:
+        """
+        Pass units through until the printer turns instant, then merge all remaining units into one.
+
+        :param units: (fragment, delay factor) units
+        """
+        units = iter(units)
+        for part, factor in units:
+            if self._speed == 0:
+                yield part + "".join(p for p, _ in units), 0
+                return
+            yield part, factor
+
+
+class _TypioPrinter(_TypioPrinterBase):
+    """File-like object that emits text with typing effects."""
 
     def write(self, text: str) -> None:
         """
@@ -83,16 +1711,73 @@ class _TypioPrinter:
 
         :param text: text to be written
         """
-        if callable(self._mode):
-            ctx = TypioContext(self)
-            self._mode(ctx, text)
+        self._scheduler.reset()
+        if self._custom:
+            self._write_custom(text)
+            self._end_frame()
+            return
+        self._load(text)
+        try:
+            if self._delay == 0 or self._speed == 0:
+                self._write(text)
+            else:
+                for part, factor in self._units(text):
+                    self._emit(part)
+                    if factor:
+                        self._sleep(self._delay * factor)
+            self._end_frame()
+        finally:
+            self._load(None)
+
+    def write_stream(self, chunks: Iterable[Union[str, bytes]], end: str) -> None:
+        """
+        Write chunks as they arrive using the configured typing mode.
+
+        :param chunks: iterable of str or bytes chunks
+        :param end: end character(s)
+        """
+        tokenizer = _ChunkTokenizer(self._mode)
+        for chunk in chunks:
+            self._write_chunk(tokenizer, tokenizer.decode(chunk))
+        self._write_chunk(tokenizer, tokenizer.decode(b"", True) + end, True)
+
+    def _write_chunk(self, tokenizer: _ChunkTokenizer, text: str, final: bool = False) -> None:
+        """
+        Write a decoded chunk, resuming the timeline if the producer fell behind it.
+
+        :param tokenizer: chunk tokenizer
+        :param text: decoded chunk
+        :param final: last chunk flag
+        """
+        self._scheduler.catch_up()
+        if self._custom:
+            self._write_custom(text)
+        elif self._delay == 0 or self._speed == 0:
+            self._write(text)
         else:
-            handler = getattr(self, "_mode_{mode}".format(mode=self._mode.value))
-            handler(text)
+            for part, factor in self._fast_forward(tokenizer.feed(text, final)):
+                self._emit(part)
+                if factor:
+                    self._sleep(self._delay * factor)
+        self._end_frame()
+        self.flush()
 
-    def flush(self) -> None:
-        """Flush the underlying output stream."""
-        self._out.flush()
+    def _write_custom(self, text: str) -> None:
+        """
+        Write text with the configured custom mode, pacing the units of declarative modes.
+
+        :param text: text to be written
+        """
+        units = self._mode(TypioContext(self), text)
+        if units is None:
+            return
+        if self._delay == 0 or self._speed == 0:
+            self._write("".join(part for part, _ in units))
+            return
+        for part, factor in self._fast_forward(units):
+            self._emit(part)
+            if factor:
+                self._sleep(self._delay * factor)
 
     def _sleep(self, delay: Optional[float] = None, jitter: Optional[float] = None) -> None:
         """
@@ -101,143 +1786,623 @@ class _TypioPrinter:
         :param delay: base delay (in seconds) between emitted units
         :param jitter: random jitter added/subtracted from delay
         """
-        delay_ = delay or self._delay
-        jitter_ = jitter or self._jitter
-        if delay_ <= 0:
-            return
-        if jitter_:
-            delay_ += random.uniform(-jitter_, jitter_)
-            delay_ = max(0, delay_)
-        time.sleep(delay_)
+        if self._schedule(delay, jitter):
+            self._scheduler.wait()
+            if self._stats is not None:
+                self._stats.on_sleep(self._scheduler.slept, self._scheduler.lag)
+
+    def _end_frame(self) -> None:
+        """Render the last frame once the deadline of its units has passed."""
+        if self._partial_frame():
+            self._scheduler.wait()
+        self._render()
+
+
+class _TypioRecorder(_TypioPrinterBase):
+    """Printer that records the emit and sleep calls of a custom mode instead of performing them."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        Initialize the recorder.
+
+        :param kwargs: printer parameters
+        """
+        super().__init__(**kwargs)
+        self.ops = []
+
+    def write(self, text: str) -> Optional[Iterable[Tuple[str, float]]]:
+        """
+        Record text written with the configured custom mode and return the units of declarative modes.
+
+        :param text: text to be written
+        """
+        ctx = TypioContext(self)
+        return self._mode(ctx, text)
+
+    def flush(self) -> None:
+        """Ignore flush requests."""
+        pass
+
+    def _sleep(self, delay: Optional[float] = None, jitter: Optional[float] = None) -> None:
+        """
+        Record a sleep.
+
+        :param delay: base delay (in seconds) between emitted units
+        :param jitter: random jitter added/subtracted from delay
+        """
+        self.ops.append((delay, jitter))
 
     def _emit(self, part: str) -> None:
+        """
+        Record a text fragment.
+
+        :param part: text fragment to write
+        """
+        self.ops.append(part)
+
+
+class _AsyncTypioPrinter(_TypioPrinterBase):
+    """Asynchronous printer that emits text with typing effects without blocking the event loop."""
+
+    def _default_sleeper(self, clock: Any, control: Optional["TypioControl"]) -> Callable[[float], Any]:
+        """
+        Return the sleeper used when none is given: the virtual clock, the control or an asynchronous sleep.
+
+        :param clock: function returning the current time (in nanoseconds)
+        :param control: runtime speed control
+        """
+        import asyncio
+        if hasattr(clock, "sleep"):
+            return clock.sleep
+        if control is not None:
+            return control._async_wait
+        return asyncio.sleep
+
+    async def write(self, text: str) -> None:
+        """
+        Write text using the configured typing mode.
+
+        :param text: text to be written
+        """
+        self._scheduler.reset()
+        try:
+            if self._custom:
+                await self._write_custom(text)
+            elif self._delay == 0 or self._speed == 0:
+                self._load(text)
+                self._write(text)
+            else:
+                self._load(text)
+                for part, factor in self._units(text):
+                    self._emit(part)
+                    if factor:
+                        await self._sleep(self._delay * factor)
+            await self._end_frame()
+        finally:
+            self._render()
+            self._load(None)
+
+    async def write_stream(self, chunks: Union[Iterable, AsyncIterable], end: str) -> None:
+        """
+        Write chunks as they arrive using the configured typing mode.
+
+        :param chunks: iterable or async iterable of str or bytes chunks
+        :param end: end character(s)
+        """
+        tokenizer = _ChunkTokenizer(self._mode)
+        try:
+            if hasattr(chunks, "__aiter__"):
+                async for chunk in chunks:
+                    await self._write_chunk(tokenizer, tokenizer.decode(chunk))
+            else:
+                for chunk in chunks:
+                    await self._write_chunk(tokenizer, tokenizer.decode(chunk))
+            await self._write_chunk(tokenizer, tokenizer.decode(b"", True) + end, True)
+        finally:
+            self._render()
+
+    async def _write_chunk(self, tokenizer: _ChunkTokenizer, text: str, final: bool = False) -> None:
+        """
+        Write a decoded chunk, resuming the timeline if the producer fell behind it.
+
+        :param tokenizer: chunk tokenizer
+        :param text: decoded chunk
+        :param final: last chunk flag
+        """
+        self._scheduler.catch_up()
+        if self._custom:
+            await self._write_custom(text)
+        elif self._delay == 0 or self._speed == 0:
+            self._write(text)
+        else:
+            for part, factor in self._fast_forward(tokenizer.feed(text, final)):
+                self._emit(part)
+                if factor:
+                    await self._sleep(self._delay * factor)
+        await self._end_frame()
+        self.flush()
+
+    async def _write_custom(self, text: str) -> None:
+        """
+        Write text with the configured custom mode, replaying the calls of synchronous modes with awaited sleeps.
+
+        :param text: text to be written
+        """
+        import inspect
+        if _is_async_mode(self._mode):
+            units = self._mode(AsyncTypioContext(self), text)
+            if inspect.isawaitable(units):
+                units = await units
+        else:
+            recorder = _TypioRecorder(delay=self._delay, jitter=self._jitter, mode=self._mode, out=self._out)
+            units = recorder.write(text)
+            for op in recorder.ops:
+                if isinstance(op, str):
+                    self._emit(op)
+                else:
+                    await self._sleep(*op)
+        if units is None:
+            return
+        if hasattr(units, "__aiter__"):
+            units = [unit async for unit in units]
+        if self._delay == 0 or self._speed == 0:
+            self._write("".join(part for part, _ in units))
+            return
+        for part, factor in self._fast_forward(units):
+            self._emit(part)
+            if factor:
+                await self._sleep(self._delay * factor)
+
+    async def _sleep(self, delay: Optional[float] = None, jitter: Optional[float] = None) -> None:
+        """
+        Sleep for a given delay with optional random jitter.
+
+        :param delay: base delay (in seconds) between emitted units
+        :param jitter: random jitter added/subtracted from delay
+        """
+        if self._schedule(delay, jitter):
+            await self._scheduler.async_wait()
+            if self._stats is not None:
+                self._stats.on_sleep(self._scheduler.slept, self._scheduler.lag)
+
+    async def _end_frame(self) -> None:
+        """Render the last frame once the deadline of its units has passed."""
+        if self._partial_frame():
+            await self._scheduler.async_wait()
+        self._render()
+
+
+def _is_async_mode(mode: Callable) -> bool:
+    """
+    Check whether a custom mode is a coroutine or async generator function.
+
+    :param mode: custom typing mode
+    """
+    import inspect
+    return any(
+        inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)
+        for func in (mode, getattr(mode, "__call__", None)))
+
+
+class TypioContext:
+    """Read-only typing context passed to custom typing modes."""
+
+    def __init__(self, printer: "_TypioPrinterBase") -> None:
+        """
+        Initialize the typing context.
+
+        :param printer: printer
+        """
+        self._printer = printer
+
+    def emit(self, text: str) -> None:
         """
         Emit a text fragment.
 
-        :param part: text fragment to write
+        :param text: text fragment to write
+        """
+        self._printer._emit(text)
+
+    def flush(self) -> None:
+        """Flush the underlying output stream."""
+        self._printer.flush()
+
+    def sleep(self, delay: Optional[float] = None, jitter: Optional[float] = None) -> None:
+        """
+        Sleep for a given delay with optional random jitter.
+
+        :param delay: base delay (in seconds) between emitted units
+        :param jitter: random jitter added/subtracted from delay
+        """
+        _validate_sleep(delay, jitter)
+        self._printer._sleep(delay=delay, jitter=jitter)
+
+    @property
+    def delay(self) -> float:
+        """Delay property."""
+        return self._printer._delay
+
+    @property
+    def jitter(self) -> float:
+        """Jitter property."""
+        return self._printer._jitter
+
+    @property
+    def timing_error(self) -> float:
+        """Accumulated timing error (in seconds) property."""
+        return self._printer.timing_error
+
+
+class AsyncTypioContext(TypioContext):
+    """Typing context passed to custom typing modes of the asynchronous printer."""
+
+    async def sleep(self, delay: Optional[float] = None, jitter: Optional[float] = None) -> None:
+        """
+        Sleep for a given delay with optional random jitter without blocking the event loop.
+
+        :param delay: base delay (in seconds) between emitted units
+        :param jitter: random jitter added/subtracted from delay
+        """
+        _validate_sleep(delay, jitter)
+        await self._printer._sleep(delay=delay, jitter=jitter)
+
+
+class TypioHandle:
+    """Handle of a typing session running on a TypioEngine."""
+
+    def __init__(self) -> None:
+        """Initialize the handle."""
+        from concurrent.futures import Future
+        self._future = Future()
+        self._cancelled = False
+        self._control = None
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until the session is finished.
+
+        :param timeout: maximum time (in seconds) to wait
+        """
+        self._future.result(timeout)
+
+    def cancel(self) -> None:
+        """Stop the session before its next unit."""
+        self._cancelled = True
+
+    @property
+    def done(self) -> bool:
+        """Done flag property."""
+        return self._future.done()
+
+    def __await__(self) -> Iterator[None]:
+        """Wait for the session inside a coroutine."""
+        import asyncio
+        return asyncio.wrap_future(self._future).__await__()
+
+
+class TypioEngine:
+    """Engine that drives any number of typing sessions from a single worker thread."""
+
+    def __init__(self) -> None:
+        """Initialize the engine."""
+        self._heap = []
+        self._counter = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+        self._lateness = deque(maxlen=ENGINE_LATENESS_HISTORY)
+        self._controls = set()
+
+    def submit(self, printer: _TypioPrinterBase, text: str) -> TypioHandle:
         """
-        self._out.write(part)
-        self._out.flush()
+        Schedule text to be written by a printer and return the session handle.
 
-    def _mode_char(self, text: str) -> None:
+        :param printer: printer of the session
+        :param text: text to be written
         """
-        Emit text character by character.
+        handle = TypioHandle()
+        handle._control = printer._control
+        with self._condition:
+            if self._closed:
+                raise TypioError(ENGINE_CLOSED_ERROR)
+            if handle._control is not None and handle._control not in self._controls:
+                handle._control._wakers.add(self._wake)
+                self._controls.add(handle._control)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="typio-engine", daemon=True)
+                self._thread.start()
+            self._push(time.monotonic_ns(), printer._steps(text), handle)
+        return handle
 
-        :param text: text to emit
+    def close(self, wait: bool = True) -> None:
         """
-        for c in text:
-            self._emit(c)
-            self._sleep()
+        Stop accepting sessions and let the worker exit once the queued sessions are finished.
 
-    def _mode_word(self, text: str) -> None:
+        :param wait: wait for the worker to finish flag
         """
-        Emit text word by word, preserving whitespace.
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            for control in self._controls:
+                control._wakers.discard(self._wake)
+            self._controls.clear()
+        if wait and self._thread is not None:
+            self._thread.join()
 
-        :param text: text to emit
-        """
-        for w in re.findall(r"\S+|\s+", text):
-            self._emit(w)
-            self._sleep()
+    @property
+    def queue_depth(self) -> int:
+        """Number of sessions waiting for their next deadline."""
+        return len(self._heap)
 
-    def _mode_line(self, text: str) -> None:
+    @property
+    def lateness(self) -> Tuple[float, ...]:
+        """Lateness (in seconds) of the most recently fired deadlines."""
+        return tuple(self._lateness)
+
+    def _advance(self, steps: Iterator[int], handle: TypioHandle) -> None:
         """
-        Emit text line by line.
+        Run a session up to its next deadline and queue it.
 
-        :param text: text to emit
+        :param steps: session steps
+        :param handle: session handle
         """
-        for line in text.splitlines(True):
-            self._emit(line)
-            self._sleep()
+        try:
+            deadline = None if handle._cancelled else next(steps, None)
+        except BaseException as e:
+            handle._future.set_exception(e)
+            return
+        if deadline is None:
+            handle._future.set_result(None)
+            return
+        with self._condition:
+            self._push(deadline, steps, handle)
+
+    def _wake(self) -> None:
+        """Move the sessions of skipped controls to the front of the queue."""
+        with self._condition:
+            now = time.monotonic_ns()
+            self._heap = [
+                (min(deadline, now) if handle._control is not None and handle._control.skipped else deadline,
+                 counter, steps, handle)
+                for deadline, counter, steps, handle in self._heap]
+            heapq.heapify(self._heap)
+            self._condition.notify()
 
-    def _mode_sentence(self, text: str) -> None:
+    def _push(self, deadline: int, steps: Iterator[int], handle: TypioHandle) -> None:
         """
-        Emit text character by character with longer pauses after sentence-ending punctuation.
+        Queue a session at its next deadline; the caller must hold the engine lock.
 
-        :param text: text to emit
+        :param deadline: next deadline (in nanoseconds)
+        :param steps: session steps
+        :param handle: session handle
         """
-        for c in text:
-            self._emit(c)
-            self._sleep()
-            if c in ".!?":
-                self._sleep(self._delay * 4, self._jitter)
+        self._counter += 1
+        heapq.heappush(self._heap, (deadline, self._counter, steps, handle))
+        if self._heap[0][1] == self._counter:
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """Fire queued deadlines in order until the engine is closed and drained."""
+        while True:
+            with self._condition:
+                while True:
+                    if not self._heap:
+                        if self._closed:
+                            return
+                        self._condition.wait()
+                        continue
+                    remaining = self._heap[0][0] - time.monotonic_ns()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining / 1e9)
+                deadline, _, steps, handle = heapq.heappop(self._heap)
+                self._lateness.append((time.monotonic_ns() - deadline) / 1e9)
+            self._advance(steps, handle)
+
+    def __enter__(self) -> "TypioEngine":
+        """Enter the runtime context."""
+        return self
 
-    def _mode_typewriter(self, text: str) -> None:
+    def __exit__(self, *args: Any) -> None:
+        """Close the engine at the end of the runtime context."""
+        self.close()
+
+
+class TypioRegion:
+    """Fixed-height pane of a TypioRenderer that can be used as the output stream of a typing printer."""
+
+    def __init__(self, renderer: "TypioRenderer", height: int) -> None:
         """
-        Emit text character by character with longer pauses after newlines.
+        Initialize the region.
 
-        :param text: text to emit
+        :param renderer: owner renderer
+        :param height: number of terminal rows
         """
-        for c in text:
-            self._emit(c)
-            self._sleep()
-            if c == "\n":
-                self._sleep(self._delay * 5, self._jitter)
+        self._renderer = renderer
+        self._lines = deque([""], maxlen=height)
+        self._newline = False
+        self.height = height
 
-    def _mode_adaptive(self, text: str) -> None:
+    def write(self, text: str) -> int:
         """
-        Emit text with adaptive delays based on character type.
+        Append text to the region; only its last lines are kept and a trailing newline is deferred.
 
-        :param text: text to emit
+        :param text: text to be written
         """
-        for c in text:
-            d = self._delay * (
-                0.3 if c.isspace()
-                else 1.5 if not c.isalnum()
-                else 1
-            )
-            self._emit(c)
-            self._sleep(delay=d)
+        with self._renderer._lock:
+            for i, line in enumerate(text.split("\n")):
+                if i:
+                    if self._newline:
+                        self._lines.append("")
+                    self._newline = True
+                if not line:
+                    continue
+                if self._newline:
+                    self._lines.append("")
+                    self._newline = False
+                if "\r" in line:
+                    self._lines[-1] = ""
+                    line = line.rsplit("\r", 1)[1]
+                self._lines[-1] += line
+        self._renderer._dirty.set()
+        return len(text)
 
+    def flush(self) -> None:
+        """Do nothing; the renderer flushes once per frame."""
+        pass
+
+    def clear(self) -> None:
+        """Remove the content of the region."""
+        with self._renderer._lock:
+            self._lines.clear()
+            self._lines.append("")
+            self._newline = False
+        self._renderer._dirty.set()
+
+    def isatty(self) -> bool:
+        """Check whether the renderer output is an interactive terminal."""
+        return _interactive(self._renderer._out)
+
+    @property
+    def lines(self) -> List[str]:
+        """Current rows of the region."""
+        with self._renderer._lock:
+            return self._rows()
+
+    def _rows(self) -> List[str]:
+        """Return the current rows of the region; the caller must hold the renderer lock."""
+        return list(self._lines) + [""] * (self.height - len(self._lines))
 
-class TypioContext:
-    """Read-only typing context passed to custom typing modes."""
 
-    def __init__(self, printer: "_TypioPrinter") -> None:
+class TypioRenderer:
+    """Terminal renderer that stacks regions and redraws only their changed cells once per frame."""
+
+    def __init__(
+            self,
+            file: Optional[TextIOBase] = None,
+            max_fps: Optional[float] = 30,
+            width: Optional[int] = None) -> None:
         """
-        Initialize the typing context.
+        Initialize the renderer.
 
-        :param printer: printer
+        :param file: terminal output stream
+        :param max_fps: maximum number of rendered frames per second
+        :param width: terminal width (defaults to the current terminal size)
         """
-        self._printer = printer
+        import shutil
+        _validate("", 0, 0, TypeMode.CHAR, "", file, max_fps)
+        if width is not None and (not isinstance(width, int) or width <= 0):
+            raise TypioError(INVALID_WIDTH_ERROR)
+        self._out = _output(file)
+        self._frame = 1 / max_fps if max_fps else 0
+        self._width = width or shutil.get_terminal_size().columns
+        self._regions = []
+        self._screen = []
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.frames = 0
 
-    def emit(self, text: str) -> None:
+    def region(self, height: int = 1) -> TypioRegion:
         """
-        Emit a text fragment.
+        Add a region below the existing ones.
 
-        :param text: text fragment to write
+        :param height: number of terminal rows
         """
-        self._printer._emit(text)
+        if not isinstance(height, int) or isinstance(height, bool) or height <= 0:
+            raise TypioError(INVALID_HEIGHT_ERROR)
+        region = TypioRegion(self, height)
+        with self._lock:
+            self._regions.append(region)
+        self._dirty.set()
+        return region
 
-    def flush(self) -> None:
-        """Flush the underlying output stream."""
-        self._printer.flush()
+    def start(self) -> None:
+        """Start the render loop."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="typio-renderer", daemon=True)
+            self._thread.start()
 
-    def sleep(self, delay: Optional[float] = None, jitter: Optional[float] = None) -> None:
-        """
-        Sleep for a given delay with optional random jitter.
+    def refresh(self) -> None:
+        """Render one frame with the changes since the previous one."""
+        with self._render_lock:
+            self._refresh()
 
-        :param delay: base delay (in seconds) between emitted units
-        :param jitter: random jitter added/subtracted from delay
+    def _refresh(self) -> None:
+        """Render one frame; the caller must hold the render lock."""
+        with self._lock:
+            rows = [line[:self._width] for region in self._regions for line in region._rows()]
+        parts = []
+        if len(rows) > len(self._screen):
+            if self._screen:
+                parts.append(self._move(len(self._screen) - 1))
+                parts.append("\n" * (len(rows) - len(self._screen)))
+            else:
+                parts.append("\n" * (len(rows) - 1))
+            self._cursor = len(rows) - 1
+            self._screen.extend([""] * (len(rows) - len(self._screen)))
+        for row, (old, new) in enumerate(zip(self._screen, rows)):
+            if old == new:
+                continue
+            column = len(os.path.commonprefix([old, new]))
+            parts.append(self._move(row))
+            parts.append("\x1b[{0}G{1}".format(column + 1, new[column:]))
+            if len(new) < len(old):
+                parts.append("\x1b[K")
+            self._screen[row] = new
+        if parts:
+            self._out.write("".join(parts))
+            self._out.flush()
+            self.frames += 1
+
+    def close(self) -> None:
+        """Stop the render loop, render the final frame and move the cursor below the regions."""
+        self._stop.set()
+        self._dirty.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._render_lock:
+            self._refresh()
+            if self._screen:
+                self._out.write(self._move(len(self._screen) - 1) + "\n")
+                self._out.flush()
+                self._screen = []
+                self._cursor = 0
+
+    def _move(self, row: int) -> str:
         """
-        if delay is not None:
-            if not isinstance(delay, (int, float)) or delay < 0:
-                raise TypioError(INVALID_DELAY_ERROR)
+        Return the ANSI sequence moving the cursor to a row of the regions.
 
-        if jitter is not None:
-            if not isinstance(jitter, (int, float)) or jitter < 0:
-                raise TypioError(INVALID_JITTER_ERROR)
+        :param row: target row
+        """
+        delta, self._cursor = row - self._cursor, row
+        if delta < 0:
+            return "\x1b[{0}A".format(-delta)
+        if delta > 0:
+            return "\x1b[{0}B".format(delta)
+        return ""
 
-        self._printer._sleep(delay=delay, jitter=jitter)
+    def _run(self) -> None:
+        """Render a frame whenever a region changes, at most once per frame interval."""
+        while not self._stop.is_set():
+            self._dirty.wait()
+            self._dirty.clear()
+            if self._stop.is_set():
+                return
+            self.refresh()
+            self._stop.wait(self._frame)
 
-    @property
-    def delay(self) -> float:
-        """Delay property."""
-        return self._printer._delay
+    def __enter__(self) -> "TypioRenderer":
+        """Start the render loop at the beginning of the runtime context."""
+        self.start()
+        return self
 
-    @property
-    def jitter(self) -> float:
-        """Jitter property."""
-        return self._printer._jitter
+    def __exit__(self, *args: Any) -> None:
+        """Close the renderer at the end of the runtime context."""
+        self.close()
 
 
 def type_print(
@@ -245,60 +2410,807 @@ def type_print(
         *,
         delay: float = 0.04,
         jitter: float = 0,
+        distribution: JitterDistribution = JitterDistribution.UNIFORM,
         end: str = "\n",
         mode: Union[TypeMode, Callable] = TypeMode.CHAR,
-        file: Optional[TextIOBase] = None) -> None:
+        file: Optional[TextIOBase] = None,
+        max_fps: Optional[float] = None,
+        engine: Optional[TypioEngine] = None,
+        control: Optional[TypioControl] = None,
+        clock: Optional[Callable[[], int]] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+        seed: Optional[Union[int, float, str, bytes]] = None,
+        rng: Optional[random.Random] = None,
+        stats: Optional[TypioStats] = None,
+        animate: Union[bool, str] = "auto") -> Optional[TypioHandle]:
     """
     Print text with typing effects.
 
     :param text: text to be printed
     :param delay: base delay (in seconds) between emitted units
     :param jitter: random jitter added/subtracted from delay
+    :param distribution: jitter distribution
     :param end: end character(s)
     :param mode: typing mode controlling emission granularity
     :param file: output stream supporting a write() method
+    :param max_fps: maximum number of rendered frames per second
+    :param engine: engine running the session in the background
+    :param control: runtime speed control
+    :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+    :param sleeper: function blocking for a given number of seconds
+    :param seed: seed of the jitter random number generator
+    :param rng: random number generator of the jitter
+    :param stats: statistics collector
+    :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
     """
-    text = _validate(text, delay, jitter, mode, end, file)
-    out = file or sys.stdout
+    text = _validate(
+        text, delay, jitter, mode, end, file, max_fps,
+        engine=engine, control=control, clock=clock, sleeper=sleeper, seed=seed, rng=rng, stats=stats, animate=animate,
+        distribution=distribution)
+    out = _output(file)
 
     printer = _TypioPrinter(
         delay=delay,
         jitter=jitter,
         mode=mode,
         out=out,
+        max_fps=max_fps,
+        control=control,
+        clock=clock,
+        sleeper=sleeper,
+        rng=rng or random.Random(seed),
+        stats=stats,
+        animate=animate,
+        distribution=distribution,
     )
+    if engine is not None:
+        return engine.submit(printer, text)
     printer.write(text)
     printer.flush()
 
 
+async def async_type_print(
+        text: str,
+        *,
+        delay: float = 0.04,
+        jitter: float = 0,
+        distribution: JitterDistribution = JitterDistribution.UNIFORM,
+        end: str = "\n",
+        mode: Union[TypeMode, Callable] = TypeMode.CHAR,
+        file: Optional[TextIOBase] = None,
+        max_fps: Optional[float] = None,
+        control: Optional[TypioControl] = None,
+        clock: Optional[Callable[[], int]] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+        seed: Optional[Union[int, float, str, bytes]] = None,
+        rng: Optional[random.Random] = None,
+        stats: Optional[TypioStats] = None,
+        animate: Union[bool, str] = "auto") -> None:
+    """
+    Print text with typing effects without blocking the event loop.
+
+    :param text: text to be printed
+    :param delay: base delay (in seconds) between emitted units
+    :param jitter: random jitter added/subtracted from delay
+    :param distribution: jitter distribution
+    :param end: end character(s)
+    :param mode: typing mode controlling emission granularity
+    :param file: output stream supporting a write() method
+    :param max_fps: maximum number of rendered frames per second
+    :param control: runtime speed control
+    :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+    :param sleeper: coroutine function suspending for a given number of seconds
+    :param seed: seed of the jitter random number generator
+    :param rng: random number generator of the jitter
+    :param stats: statistics collector
+    :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
+    """
+    text = _validate(
+        text, delay, jitter, mode, end, file, max_fps,
+        control=control, clock=clock, sleeper=sleeper, seed=seed, rng=rng, stats=stats, animate=animate,
+        distribution=distribution)
+    _validate_async_sleeper(sleeper)
+    out = _output(file)
+
+    printer = _AsyncTypioPrinter(
+        delay=delay,
+        jitter=jitter,
+        mode=mode,
+        out=out,
+        max_fps=max_fps,
+        control=control,
+        clock=clock,
+        sleeper=sleeper,
+        rng=rng or random.Random(seed),
+        stats=stats,
+        animate=animate,
+        distribution=distribution,
+    )
+    await printer.write(text)
+    printer.flush()
+
+
+def type_print_stream(
+        chunks: Iterable[Union[str, bytes]],
+        *,
+        delay: float = 0.04,
+        jitter: float = 0,
+        distribution: JitterDistribution = JitterDistribution.UNIFORM,
+        end: str = "\n",
+        mode: Union[TypeMode, Callable] = TypeMode.CHAR,
+        file: Optional[TextIOBase] = None,
+        max_fps: Optional[float] = None,
+        control: Optional[TypioControl] = None,
+        clock: Optional[Callable[[], int]] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+        seed: Optional[Union[int, float, str, bytes]] = None,
+        rng: Optional[random.Random] = None,
+        stats: Optional[TypioStats] = None,
+        animate: Union[bool, str] = "auto") -> None:
+    """
+    Print a stream of text chunks with typing effects as they arrive.
+
+    :param chunks: iterable of str or bytes chunks
+    :param delay: base delay (in seconds) between emitted units
+    :param jitter: random jitter added/subtracted from delay
+    :param distribution: jitter distribution
+    :param end: end character(s)
+    :param mode: typing mode controlling emission granularity
+    :param file: output stream supporting a write() method
+    :param max_fps: maximum number of rendered frames per second
+    :param control: runtime speed control
+    :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+    :param sleeper: function blocking for a given number of seconds
+    :param seed: seed of the jitter random number generator
+    :param rng: random number generator of the jitter
+    :param stats: statistics collector
+    :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
+    """
+    _validate(
+        "", delay, jitter, mode, end, file, max_fps,
+        control=control, clock=clock, sleeper=sleeper, seed=seed, rng=rng, stats=stats, animate=animate,
+        distribution=distribution)
+    if not hasattr(chunks, "__iter__"):
+        raise TypioError(INVALID_STREAM_ERROR)
+    out = _output(file)
+
+    printer = _TypioPrinter(
+        delay=delay,
+        jitter=jitter,
+        mode=mode,
+        out=out,
+        max_fps=max_fps,
+        control=control,
+        clock=clock,
+        sleeper=sleeper,
+        rng=rng or random.Random(seed),
+        stats=stats,
+        animate=animate,
+        distribution=distribution,
+    )
+    printer.write_stream(chunks, end)
+
+
+def _read_chunks(source: Any, chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[Union[str, bytes]]:
+    """
+    Read a file lazily in bounded chunks, memory-mapping it when possible.
+
+    :param source: file path or readable file object
+    :param chunk_size: chunk size in bytes or characters
+    """
+    if hasattr(source, "read"):
+        yield from _read_file(source, chunk_size)
+        return
+    with open(source, "rb") as file:
+        yield from _read_file(file, chunk_size)
+
+
+def _read_file(file: Any, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    """
+    Read an open file in bounded chunks from its current position.
+
+    :param file: readable file object
+    :param chunk_size: chunk size in bytes or characters
+    """
+    import mmap
+    mapped = None
+    if isinstance(file, (RawIOBase, BufferedIOBase)) or "b" in getattr(file, "mode", ""):
+        try:
+            position = file.tell()
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            mapped = None
+    if mapped is None:
+        for chunk in iter(lambda: file.read(chunk_size), ""):
+            if not chunk:
+                break
+            yield chunk
+        return
+    with mapped:
+        release = hasattr(mapped, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+        if release and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        for start in range(position, len(mapped), chunk_size):
+            end = min(start + chunk_size, len(mapped))
+            yield mapped[start:end]
+            if release:
+                page = start - start % mmap.PAGESIZE
+                mapped.madvise(mmap.MADV_DONTNEED, page, end - page)
+
+
+def type_print_file(
+        source: Union[str, bytes, os.PathLike, BinaryIO, TextIOBase],
+        *,
+        delay: float = 0.04,
+        jitter: float = 0,
+        distribution: JitterDistribution = JitterDistribution.UNIFORM,
+        end: str = "\n",
+        mode: Union[TypeMode, Callable] = TypeMode.CHAR,
+        file: Optional[TextIOBase] = None,
+        max_fps: Optional[float] = None,
+        control: Optional[TypioControl] = None,
+        clock: Optional[Callable[[], int]] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+        seed: Optional[Union[int, float, str, bytes]] = None,
+        rng: Optional[random.Random] = None,
+        stats: Optional[TypioStats] = None,
+        animate: Union[bool, str] = "auto") -> None:
+    """
+    Print the content of a file with typing effects, streaming it with bounded memory.
+
+    :param source: file path or readable file object
+    :param delay: base delay (in seconds) between emitted units
+    :param jitter: random jitter added/subtracted from delay
+    :param distribution: jitter distribution
+    :param end: end character(s)
+    :param mode: typing mode controlling emission granularity
+    :param file: output stream supporting a write() method
+    :param max_fps: maximum number of rendered frames per second
+    :param control: runtime speed control
+    :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+    :param sleeper: function blocking for a given number of seconds
+    :param seed: seed of the jitter random number generator
+    :param rng: random number generator of the jitter
+    :param stats: statistics collector
+    :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
+    """
+    if not isinstance(source, (str, bytes, os.PathLike)) and not hasattr(source, "read"):
+        raise TypioError(INVALID_SOURCE_ERROR)
+    type_print_stream(
+        _read_chunks(source),
+        delay=delay,
+        jitter=jitter,
+        end=end,
+        mode=mode,
+        file=file,
+        max_fps=max_fps,
+        control=control,
+        clock=clock,
+        sleeper=sleeper,
+        seed=seed,
+        rng=rng,
+        stats=stats,
+        animate=animate,
+        distribution=distribution,
+    )
+
+
+def _read_cast(source: Any) -> Iterator[Tuple[float, str]]:
+    """
+    Read the output events of an asciicast v2 recording lazily.
+
+    :param source: file path or readable text file of the recording
+    """
+    import json
+    if not hasattr(source, "read"):
+        with open(source, encoding="utf-8") as file:
+            yield from _read_cast(file)
+        return
+    try:
+        header = json.loads(source.readline())
+        if header.get("version") != CAST_VERSION:
+            raise TypioError(INVALID_CAST_ERROR)
+        yield header.get("idle_time_limit"), ""
+        for line in source:
+            if not line.strip():
+                continue
+            moment, kind, data = json.loads(line)
+            if kind == "o":
+                yield float(moment), data
+    except (ValueError, TypeError, AttributeError):
+        raise TypioError(INVALID_CAST_ERROR)
+
+
+def _cast_units(events: Iterator[Tuple[float, str]], idle_time_limit: Optional[float]) -> Iterator[Tuple[str, float]]:
+    """
+    Turn recorded output events into (fragment, pause) units, capping pauses at an idle time limit.
+
+    :param events: (time, data) output events
+    :param idle_time_limit: maximum pause (in seconds) or None
+    """
+    part, last = "", 0.0
+    for moment, data in events:
+        pause = max(0.0, moment - last)
+        if idle_time_limit is not None:
+            pause = min(pause, idle_time_limit)
+        if part or pause:
+            yield part, pause
+        part, last = data, moment
+    if part:
+        yield part, 0
+
+
+def type_print_cast(
+        source: Union[str, bytes, os.PathLike, TextIOBase],
+        *,
+        file: Optional[TextIOBase] = None,
+        max_fps: Optional[float] = None,
+        control: Optional[TypioControl] = None,
+        clock: Optional[Callable[[], int]] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+        stats: Optional[TypioStats] = None,
+        idle_time_limit: Optional[float] = None,
+        animate: Union[bool, str] = "auto") -> None:
+    """
+    Replay an asciicast v2 recording with its original timing, reading it lazily.
+
+    :param source: file path or readable text file of the recording
+    :param file: output stream supporting a write() method
+    :param max_fps: maximum number of rendered frames per second
+    :param control: runtime speed control
+    :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+    :param sleeper: function blocking for a given number of seconds
+    :param stats: statistics collector
+    :param idle_time_limit: maximum pause (in seconds), defaults to the limit in the recording header
+    :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
+    """
+    _validate(
+        "", 0, 0, TypeMode.CHAR, "", file, max_fps,
+        control=control, clock=clock, sleeper=sleeper, stats=stats, animate=animate)
+    if not isinstance(source, (str, bytes, os.PathLike)) and not hasattr(source, "read"):
+        raise TypioError(INVALID_SOURCE_ERROR)
+    events = _read_cast(source)
+    limit = next(events)[0]
+    if idle_time_limit is not None:
+        limit = idle_time_limit
+
+    def replay(ctx: TypioContext, text: str) -> Iterator[Tuple[str, float]]:
+        return _cast_units(events, limit)
+
+    printer = _TypioPrinter(
+        delay=1,
+        jitter=0,
+        mode=replay,
+        out=_output(file),
+        max_fps=max_fps,
+        control=control,
+        clock=clock,
+        sleeper=sleeper,
+        stats=stats,
+        animate=animate,
+    )
+    try:
+        printer.write("")
+        printer.flush()
+    finally:
+        events.close()
+
+
+TypioJob = namedtuple(
+    "TypioJob", ["text", "mode", "delay", "jitter", "destination"], defaults=(TypeMode.CHAR, 0.04, 0, None))
+TypioResult = namedtuple("TypioResult", ["index", "destination", "duration", "text"])
+
+
+def _job_seed(seed: Any, index: int) -> str:
+    """
+    Derive the deterministic jitter seed of a batch job.
+
+    :param seed: seed of the batch
+    :param index: job index
+    """
+    return "{0!r}:{1}".format(seed, index)
+
+
+def _render_jobs(batch: List[Tuple[int, TypioJob]], seed: Any) -> List[TypioResult]:
+    """
+    Render a batch of jobs on virtual clocks, writing recordings, text files or returning text.
+
+    :param batch: (index, job) pairs
+    :param seed: seed of the batch
+    """
+    results = []
+    for index, job in batch:
+        options = {
+            "delay": job.delay,
+            "jitter": job.jitter,
+            "mode": job.mode,
+            "end": "",
+            "seed": _job_seed(seed, index),
+            "animate": True,
+        }
+        destination, text = job.destination, None
+        if destination is not None and os.fspath(destination).endswith(".cast"):
+            with TypioCast(destination) as cast:
+                type_print(job.text, file=cast, **options)
+            duration = cast.time
+        else:
+            clock = VirtualClock()
+            with StringIO() if destination is None else open(destination, "w", encoding="utf-8") as out:
+                type_print(job.text, file=out, clock=clock.__call__, sleeper=clock.sleep, **options)
+                if destination is None:
+                    text = out.getvalue()
+            duration = clock.time
+        results.append(TypioResult(index, destination, duration, text))
+    return results
+
+
+def _job_batches(jobs: Iterable[Any], chunksize: int) -> Iterator[List[Tuple[int, TypioJob]]]:
+    """
+    Validate jobs lazily and group them into batches of (index, job) pairs.
+
+    :param jobs: iterable of TypioJob, tuples or str
+    :param chunksize: number of jobs per batch
+    """
+    # pickle is only used to check that custom modes can reach worker processes
+    import pickle  # nosec B403
+    checked = set()
+    batch = []
+    for index, job in enumerate(jobs):
+        if isinstance(job, (str, bytes)):
+            job = TypioJob(job)
+        elif isinstance(job, tuple) and not isinstance(job, TypioJob):
+            try:
+                job = TypioJob(*job)
+            except TypeError:
+                raise TypioError(INVALID_JOB_ERROR)
+        elif not isinstance(job, TypioJob):
+            raise TypioError(INVALID_JOB_ERROR)
+        text = _validate(job.text, job.delay, job.jitter, job.mode, "", None)
+        if job.destination is not None and not isinstance(job.destination, (str, os.PathLike)):
+            raise TypioError(INVALID_JOB_DESTINATION_ERROR)
+        mode = _resolve_mode(job.mode)
+        if callable(mode) and id(mode) not in checked:
+            try:
+                pickle.dumps(mode)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                raise TypioError(INVALID_JOB_MODE_ERROR)
+            checked.add(id(mode))
+        batch.append((index, job._replace(text=text, mode=mode)))
+        if len(batch) == chunksize:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _run_jobs(
+        batches: Iterator[List[Tuple[int, TypioJob]]],
+        workers: int,
+        seed: Any) -> Iterator[TypioResult]:
+    """
+    Render job batches across a process pool, keeping a bounded number in flight, and yield results as they finish.
+
+    :param batches: batches of (index, job) pairs
+    :param workers: number of worker processes
+    :param seed: seed of the batch
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    pending = set()
+    with ProcessPoolExecutor(workers) as executor:
+        try:
+            for batch in batches:
+                pending.add(executor.submit(_render_jobs, batch, seed))
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def type_print_many(
+        jobs: Iterable[Union[TypioJob, Tuple, str]],
+        *,
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        seed: Optional[Union[int, float, str, bytes]] = None) -> Iterator[TypioResult]:
+    """
+    Render many texts offline across a process pool and yield their results as they finish.
+
+    :param jobs: iterable of TypioJob(text, mode, delay, jitter, destination), equivalent tuples or texts
+    :param workers: number of worker processes (defaults to the number of CPUs)
+    :param chunksize: number of jobs sent to a worker at once
+    :param seed: seed from which every job derives its own deterministic jitter seed
+    """
+    if workers is not None and (not isinstance(workers, int) or isinstance(workers, bool) or workers <= 0):
+        raise TypioError(INVALID_WORKERS_ERROR)
+    if not isinstance(chunksize, int) or isinstance(chunksize, bool) or chunksize <= 0:
+        raise TypioError(INVALID_CHUNKSIZE_ERROR)
+    if seed is not None and not isinstance(seed, (int, float, str, bytes, bytearray)):
+        raise TypioError(INVALID_SEED_ERROR)
+    if not hasattr(jobs, "__iter__") or isinstance(jobs, (str, bytes)):
+        raise TypioError(INVALID_JOB_ERROR)
+    return _run_jobs(_job_batches(jobs, chunksize), workers or os.cpu_count() or 1, seed)
+
+
+async def async_type_print_stream(
+        chunks: Union[Iterable[Union[str, bytes]], AsyncIterable[Union[str, bytes]]],
+        *,
+        delay: float = 0.04,
+        jitter: float = 0,
+        distribution: JitterDistribution = JitterDistribution.UNIFORM,
+        end: str = "\n",
+        mode: Union[TypeMode, Callable] = TypeMode.CHAR,
+        file: Optional[TextIOBase] = None,
+        max_fps: Optional[float] = None,
+        control: Optional[TypioControl] = None,
+        clock: Optional[Callable[[], int]] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+        seed: Optional[Union[int, float, str, bytes]] = None,
+        rng: Optional[random.Random] = None,
+        stats: Optional[TypioStats] = None,
+        animate: Union[bool, str] = "auto") -> None:
+    """
+    Print a stream of text chunks with typing effects as they arrive, without blocking the event loop.
+
+    :param chunks: iterable or async iterable of str or bytes chunks
+    :param delay: base delay (in seconds) between emitted units
+    :param jitter: random jitter added/subtracted from delay
+    :param distribution: jitter distribution
+    :param end: end character(s)
+    :param mode: typing mode controlling emission granularity
+    :param file: output stream supporting a write() method
+    :param max_fps: maximum number of rendered frames per second
+    :param control: runtime speed control
+    :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+    :param sleeper: coroutine function suspending for a given number of seconds
+    :param seed: seed of the jitter random number generator
+    :param rng: random number generator of the jitter
+    :param stats: statistics collector
+    :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
+    """
+    _validate(
+        "", delay, jitter, mode, end, file, max_fps,
+        control=control, clock=clock, sleeper=sleeper, seed=seed, rng=rng, stats=stats, animate=animate,
+        distribution=distribution)
+    _validate_async_sleeper(sleeper)
+    if not hasattr(chunks, "__iter__") and not hasattr(chunks, "__aiter__"):
+        raise TypioError(INVALID_STREAM_ERROR)
+    out = _output(file)
+
+    printer = _AsyncTypioPrinter(
+        delay=delay,
+        jitter=jitter,
+        mode=mode,
+        out=out,
+        max_fps=max_fps,
+        control=control,
+        clock=clock,
+        sleeper=sleeper,
+        rng=rng or random.Random(seed),
+        stats=stats,
+        animate=animate,
+        distribution=distribution,
+    )
+    await printer.write_stream(chunks, end)
+
+
+class _StdoutProxy:
+    """Process-wide stdout proxy that dispatches writes to the printer active in the current context."""
+
+    def __init__(self, target: TextIOBase) -> None:
+        """
+        Initialize the proxy.
+
+        :param target: real output stream
+        """
+        self._target = target
+
+    def write(self, text: str) -> Any:
+        """
+        Write text through the active printer, or straight to the real stream when there is none.
+
+        :param text: text to be written
+        """
+        printer = _ACTIVE_PRINTER.get()
+        if printer is None:
+            return self._target.write(text)
+        printer.write(text)
+
+    def flush(self) -> None:
+        """Flush the active printer or the real stream."""
+        printer = _ACTIVE_PRINTER.get()
+        if printer is None:
+            self._target.flush()
+        else:
+            printer.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Delegate other attributes to the real stream.
+
+        :param name: attribute name
+        """
+        return getattr(self._target, name)
+
+
+_ACTIVE_PRINTER = ContextVar("typio_printer", default=None)
+_PROXY_LOCK = threading.Lock()
+_PROXY_USERS = 0
+
+
+def _real_stdout() -> TextIOBase:
+    """Return the stream behind the stdout proxy."""
+    stdout = sys.stdout
+    if isinstance(stdout, _StdoutProxy):
+        return stdout._target
+    return stdout
+
+
+@contextmanager
+def _animated(printer: Any) -> Iterator[None]:
+    """
+    Route stdout writes of the current context through a printer.
+
+    :param printer: printer activated in the current context
+    """
+    global _PROXY_USERS
+    with _PROXY_LOCK:
+        if not isinstance(sys.stdout, _StdoutProxy):
+            sys.stdout = _StdoutProxy(sys.stdout)
+        _PROXY_USERS += 1
+    token = _ACTIVE_PRINTER.set(printer)
+    try:
+        yield
+    finally:
+        _ACTIVE_PRINTER.reset(token)
+        with _PROXY_LOCK:
+            _PROXY_USERS -= 1
+            if _PROXY_USERS == 0 and isinstance(sys.stdout, _StdoutProxy):
+                sys.stdout = sys.stdout._target
+
+
+class _QueuedWriter:
+    """Non-blocking writer that hands written text over to an asynchronous printer task."""
+
+    def __init__(self, printer: _AsyncTypioPrinter) -> None:
+        """
+        Initialize the writer.
+
+        :param printer: asynchronous printer
+        """
+        import asyncio
+        self._printer = printer
+        self._queue = asyncio.Queue()
+
+    def write(self, text: str) -> None:
+        """
+        Queue text for the printer.
+
+        :param text: text to be written
+        """
+        self._queue.put_nowait(text)
+
+    def flush(self) -> None:
+        """Ignore flush requests; the printer flushes as it writes."""
+        pass
+
+    def close(self) -> None:
+        """Signal the end of the written text."""
+        self._queue.put_nowait(None)
+
+    async def drain(self) -> None:
+        """Write queued text until the writer is closed."""
+        while True:
+            text = await self._queue.get()
+            if text is None:
+                break
+            await self._printer.write(text)
+        self._printer.flush()
+
+
 def typestyle(
         *,
         delay: float = 0.04,
         jitter: float = 0,
-        mode: Union[TypeMode, Callable] = TypeMode.CHAR) -> Callable:
+        distribution: JitterDistribution = JitterDistribution.UNIFORM,
+        mode: Union[TypeMode, Callable] = TypeMode.CHAR,
+        max_fps: Optional[float] = None,
+        control: Optional[TypioControl] = None,
+        clock: Optional[Callable[[], int]] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+        seed: Optional[Union[int, float, str, bytes]] = None,
+        rng: Optional[random.Random] = None,
+        stats: Optional[TypioStats] = None,
+        animate: Union[bool, str] = "auto") -> Callable:
     """
     Apply typing effects to all print() calls inside the decorated function.
 
     :param delay: base delay (in seconds) between emitted units
     :param jitter: random jitter added/subtracted from delay
+    :param distribution: jitter distribution
     :param mode: typing mode controlling emission granularity
+    :param max_fps: maximum number of rendered frames per second
+    :param control: runtime speed control
+    :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+    :param sleeper: function blocking for a given number of seconds (a coroutine function for async functions)
+    :param seed: seed of the jitter random number generator
+    :param rng: random number generator of the jitter
+    :param stats: statistics collector
+    :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
     """
-    _validate("", delay, jitter, mode, "", sys.stdout)
+    _validate(
+        "", delay, jitter, mode, "", sys.stdout, max_fps,
+        control=control, clock=clock, sleeper=sleeper, seed=seed, rng=rng, stats=stats, animate=animate,
+        distribution=distribution)
+
+    def make_printer(cls: type) -> _TypioPrinterBase:
+        return cls(
+            delay=delay,
+            jitter=jitter,
+            mode=mode,
+            out=_real_stdout(),
+            max_fps=max_fps,
+            control=control,
+            clock=clock,
+            sleeper=sleeper,
+            rng=rng or random.Random(seed),
+            stats=stats,
+            animate=animate,
+            distribution=distribution,
+        )
 
     def decorator(func: Callable) -> Callable:
+        import inspect
+        if inspect.iscoroutinefunction(func):
+            import asyncio
+            _validate_async_sleeper(sleeper)
+
+            @wraps(func)
+            async def async_wrapper(*args: list, **kwargs: dict) -> Any:
+                writer = _QueuedWriter(make_printer(_AsyncTypioPrinter))
+                task = asyncio.ensure_future(writer.drain())
+                try:
+                    with _animated(writer):
+                        return await func(*args, **kwargs)
+                finally:
+                    writer.close()
+                    await task
+
+            return async_wrapper
+
+        if inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def generator_wrapper(*args: list, **kwargs: dict) -> Any:
+                printer = make_printer(_TypioPrinter)
+                gen = func(*args, **kwargs)
+                method, arg = gen.send, None
+                while True:
+                    with _animated(printer):
+                        try:
+                            item = method(arg)
+                        except StopIteration as e:
+                            return e.value
+                    try:
+                        arg = yield item
+                        method = gen.send
+                    except GeneratorExit:
+                        gen.close()
+                        raise
+                    except BaseException as e:
+                        method, arg = gen.throw, e
+
+            return generator_wrapper
+
         @wraps(func)
         def wrapper(*args: list, **kwargs: dict) -> Any:
-            old_stdout = sys.stdout
-            try:
-                sys.stdout = _TypioPrinter(
-                    delay=delay,
-                    jitter=jitter,
-                    mode=mode,
-                    out=old_stdout,
-                )
+            with _animated(make_printer(_TypioPrinter)):
                 return func(*args, **kwargs)
-            finally:
-                sys.stdout = old_stdout
 
         return wrapper
 
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""typio logging handler."""
+import sys
+import random
+import logging
+import threading
+from collections import deque
+from io import TextIOBase
+from typing import Any, Callable, Optional, Union
+from .params import TypeMode, JitterDistribution, OverflowPolicy, LOG_QUEUE_SIZE
+from .params import INVALID_QUEUE_SIZE_ERROR, INVALID_OVERFLOW_ERROR
+from .errors import TypioError
+from .functions import TypioControl, TypioStats, _TypioPrinter, _output, _validate
+
+
+class TypioLogHandler(logging.Handler):
+    """Logging handler that queues formatted records and types them on a background worker thread."""
+
+    terminator = "\n"
+
+    def __init__(
+            self,
+            stream: Optional[TextIOBase] = None,
+            *,
+            level: int = logging.NOTSET,
+            delay: float = 0.04,
+            jitter: float = 0,
+            distribution: JitterDistribution = JitterDistribution.UNIFORM,
+            mode: Union[TypeMode, Callable, str] = TypeMode.CHAR,
+            max_fps: Optional[float] = None,
+            control: Optional[TypioControl] = None,
+            clock: Optional[Callable[[], int]] = None,
+            sleeper: Optional[Callable[[float], Any]] = None,
+            seed: Optional[Union[int, float, str, bytes]] = None,
+            rng: Optional[random.Random] = None,
+            stats: Optional[TypioStats] = None,
+            animate: Union[bool, str] = "auto",
+            queue_size: int = LOG_QUEUE_SIZE,
+            overflow: OverflowPolicy = OverflowPolicy.COALESCE) -> None:
+        """
+        Initialize the handler and start its worker.
+
+        :param stream: output stream (defaults to sys.stderr)
+        :param level: handler level
+        :param delay: base delay (in seconds) between emitted units
+        :param jitter: random jitter added/subtracted from delay
+        :param distribution: jitter distribution
+        :param mode: typing mode controlling emission granularity
+        :param max_fps: maximum number of rendered frames per second
+        :param control: runtime speed control
+        :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+        :param sleeper: function blocking for a given number of seconds
+        :param seed: seed of the jitter random number generator
+        :param rng: random number generator of the jitter
+        :param stats: statistics collector
+        :param animate: typing effects policy: True, False or "auto" to animate only interactive streams
+        :param queue_size: maximum number of queued records before the overflow policy applies
+        :param overflow: what to do with records beyond the queue size: drop, coalesce or print instantly
+        """
+        _validate(
+            "", delay, jitter, mode, "", stream, max_fps,
+            control=control, clock=clock, sleeper=sleeper, seed=seed, rng=rng, stats=stats, animate=animate,
+            distribution=distribution)
+        if not isinstance(queue_size, int) or isinstance(queue_size, bool) or queue_size <= 0:
+            raise TypioError(INVALID_QUEUE_SIZE_ERROR)
+        if not isinstance(overflow, OverflowPolicy):
+            raise TypioError(INVALID_OVERFLOW_ERROR)
+        super().__init__(level)
+        self._queue = deque()
+        self._limit = queue_size
+        self._overflow = overflow
+        self._ready = threading.Condition(threading.Lock())
+        self._rush = threading.Event()
+        self._busy = False
+        self._closed = False
+        self.dropped = 0
+        self.coalesced = 0
+        if sleeper is None and clock is None and control is None:
+            sleeper = self._rush.wait
+        self._printer = _TypioPrinter(
+            delay=delay,
+            jitter=jitter,
+            mode=mode,
+            out=_output(sys.stderr if stream is None else stream),
+            max_fps=max_fps,
+            control=control,
+            clock=clock,
+            sleeper=sleeper,
+            rng=rng or random.Random(seed),
+            stats=stats,
+            animate=animate,
+            distribution=distribution,
+        )
+        self._thread = threading.Thread(target=self._run, name="typio-log", daemon=True)
+        self._thread.start()
+
+    @property
+    def backlog(self) -> int:
+        """Number of queued records."""
+        return len(self._queue)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Format a record and queue it for the worker without waiting for the animation.
+
+        :param record: log record
+        """
+        try:
+            text = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        with self._ready:
+            if self._closed:
+                return
+            if len(self._queue) >= self._limit:
+                if self._overflow is OverflowPolicy.DROP:
+                    self.dropped += 1
+                    return
+                if self._overflow is OverflowPolicy.COALESCE:
+                    self._queue[-1][1].append(text)
+                    self.coalesced += 1
+                    return
+                self._hurry()
+            self._queue.append((record, [text]))
+            self._ready.notify()
+
+    def flush(self) -> None:
+        """Write all queued records immediately and wait until they are written."""
+        with self._ready:
+            if self._queue or self._busy:
+                self._hurry()
+            while (self._queue or self._busy) and self._thread.is_alive():
+                self._ready.wait()
+
+    def close(self) -> None:
+        """Write all queued records immediately, stop the worker and close the handler."""
+        with self._ready:
+            self._closed = True
+            self._hurry()
+            self._ready.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        super().close()
+
+    def _hurry(self) -> None:
+        """Make the worker drop the pacing until the queue is empty; called with the queue lock held."""
+        self._rush.set()
+        self._printer._behind = True
+
+    def _run(self) -> None:
+        """Type queued records one by one until the handler is closed."""
+        while True:
+            with self._ready:
+                self._busy = False
+                if not self._queue:
+                    self._rush.clear()
+                    self._printer._behind = False
+                    self._ready.notify_all()
+                while not self._queue and not self._closed:
+                    self._ready.wait()
+                if not self._queue:
+                    return
+                record, parts = self._queue.popleft()
+                self._busy = True
+                self._printer._behind = self._rush.is_set()
+            try:
+                self._printer.write("".join(parts))
+                self._printer.flush()
+            except Exception:
+                self.handleError(record)
@@ -16,10 +16,85 @@ class TypeMode(Enum):
     ADAPTIVE = "adaptive"
 
 
+class JitterDistribution(Enum):
+    """Jitter distribution enum."""
+
+    UNIFORM = "uniform"
+    GAUSSIAN = "gaussian"
+    LOGNORMAL = "lognormal"
+    BIGRAM = "bigram"
+
+
+class OverflowPolicy(Enum):
+    """Log queue overflow policy enum."""
+
+    DROP = "drop"
+    COALESCE = "coalesce"
+    INSTANT = "instant"
+
+
+class BackpressurePolicy(Enum):
+    """Backpressure policy enum."""
+
+    BLOCK = "block"
+    DROP = "drop"
+    MERGE = "merge"
+
+
+SPIN_THRESHOLD_NS = 500_000
+ENGINE_LATENESS_HISTORY = 1024
+PLAN_CACHE_SIZE = 256
+PLAN_CACHE_BYTES = 16777216
+PLAN_CACHE_TEXT_LIMIT = 65536
+SPEED_ENV = "TYPIO_SPEED"
+FILE_CHUNK_SIZE = 65536
+JITTER_BLOCK_SIZE = 256
+JITTER_SIGMA_LIMIT = 3
+MODE_ENTRY_POINT_GROUP = "typio.modes"
+SERVER_BUFFER_LIMIT = 1048576
+SERVER_READ_SIZE = 4096
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+SINK_BUFFER_LIMIT = 65536
+SINK_POLL_INTERVAL = 0.001
+CAST_VERSION = 2
+LOG_QUEUE_SIZE = 1024
+LATENESS_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1)
+
 INVALID_TEXT_ERROR = "`text` must be str or bytes."
 INVALID_BYTE_ERROR = "bytes text must be UTF-8 decodable."
 INVALID_DELAY_ERROR = "`delay` must be a non-negative number."
 INVALID_JITTER_ERROR = "`jitter` must be a non-negative number."
 INVALID_MODE_ERROR = "`mode` must be a TypeMode enum value or a callable custom mode."
+INVALID_MAX_FPS_ERROR = "`max_fps` must be a positive number or None."
+INVALID_ENGINE_ERROR = "`engine` must be a TypioEngine or None."
+ENGINE_CLOSED_ERROR = "engine is closed."
+INVALID_PLAN_MODE_ERROR = "`mode` must be a TypeMode enum value or a declarative custom mode."
+INVALID_STREAM_ERROR = "`chunks` must be an iterable of str or bytes."
+INVALID_SPEED_ERROR = "`speed` must be a non-negative number."
+INVALID_CONTROL_ERROR = "`control` must be a TypioControl or None."
+INVALID_CLOCK_ERROR = "`clock` must be callable."
+INVALID_SLEEPER_ERROR = "`sleeper` must be callable."
+INVALID_ASYNC_SLEEPER_ERROR = "`sleeper` of asynchronous functions must be a coroutine function."
+INVALID_SEED_ERROR = "`seed` must be None, int, float, str, bytes or bytearray."
+INVALID_RNG_ERROR = "`rng` must be a random.Random instance."
+INVALID_STATS_ERROR = "`stats` must be a TypioStats or None."
+INVALID_SOURCE_ERROR = "`source` must be a file path or a readable file object."
+INVALID_ANIMATE_ERROR = "`animate` must be True, False or \"auto\"."
+INVALID_HEIGHT_ERROR = "`height` must be a positive integer."
+INVALID_WIDTH_ERROR = "`width` must be a positive integer or None."
+INVALID_DISTRIBUTION_ERROR = "`distribution` must be a JitterDistribution enum value."
+INVALID_MODE_NAME_ERROR = "`name` must be a non-empty str."
+INVALID_BUFFER_LIMIT_ERROR = "`buffer_limit` must be a positive integer."
+INVALID_POLICY_ERROR = "`policy` must be a BackpressurePolicy enum value."
+INVALID_CAST_ERROR = "`source` must be an asciicast v2 recording."
+INVALID_JOB_ERROR = "`jobs` must be an iterable of TypioJob, tuples or str."
+INVALID_JOB_DESTINATION_ERROR = "job `destination` must be a file path or None."
+INVALID_JOB_MODE_ERROR = "custom modes of `jobs` must be picklable, e.g. module-level functions."
+INVALID_WORKERS_ERROR = "`workers` must be a positive integer or None."
+INVALID_CHUNKSIZE_ERROR = "`chunksize` must be a positive integer."
+INVALID_OVERFLOW_ERROR = "`overflow` must be an OverflowPolicy enum value."
+INVALID_QUEUE_SIZE_ERROR = "`queue_size` must be a positive integer."
 INVALID_END_ERROR = "`end` must be a str."
 INVALID_FILE_ERROR = "`file` must be a file-like object."
+INVALID_NUMPY_ERROR = "`enabled` must be a bool."
+MISSING_NUMPY_ERROR = "NumPy must be installed to vectorize jitter sampling."
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""typio server."""
+import asyncio
+import base64
+import hashlib
+import random
+import struct
+from typing import Any, AsyncIterable, Callable, Iterable, Optional, Tuple, Union
+from .params import TypeMode, JitterDistribution
+from .params import SERVER_BUFFER_LIMIT, SERVER_READ_SIZE, WEBSOCKET_GUID
+from .params import INVALID_BUFFER_LIMIT_ERROR, INVALID_STREAM_ERROR
+from .errors import TypioError
+from .functions import TypioControl, TypioStats, _AsyncTypioPrinter, _validate, _validate_async_sleeper
+
+
+class _SSEFramer:
+    """Server-Sent Events encoder that normalizes CRLF and bare CR line breaks, even across fragments."""
+
+    def __init__(self) -> None:
+        """Initialize the encoder."""
+        self._carriage_return = False
+
+    def __call__(self, text: str) -> bytes:
+        """
+        Encode a fragment as a Server-Sent Events message.
+
+        :param text: text fragment
+        """
+        if self._carriage_return and text.startswith("\n"):
+            text = text[1:]
+        if not text:
+            return b""
+        self._carriage_return = text.endswith("\r")
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        return "".join("data: {0}\n".format(line) for line in lines).encode("utf-8") + b"\n"
+
+
+def _websocket_frame(text: str) -> bytes:
+    """
+    Encode a fragment as an unmasked WebSocket text frame.
+
+    :param text: text fragment
+    """
+    data = text.encode("utf-8")
+    if len(data) < 126:
+        header = struct.pack("!BB", 0x81, len(data))
+    elif len(data) < 65536:
+        header = struct.pack("!BBH", 0x81, 126, len(data))
+    else:
+        header = struct.pack("!BBQ", 0x81, 127, len(data))
+    return header + data
+
+
+def _websocket_accept(key: str) -> str:
+    """
+    Compute the Sec-WebSocket-Accept header of a WebSocket handshake.
+
+    :param key: Sec-WebSocket-Key header of the client
+    """
+    # RFC 6455 requires SHA-1 here; it is not used for security
+    digest = hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()  # nosec B324
+    return base64.b64encode(digest).decode("ascii")
+
+
+class _ServerClient:
+    """Subscriber of a typing server that coalesces the fragments it has not sent yet."""
+
+    def __init__(
+            self,
+            writer: asyncio.StreamWriter,
+            frame: Callable[[str], bytes],
+            limit: int,
+            tail: bytes = b"") -> None:
+        """
+        Initialize the client.
+
+        :param writer: client stream writer
+        :param frame: function encoding a fragment
+        :param limit: maximum number of pending characters before the client is dropped
+        :param tail: bytes sent before closing the connection
+        """
+        self._writer = writer
+        self._frame = frame
+        self._limit = limit
+        self._tail = tail
+        self._pending = []
+        self._size = 0
+        self._ready = asyncio.Event()
+        self._closing = False
+        self.dropped = False
+
+    def push(self, text: str) -> None:
+        """
+        Queue a fragment without waiting for the client.
+
+        :param text: text fragment
+        """
+        if self._closing:
+            return
+        self._pending.append(text)
+        self._size += len(text)
+        if self._size > self._limit:
+            self.dropped = self._closing = True
+            self._pending.clear()
+            self._writer.transport.abort()
+        self._ready.set()
+
+    def close(self) -> None:
+        """Send the pending fragments and close the connection."""
+        self._closing = True
+        self._ready.set()
+
+    async def run(self) -> None:
+        """Send pending fragments as one write whenever the connection has drained."""
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                if self._pending:
+                    data = "".join(self._pending)
+                    self._pending.clear()
+                    self._size = 0
+                    self._writer.write(self._frame(data))
+                    await self._writer.drain()
+                if self._closing:
+                    if not self.dropped:
+                        self._writer.write(self._tail)
+                        await self._writer.drain()
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._writer.close()
+
+
+class _Broadcast:
+    """Output stream that hands every written fragment to all clients of a typing server."""
+
+    def __init__(self, clients: set) -> None:
+        """
+        Initialize the broadcast stream.
+
+        :param clients: subscribed clients
+        """
+        self._clients = clients
+
+    def write(self, text: str) -> int:
+        """
+        Queue text on every client.
+
+        :param text: text fragment
+        """
+        for client in self._clients:
+            client.push(text)
+        return len(text)
+
+    def flush(self) -> None:
+        """Do nothing; clients flush on their own."""
+        pass
+
+
+class TypioServer:
+    """Server that paces text once and fans every emitted fragment out to TCP, SSE and WebSocket clients."""
+
+    def __init__(
+            self,
+            *,
+            delay: float = 0.04,
+            jitter: float = 0,
+            distribution: JitterDistribution = JitterDistribution.UNIFORM,
+            mode: Union[TypeMode, Callable, str] = TypeMode.CHAR,
+            max_fps: Optional[float] = None,
+            control: Optional[TypioControl] = None,
+            clock: Optional[Callable[[], int]] = None,
+            sleeper: Optional[Callable[[float], Any]] = None,
+            seed: Optional[Union[int, float, str, bytes]] = None,
+            rng: Optional[random.Random] = None,
+            stats: Optional[TypioStats] = None,
+            buffer_limit: int = SERVER_BUFFER_LIMIT) -> None:
+        """
+        Initialize the server.
+
+        :param delay: base delay (in seconds) between emitted units
+        :param jitter: random jitter added/subtracted from delay
+        :param distribution: jitter distribution
+        :param mode: typing mode controlling emission granularity
+        :param max_fps: maximum number of rendered frames per second
+        :param control: runtime speed control
+        :param clock: function returning the current time (in nanoseconds), e.g. a VirtualClock
+        :param sleeper: coroutine function suspending for a given number of seconds
+        :param seed: seed of the jitter random number generator
+        :param rng: random number generator of the jitter
+        :param stats: statistics collector
+        :param buffer_limit: maximum number of unsent characters of a client before it is dropped
+        """
+        _validate(
+            "", delay, jitter, mode, "", None, max_fps,
+            control=control, clock=clock, sleeper=sleeper, seed=seed, rng=rng, stats=stats,
+            distribution=distribution)
+        _validate_async_sleeper(sleeper)
+        if not isinstance(buffer_limit, int) or isinstance(buffer_limit, bool) or buffer_limit <= 0:
+            raise TypioError(INVALID_BUFFER_LIMIT_ERROR)
+        self._clients = set()
+        self._tasks = set()
+        self._servers = []
+        self._changed = None
+        self._buffer_limit = buffer_limit
+        self.dropped = 0
+        self._printer = _AsyncTypioPrinter(
+            delay=delay,
+            jitter=jitter,
+            mode=mode,
+            out=_Broadcast(self._clients),
+            max_fps=max_fps,
+            control=control,
+            clock=clock,
+            sleeper=sleeper,
+            rng=rng or random.Random(seed),
+            stats=stats,
+            animate=True,
+            distribution=distribution,
+        )
+
+    @property
+    def clients(self) -> int:
+        """Number of connected clients."""
+        return len(self._clients)
+
+    async def listen_tcp(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """
+        Accept raw TCP clients and return the bound address.
+
+        :param host: host to bind
+        :param port: port to bind (0 picks a free port)
+        """
+        server = await asyncio.start_server(self._serve_tcp, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[:2]
+
+    async def listen_http(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """
+        Accept Server-Sent Events and WebSocket clients and return the bound address.
+
+        :param host: host to bind
+        :param port: port to bind (0 picks a free port)
+        """
+        server = await asyncio.start_server(self._serve_http, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[:2]
+
+    async def wait_for_clients(self, count: int) -> None:
+        """
+        Wait until a number of clients are connected.
+
+        :param count: number of clients
+        """
+        changed = self._condition()
+        async with changed:
+            await changed.wait_for(lambda: len(self._clients) >= count)
+
+    async def broadcast(self, text: Union[str, bytes], end: str = "") -> None:
+        """
+        Type text once and send every emitted fragment to all clients.
+
+        :param text: text to be typed
+        :param end: end character(s)
+        """
+        text = _validate(text, 0, 0, TypeMode.CHAR, end, None)
+        await self._printer.write(text)
+
+    async def broadcast_stream(self, chunks: Union[Iterable, AsyncIterable], end: str = "") -> None:
+        """
+        Type chunks once as they arrive and send every emitted fragment to all clients.
+
+        :param chunks: iterable or async iterable of str or bytes chunks
+        :param end: end character(s)
+        """
+        _validate("", 0, 0, TypeMode.CHAR, end, None)
+        if not hasattr(chunks, "__iter__") and not hasattr(chunks, "__aiter__"):
+            raise TypioError(INVALID_STREAM_ERROR)
+        await self._printer.write_stream(chunks, end)
+
+    async def close(self) -> None:
+        """Stop accepting clients, send them their pending fragments and disconnect them."""
+        servers, self._servers = self._servers, []
+        for server in servers:
+            server.close()
+        for client in list(self._clients):
+            client.close()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for server in servers:
+            await server.wait_closed()
+
+    async def _serve_tcp(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve a raw TCP client.
+
+        :param reader: client stream reader
+        :param writer: client stream writer
+        """
+        client = _ServerClient(writer, lambda text: text.encode("utf-8"), self._buffer_limit)
+        await self._subscribe(client, self._watch(reader, client))
+
+    async def _serve_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve an HTTP client, upgrading it to a WebSocket on request and to Server-Sent Events otherwise.
+
+        :param reader: client stream reader
+        :param writer: client stream writer
+        """
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if not lines[0].startswith("GET "):
+            writer.write(b"HTTP/1.1 405 Method Not Allowed\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            writer.close()
+            return
+        if headers.get("upgrade", "").lower() == "websocket" and "sec-websocket-key" in headers:
+            writer.write((
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                "Sec-WebSocket-Accept: {0}\r\n\r\n").format(_websocket_accept(headers["sec-websocket-key"])).encode())
+            client = _ServerClient(writer, _websocket_frame, self._buffer_limit, b"\x88\x00")
+            await self._subscribe(client, self._watch(reader, client, True))
+            return
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n")
+        client = _ServerClient(writer, _SSEFramer(), self._buffer_limit)
+        await self._subscribe(client, self._watch(reader, client))
+
+    async def _subscribe(self, client: _ServerClient, watcher: Any) -> None:
+        """
+        Add a client, run it until it disconnects and remove it.
+
+        :param client: server client
+        :param watcher: coroutine closing the client when its connection ends
+        """
+        task = asyncio.ensure_future(client.run())
+        watch = asyncio.ensure_future(watcher)
+        self._tasks.add(task)
+        self._clients.add(client)
+        await self._notify()
+        try:
+            await task
+        finally:
+            watch.cancel()
+            self._clients.discard(client)
+            self._tasks.discard(task)
+            if client.dropped:
+                self.dropped += 1
+            await self._notify()
+
+    async def _watch(self, reader: asyncio.StreamReader, client: _ServerClient, websocket: bool = False) -> None:
+        """
+        Close a client once it disconnects or sends a WebSocket close frame.
+
+        :param reader: client stream reader
+        :param client: server client
+        :param websocket: WebSocket client flag
+        """
+        try:
+            while True:
+                data = await reader.read(SERVER_READ_SIZE)
+                if not data or websocket and data[0] & 0x0F == 0x8:
+                    break
+        except (ConnectionError, OSError):
+            pass
+        client.close()
+
+    def _condition(self) -> asyncio.Condition:
+        """Return the condition notified when clients connect or disconnect, creating it in the running loop."""
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    async def _notify(self) -> None:
+        """Wake up the tasks waiting for clients."""
+        changed = self._condition()
+        async with changed:
+            changed.notify_all()
+
+    async def __aenter__(self) -> "TypioServer":
+        """Enter the runtime context."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Close the server at the end of the runtime context."""
+        await self.close()